@@ -0,0 +1,93 @@
+"""
+    stress benchmark of lexer construction, run with
+        python -m iparser.benchmark --keywords 10000 --literal-length 100000 --chain-length 50000
+"""
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.lexer import CompiledLexer, LexerKeywords
+from iparser.lexical.memory import freeze_report
+import argparse
+import random
+import string
+import time
+import tracemalloc
+
+
+def keyword_grammar(keyword_num: int, seed: int=0, table: bool=False) -> ReTokenDefinitions:
+    """
+        keyword_num random lower case keywords plus the identifier rule they collide with,
+        with table the keywords are reclassified from the identifier instead of being
+        literal tokens of the automaton
+    """
+    rand = random.Random(seed)
+    keywords = set()
+    while len(keywords) < keyword_num:
+        keywords.add(''.join(rand.choice(string.ascii_lowercase) for _ in range(rand.randint(3, 12))))
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    letter = RE.range('a', 'z') | RE.char('_')
+    identifier = letter + (letter | RE.range('0', '9')).any_times()
+    if table:
+        definitions.define("ID", identifier, keywords={f"KW_{keyword.upper()}": keyword for keyword in sorted(keywords)})
+    else:
+        for keyword in sorted(keywords):
+            definitions.define(f"KW_{keyword.upper()}", RE.literal(keyword))
+        definitions.define("ID", identifier)
+    definitions.define("BLANK", RE.chars(' ', '\t', '\n').at_least_once())
+    return definitions
+
+
+def literal_grammar(length: int, seed: int=0) -> ReTokenDefinitions:
+    rand = random.Random(seed)
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("LONG", RE.literal(''.join(rand.choice(string.ascii_letters) for _ in range(length))))
+    return definitions
+
+
+def chain_grammar(length: int, seed: int=0) -> ReTokenDefinitions:
+    """
+        a + b + c + ... builds a left deep expression tree and a long epsilon chain
+    """
+    rand = random.Random(seed)
+    expression = RE.char(rand.choice(string.ascii_letters))
+    for _ in range(1, length):
+        expression = expression + RE.char(rand.choice(string.ascii_letters))
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("CHAIN", expression)
+    return definitions
+
+
+def measure(name: str, definitions: ReTokenDefinitions, minimize: bool=True):
+    tracemalloc.start()
+    start = time.perf_counter()
+    nfa_model = FlatNFABuilder.from_definitions(definitions)
+    nfa_time = time.perf_counter() - start
+    dfa_model = DFAModel(nfa_model, minimize=minimize)
+    dfa_model.init()
+    total_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report = dfa_model.minimize_report or (dfa_model.state_num, dfa_model.state_num)
+    lexer = CompiledLexer(dfa_model.transition_table, dfa_model.accept_table,
+                          [definition.name for definition in definitions.definitions], dfa_model.charset_manager,
+                          keywords=LexerKeywords.from_definitions(definitions))
+    _, (before, after) = freeze_report(lexer, dfa_model, nfa_model)
+    print(f"{name:>10}: nfa states {nfa_model.state_num:>8}  dfa states {report[0]:>8} -> {report[1]:<8}"
+          f" nfa {nfa_time:7.2f}s  total {total_time:7.2f}s  peak memory {peak / 2 ** 20:8.1f} MiB"
+          f"  retained {before / 2 ** 20:8.1f} MiB -> frozen {after / 2 ** 20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keywords", type=int, default=5000)
+    parser.add_argument("--literal-length", type=int, default=100000)
+    parser.add_argument("--chain-length", type=int, default=20000)
+    parser.add_argument("--no-minimize", action="store_true")
+    args = parser.parse_args()
+    minimize = not args.no_minimize
+    measure("keywords", keyword_grammar(args.keywords), minimize)
+    measure("kw table", keyword_grammar(args.keywords, table=True), minimize)
+    measure("literal", literal_grammar(args.literal_length), minimize)
+    measure("chain", chain_grammar(args.chain_length), minimize)
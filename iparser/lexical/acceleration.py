@@ -0,0 +1,178 @@
+"""
+    run skipping: a dfa state that moves to itself on a set of chars consumes every
+    run of those chars without changing, so the scanners jump over the whole run
+    with one precompiled re match instead of stepping the dfa char by char. whitespace,
+    comment and string body states are the typical self looping states.
+    literal jumps: a rejecting state with a single exit on a single char can only go
+    on with that char, a chain of them spells a literal the scanners compare with one
+    str.startswith instead of stepping through it
+"""
+from typing import *
+import re
+from iparser.lexical.charset import CharSet, CharSetManager, EquivalenceClassCharSetManager
+from iparser.lexical.transition_table import TransitionTable, ArrayTransitionTable
+
+
+def symbol_char_sets(charset_manager: CharSetManager, symbol_num: int) -> List[CharSet]:
+    """
+        the chars of every symbol (column) of a transition table, without a charset
+        manager the symbols are the chars (or bytes) themselves
+    """
+    if charset_manager is None:
+        return [CharSet.of_char(symbol) for symbol in range(0, symbol_num)]
+    if isinstance(charset_manager, EquivalenceClassCharSetManager):
+        return charset_manager.class_char_sets()
+    chars = [[] for _ in range(0, symbol_num)]
+    for char in charset_manager.all_chars():
+        chars[charset_manager.char_to_index(char)].append(char)
+    return [CharSet.of_chars(symbol_chars) for symbol_chars in chars]
+
+
+def _live_rows(transition_table: TransitionTable) -> Iterable[Tuple[int, List[int]]]:
+    """
+        (state, row) of every state but the dead state 0
+    """
+    symbol_num = transition_table.symbol_num
+    # the rows of a flat table are sliced in place instead of looked up symbol by symbol
+    buffer = transition_table.buffer if isinstance(transition_table, ArrayTransitionTable) else None
+    for state in range(1, transition_table.state_num):
+        if buffer is not None:
+            yield state, buffer[state * symbol_num:(state + 1) * symbol_num].tolist()
+        else:
+            yield state, [transition_table.next_state(state, symbol) for symbol in range(0, symbol_num)]
+
+
+def self_loop_char_sets(transition_table: TransitionTable, charset_manager: CharSetManager) -> List[CharSet]:
+    """
+        per state the chars it moves to itself on, the dead state 0 never loops
+    """
+    symbol_num = transition_table.symbol_num
+    symbol_sets = symbol_char_sets(charset_manager, symbol_num)
+    first_symbol = 1 if charset_manager is not None else 0
+    loops = [CharSet()]
+    for state, row in _live_rows(transition_table):
+        loop = CharSet()
+        if state in row:
+            for symbol in range(first_symbol, symbol_num):
+                if row[symbol] == state:
+                    loop = loop | symbol_sets[symbol]
+        loops.append(loop)
+    return loops
+
+
+def forced_exits(transition_table: TransitionTable, charset_manager: CharSetManager) -> List[Optional[Tuple[int, int]]]:
+    """
+        per state (char, target) when the only way out of the state is a move on that
+        single char, or None
+    """
+    symbol_num = transition_table.symbol_num
+    symbol_sets = symbol_char_sets(charset_manager, symbol_num)
+    first_symbol = 1 if charset_manager is not None else 0
+    exits = [None]
+    for state, row in _live_rows(transition_table):
+        live = [symbol for symbol in range(0, symbol_num) if row[symbol]]
+        forced = None
+        if len(live) == 1 and live[0] >= first_symbol:
+            chars = symbol_sets[live[0]]
+            if len(chars.intervals) == 1 and chars.intervals[0][0] == chars.intervals[0][1]:
+                forced = (chars.intervals[0][0], row[live[0]])
+        exits.append(forced)
+    return exits
+
+
+def literal_jumps(transition_table: TransitionTable, accept_table: Sequence[int], charset_manager: CharSetManager,
+                  min_length: int=2) -> List[Optional[Tuple[str, int]]]:
+    """
+        per state (literal, target) when every way on from the rejecting state spells
+        literal and ends in target, or None. the states passed through are rejecting,
+        so a scan that finds the literal misses no accepting position, a scan that does
+        not steps the dfa as usual
+    """
+    exits = forced_exits(transition_table, charset_manager)
+    jumps = []
+    for state in range(0, transition_table.state_num):
+        chars = []
+        current = state
+        visited = {state}
+        while exits[current] is not None and accept_table[current] == -1:
+            char, target = exits[current]
+            chars.append(chr(char))
+            current = target
+            if current in visited:
+                break
+            visited.add(current)
+        jumps.append((''.join(chars), current) if len(chars) >= min_length else None)
+    return jumps
+
+
+def longest_matcher(next_state: Callable[[int, int], int], char_to_index: Callable[[int], int],
+                    accept_table: Sequence[int], skippers: Optional[List[Optional[Callable]]]=None,
+                    jumps: Optional[List[Optional[Tuple[str, int]]]]=None) -> Callable:
+    """
+        match(text, position, length, state) runs the dfa from state over text[position:length]
+        and returns (token index, end, stop) of the longest match, token index is -1 without
+        one and stop is the offset of the char the dfa died on. the run skippers and the
+        literal jumps only change how fast the dfa gets there, never the result
+    """
+    if jumps is not None and not any(jumps):
+        jumps = None
+    def match(text: str, position: int, length: int, state: int) -> Tuple[int, int, int]:
+        token_index, end = -1, position
+        while position < length:
+            target = next_state(state, char_to_index(ord(text[position])))
+            if not target:
+                break
+            position += 1
+            if target == state:
+                if skippers is not None and skippers[state] is not None:
+                    # the state loops, skip the rest of the run in one go
+                    position = skippers[state](text, position, length).end()
+            elif jumps is not None and jumps[target] is not None:
+                literal, literal_target = jumps[target]
+                if text.startswith(literal, position, length):
+                    position += len(literal)
+                    target = literal_target
+            state = target
+            if accept_table[state] != -1:
+                token_index, end = accept_table[state], position
+        return token_index, end, position
+    return match
+
+
+def _escape_char(char: int) -> str:
+    return f"\\U{char:08x}"
+
+
+def char_class_pattern(char_set: CharSet) -> str:
+    """
+        re character class of the char set
+    """
+    items = []
+    for start, end in char_set.intervals:
+        items.append(_escape_char(start) if start == end else f"{_escape_char(start)}-{_escape_char(end)}")
+    return '[' + ''.join(items) + ']'
+
+
+def byte_class_pattern(char_set: CharSet) -> bytes:
+    items = []
+    for start, end in char_set.intervals:
+        items.append(b'\\x%02x' % start if start == end else b'\\x%02x-\\x%02x' % (start, end))
+    return b'[' + b''.join(items) + b']'
+
+
+def run_skippers(transition_table: TransitionTable, charset_manager: CharSetManager,
+                 byte_level: bool=False) -> List[Optional[Callable]]:
+    """
+        per state the match method of a precompiled pattern of the longest run of chars
+        the state loops on, or None. the scanners only call it after the state has
+        looped once, so runs of one char never pay for the re call
+    """
+    skippers = []
+    for loop in self_loop_char_sets(transition_table, charset_manager):
+        if not loop:
+            skippers.append(None)
+        elif byte_level:
+            skippers.append(re.compile(byte_class_pattern(loop) + b'*').match)
+        else:
+            skippers.append(re.compile(char_class_pattern(loop) + '*').match)
+    return skippers
@@ -1,15 +1,153 @@
 from abc import ABC, abstractmethod
 from typing import *
+from array import array
+from bisect import bisect_left, bisect_right
+
+MAX_CHAR = 0x10FFFF
+
+
+class CharSet:
+    """
+        immutable set of code points stored as sorted, disjoint and non adjacent
+        closed intervals [start, end]
+    """
+    __slots__ = ('_intervals', '_hash')
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]]=()) -> None:
+        merged = []
+        for start, end in sorted(intervals):
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self._intervals: Tuple[Tuple[int, int]] = tuple(merged)
+        self._hash = None
+
+    @staticmethod
+    def of_char(char: int) -> 'CharSet':
+        return CharSet(((char, char),))
+
+    @staticmethod
+    def of_range(start: int, end: int) -> 'CharSet':
+        return CharSet(((start, end),))
+
+    @staticmethod
+    def of_chars(chars: Iterable[int]) -> 'CharSet':
+        return CharSet((char, char) for char in chars)
+
+    @staticmethod
+    def from_predicate(predicate: Callable[[str], bool], max_char: int=MAX_CHAR) -> 'CharSet':
+        """
+            sweep the predicate over [0, max_char] and keep the accepted runs, the
+            results are collected in one byte per char and the runs found with find
+        """
+        flags = bytes(map(bool, map(predicate, map(chr, range(0, max_char + 1)))))
+        intervals = []
+        run_start = flags.find(1)
+        while run_start != -1:
+            run_end = flags.find(0, run_start)
+            if run_end == -1:
+                run_end = len(flags)
+            intervals.append((run_start, run_end - 1))
+            run_start = flags.find(1, run_end)
+        return CharSet(intervals)
+
+    @property
+    def intervals(self) -> Tuple[Tuple[int, int]]: return self._intervals
+
+    def union(self, other: 'CharSet') -> 'CharSet':
+        return CharSet(self._intervals + other._intervals)
+
+    def intersection(self, other: 'CharSet') -> 'CharSet':
+        result = []
+        left, right = self._intervals, other._intervals
+        i = j = 0
+        while i < len(left) and j < len(right):
+            start = max(left[i][0], right[j][0])
+            end = min(left[i][1], right[j][1])
+            if start <= end:
+                result.append((start, end))
+            if left[i][1] < right[j][1]:
+                i += 1
+            else:
+                j += 1
+        return CharSet(result)
+
+    def complement(self) -> 'CharSet':
+        result = []
+        next_start = 0
+        for start, end in self._intervals:
+            if start > next_start:
+                result.append((next_start, start - 1))
+            next_start = end + 1
+        if next_start <= MAX_CHAR:
+            result.append((next_start, MAX_CHAR))
+        return CharSet(result)
+
+    def difference(self, other: 'CharSet') -> 'CharSet':
+        return self.intersection(other.complement())
+
+    def __or__(self, other: 'CharSet') -> 'CharSet': return self.union(other)
+
+    def __and__(self, other: 'CharSet') -> 'CharSet': return self.intersection(other)
+
+    def __sub__(self, other: 'CharSet') -> 'CharSet': return self.difference(other)
+
+    def __invert__(self) -> 'CharSet': return self.complement()
+
+    def __contains__(self, char: int) -> bool:
+        index = bisect_right(self._intervals, (char, MAX_CHAR + 1)) - 1
+        return index >= 0 and self._intervals[index][1] >= char
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self._intervals:
+            yield from range(start, end + 1)
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in self._intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self._intervals)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CharSet) and self._intervals == other._intervals
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._intervals)
+        return self._hash
+
+    def __repr__(self) -> str:
+        return 'CharSet(' + ', '.join(f"{start:#x}-{end:#x}" if start != end else f"{start:#x}" for start, end in self._intervals) + ')'
+
 
 class CharSetManager(ABC):
 
     @abstractmethod
     def all_chars(self) -> Collection[int]: pass
 
-    @abstractmethod
     def all_char_ids(self) -> Collection[int]: 
         yield from (self.char_to_index(char) for char in self.all_chars())
 
+    def char_set_to_indexes(self, char_set: 'CharSet') -> Set[int]:
+        """
+            ids of every char class that intersects the char set, only the chars of the
+            alphabet inside each interval are looked up, so a large unicode class costs
+            no more than the alphabet
+        """
+        char_num = self.char_num()
+        chars = sorted(self.all_chars())
+        indexes = set()
+        for start, end in char_set.intervals:
+            for char in chars[bisect_left(chars, start):bisect_right(chars, end)]:
+                index = self.char_to_index(char)
+                if index < char_num:
+                    indexes.add(index)
+        return indexes
+
     @abstractmethod
     def char_num(self) -> int: pass
 
@@ -22,10 +160,111 @@ class ASCIICharSetManager(CharSetManager):
         super().__init__()
     
     def all_chars(self) -> Collection[int]:
-        return super().all_chars()
+        return range(0, 128)
     
     def char_num(self) -> int:
         return 128
     
     def char_to_index(self, char) -> int:
-        return ord(char)
\ No newline at end of file
+        return char if isinstance(char, int) else ord(char)
+
+
+class EquivalenceClassCharSetManager(CharSetManager):
+    """
+        partition the code space into equivalence classes, two chars share a class
+        when they are covered by exactly the same char sets of the nfa edges, so no
+        automaton built from the model can tell them apart.
+        class 0 holds the chars without any edge (and EOF)
+    """
+
+    DIRECT_LOOKUP_SIZE = 256
+
+    def __init__(self, segment_starts: Sequence[int], segment_classes: Sequence[int], class_num: int) -> None:
+        super().__init__()
+        self._class_num = class_num
+        self._segment_starts = array('I', segment_starts)
+        self._segment_classes = array(self._typecode(class_num), segment_classes)
+        self._direct_lookup = array(self._typecode(class_num), (self._bisect_lookup(char) for char in range(0, self.DIRECT_LOOKUP_SIZE)))
+
+    @staticmethod
+    def _typecode(class_num: int) -> str:
+        if class_num <= 0xFF:
+            return 'B'
+        return 'H' if class_num <= 0xFFFF else 'I'
+
+    @staticmethod
+    def from_char_sets(char_sets: Iterable[CharSet]) -> 'EquivalenceClassCharSetManager':
+        char_sets = list(set(char_sets))
+        events: Dict[int, List[Tuple[int, int]]] = {0: []}
+        for set_id, char_set in enumerate(char_sets):
+            for start, end in char_set.intervals:
+                events.setdefault(start, []).append((set_id, 1))
+                events.setdefault(end + 1, []).append((set_id, -1))
+        # sweep the boundaries, the key of a segment is the ids of the sets covering it
+        class_ids: Dict[FrozenSet[int], int] = {frozenset(): 0}
+        segment_starts, segment_classes = [], []
+        covering: Set[int] = set()
+        for boundary in sorted(events):
+            if boundary > MAX_CHAR:
+                break
+            for set_id, delta in events[boundary]:
+                if delta > 0:
+                    covering.add(set_id)
+                else:
+                    covering.discard(set_id)
+            key = frozenset(covering)
+            if key not in class_ids:
+                class_ids[key] = len(class_ids)
+            if segment_classes and segment_classes[-1] == class_ids[key]:
+                continue
+            segment_starts.append(boundary)
+            segment_classes.append(class_ids[key])
+        return EquivalenceClassCharSetManager(segment_starts, segment_classes, len(class_ids))
+
+    @staticmethod
+    def from_nfa_model(nfa_model) -> 'EquivalenceClassCharSetManager':
+        return EquivalenceClassCharSetManager.from_char_sets(
+            edge.symbol for state in nfa_model.states for edge in state.out_edges if edge.symbol is not None)
+
+    @property
+    def segment_starts(self) -> array: return self._segment_starts
+
+    @property
+    def segment_classes(self) -> array: return self._segment_classes
+
+    def _bisect_lookup(self, char: int) -> int:
+        return self._segment_classes[bisect_right(self._segment_starts, char) - 1]
+
+    def class_char_sets(self) -> List[CharSet]:
+        """
+            the chars of every class, indexed by class id
+        """
+        intervals = [[] for _ in range(0, self._class_num)]
+        ends = list(self._segment_starts[1:]) + [MAX_CHAR + 1]
+        for start, end, class_id in zip(self._segment_starts, ends, self._segment_classes):
+            intervals[class_id].append((start, end - 1))
+        return [CharSet(class_intervals) for class_intervals in intervals]
+
+    def all_chars(self) -> Collection[int]:
+        for start, end, class_id in zip(self._segment_starts, list(self._segment_starts[1:]) + [MAX_CHAR + 1], self._segment_classes):
+            if class_id:
+                yield from range(start, end)
+
+    def all_char_ids(self) -> Collection[int]:
+        return range(0, self._class_num)
+
+    def char_num(self) -> int:
+        return self._class_num
+
+    def char_to_index(self, char) -> int:
+        if char < self.DIRECT_LOOKUP_SIZE:
+            return self._direct_lookup[char] if char >= 0 else 0
+        return self._segment_classes[bisect_right(self._segment_starts, char) - 1]
+
+    def char_set_to_indexes(self, char_set: CharSet) -> Set[int]:
+        indexes = set()
+        for start, end in char_set.intervals:
+            first = bisect_right(self._segment_starts, start) - 1
+            last = bisect_right(self._segment_starts, end)
+            indexes.update(self._segment_classes[first:last])
+        return indexes
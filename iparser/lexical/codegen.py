@@ -0,0 +1,179 @@
+from typing import *
+import types
+from iparser.lexical.charset import CharSetManager, EquivalenceClassCharSetManager
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.lexer import CompiledLexer, LexerModes, LexerKeywords, NO_ACTION, expect_compiled
+from iparser.lexical.token import DEFAULT_MODE
+
+_MODULE_TEMPLATE = '''\
+# generated by iparser.lexical.codegen, do not edit
+from bisect import bisect_right as _bisect_right
+
+TOKEN_NAMES = {token_names}
+
+_ACCEPT = {accept_table}
+_DIRECT_CLASSES = {direct_classes}
+_SEGMENT_STARTS = {segment_starts}
+_SEGMENT_CLASSES = {segment_classes}
+_TRANSITIONS = (
+{transitions}
+)
+# start state of every lexer mode, per token -1, -2 (pop the mode) or the mode to push
+MODE_NAMES = {mode_names}
+_MODE_STARTS = {mode_starts}
+_ACTIONS = {actions}
+_SKIPS = {skips}
+# per token None or the table of its keywords: lexeme -> keyword token index
+_KEYWORDS = {keywords}
+
+
+def tokenize(text):
+    """
+        yield (token index, token name, value) for every token of text that is not skipped
+    """
+    transitions = _TRANSITIONS
+    accept = _ACCEPT
+    direct_classes = _DIRECT_CLASSES
+    direct_size = len(direct_classes)
+    segment_starts = _SEGMENT_STARTS
+    segment_classes = _SEGMENT_CLASSES
+    bisect_right = _bisect_right
+    token_names = TOKEN_NAMES
+    mode_starts = _MODE_STARTS
+    actions = _ACTIONS
+    skips = _SKIPS
+    keywords = _KEYWORDS
+    mode_stack = [0]
+    start_state = 1
+    length = len(text)
+    position = 0
+    while position < length:
+        start = position
+        row = transitions[start_state]
+        token_index, end = -1, start
+        while position < length:
+            char = ord(text[position])
+            if char < direct_size:
+                state = row[direct_classes[char]]
+            else:
+                state = row[segment_classes[bisect_right(segment_starts, char) - 1]]
+            if not state:
+                break
+            row = transitions[state]
+            position += 1
+            if accept[state] != -1:
+                token_index, end = accept[state], position
+        if token_index == -1:
+            line = text.count('\\n', 0, start)
+            column = start - text.rfind('\\n', 0, start) - 1
+            raise Exception(f"error token: {{text[start:position + 1]}} at line {{line}}, column {{column}}")
+        position = end
+        keyword_table = keywords[token_index]
+        if keyword_table is not None:
+            token_index = keyword_table.get(text[start:end], token_index)
+        action = actions[token_index]
+        if action != -1:
+            if action == -2:
+                if len(mode_stack) == 1:
+                    raise Exception("can not pop the last lexer mode")
+                mode_stack.pop()
+            else:
+                mode_stack.append(action)
+            start_state = mode_starts[mode_stack[-1]]
+        if not skips[token_index]:
+            yield token_index, token_names[token_index], text[start:end]
+'''
+
+
+class ScannerCodeGenerator:
+    """
+        emit a standalone python module whose tokenize(text) produces the same
+        tokens as Scanner, but runs as one loop over local tables and string slices
+    """
+
+    DIRECT_SIZE = 256
+
+    @staticmethod
+    def _format_tuple(items: Iterable) -> str:
+        items = tuple(items)
+        if len(items) == 1:
+            return f"({items[0]!r},)"
+        return '(' + ', '.join(repr(item) for item in items) + ')'
+
+    @staticmethod
+    def generate(transition_rows: Sequence[Sequence[int]], accept_table: Sequence[int],
+                 token_names: Sequence[str], charset_manager: CharSetManager, modes: LexerModes=None,
+                 keywords: LexerKeywords=None) -> str:
+        if modes is None:
+            modes = LexerModes((DEFAULT_MODE,), (1,), [NO_ACTION] * len(token_names), [False] * len(token_names))
+        if charset_manager is None:
+            raise ValueError("code generation needs the charset manager of a char level lexer, "
+                             "byte level lexers and lexers over raw code points are not supported")
+        if keywords is None:
+            keywords = LexerKeywords([None] * len(token_names))
+        symbol_num = charset_manager.char_num()
+        if isinstance(charset_manager, EquivalenceClassCharSetManager):
+            # class 0 holds the chars without any edge, it never leaves the dead state
+            dead_class = 0
+            segment_starts = tuple(charset_manager.segment_starts)
+            segment_classes = tuple(charset_manager.segment_classes)
+        else:
+            # every column of another manager is a real char, the chars outside its
+            # alphabet go to an extra column leading to the dead state
+            dead_class = symbol_num
+            transition_rows = [tuple(row) + (0,) for row in transition_rows]
+            chars = sorted(charset_manager.all_chars())
+            segment_starts, segment_classes = [0], [dead_class]
+            for char in chars:
+                segment_starts.append(char)
+                segment_classes.append(charset_manager.char_to_index(char))
+                segment_starts.append(char + 1)
+                segment_classes.append(dead_class)
+        direct_classes = [charset_manager.char_to_index(char) for char in range(0, ScannerCodeGenerator.DIRECT_SIZE)]
+        direct_classes = [class_id if 0 <= class_id < symbol_num else dead_class for class_id in direct_classes]
+        format_tuple = ScannerCodeGenerator._format_tuple
+        return _MODULE_TEMPLATE.format(
+            token_names=format_tuple(token_names),
+            accept_table=format_tuple(accept_table),
+            direct_classes=format_tuple(direct_classes),
+            segment_starts=format_tuple(segment_starts),
+            segment_classes=format_tuple(segment_classes),
+            transitions='\n'.join(f"    {format_tuple(row)}," for row in transition_rows),
+            mode_names=format_tuple(modes.mode_names),
+            mode_starts=format_tuple(modes.start_states),
+            actions=format_tuple(modes.actions),
+            skips=format_tuple(modes.skips),
+            keywords=format_tuple(keywords.tables),
+        )
+
+    @staticmethod
+    def generate_from_dfa_model(dfa_model: DFAModel, token_names: Sequence[str], modes: LexerModes=None,
+                                keywords: LexerKeywords=None) -> str:
+        """
+            the modes and keywords are not part of the dfa, pass those built from the same
+            definitions, see LexerModes.from_definitions and LexerKeywords.from_definitions
+        """
+        if modes is None and len(dfa_model.start_state_indexes) > 1:
+            raise ValueError("the dfa has the start states of several lexer modes, pass their LexerModes")
+        return ScannerCodeGenerator.generate(dfa_model.transition_table, dfa_model.accept_table,
+                                             token_names, dfa_model.charset_manager, modes, keywords)
+
+    @staticmethod
+    def generate_from_lexer(lexer: CompiledLexer) -> str:
+        expect_compiled(lexer, "code generation")
+        return ScannerCodeGenerator.generate(lexer.transition_table.rows(), lexer.accept_table,
+                                             lexer.token_names, lexer.charset_manager, lexer.modes, lexer.keywords)
+
+    @staticmethod
+    def write(source: str, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(source)
+
+    @staticmethod
+    def load(source: str, module_name: str='iparser_generated_scanner') -> types.ModuleType:
+        """
+            execute the generated source as a fresh module, without touching the file system
+        """
+        module = types.ModuleType(module_name)
+        exec(compile(source, f"<{module_name}>", 'exec'), module.__dict__)
+        return module
@@ -1,19 +1,17 @@
 from typing import *
-from iparser.lexical import regular_expression
-from iparser.lexical.charset import CharSetManager
-from iparser.lexical.nfa_model import NFAModel, NFAState, NFAEdge
+from iparser.lexical.charset import CharSetManager, EquivalenceClassCharSetManager
+from iparser.lexical.flat_nfa import FlatNFA
 from collections import defaultdict
-import time
 
 
 class DFAState:
     def __init__(self, token_index=-1) -> None:
         self._token_index = token_index
         self._out_edges: List[DFAState] = []
-        self.nfa_state_ids: Set[int] = set()
-        self.nfa_states: Set[NFAState] = set()
+        # state_index of every nfa state that belongs to this dfa state
+        self.nfa_state_ids: FrozenSet[int] = frozenset()
         self._state_index = -1
-        self.signature: Tuple[int] = None
+        self.signature: FrozenSet[int] = None
 
     @property
     def out_edges(self) -> List['DFAEdge']: return self._out_edges
@@ -39,9 +37,9 @@ class DFAState:
     def convert_to(self, symbol: int, dfa_state) -> None:
         self.add_edge(DFAEdge(symbol, dfa_state))
 
-    def set_nfa_states(self, nfa_states: Collection[NFAState], signature):
-        self.nfa_states = nfa_states
-        self.signature = signature
+    def set_nfa_states(self, nfa_state_ids: FrozenSet[int]):
+        self.nfa_state_ids = nfa_state_ids
+        self.signature = nfa_state_ids
 
 
 class DFAEdge:
@@ -58,25 +56,88 @@ class DFAEdge:
     def link_to(self, state: DFAState): self._linked_state = state
 
 class DFAModel:
-    def __init__(self, nfa_model: NFAModel) -> None:
+    def __init__(self, nfa_model: FlatNFA, charset_manager: CharSetManager=None, minimize: bool=False,
+                 start_states: Sequence[int]=()) -> None:
+        """
+            start states are state indexes of the FlatNFA, a linked NFAModel is converted
+            with FlatNFA.from_nfa_model first
+        """
         self._init_state = None
-        self._nfa_model = nfa_model
-        self._states: Dict[Tuple[int], DFAState] = {}
+        # nfa states the dfa can be started from besides the init state, like the
+        # starts of lexer modes, and the dfa states they turned into
+        self._nfa_start_states: Tuple[int] = tuple(start_states)
+        self._start_states: List[DFAState] = []
+        self._minimize = minimize
+        self._minimize_report: Tuple[int, int] = None
+        self._nfa_model: FlatNFA = nfa_model
+        self._charset_manager = charset_manager or EquivalenceClassCharSetManager.from_char_sets(nfa_model.char_sets)
+        self._states: Dict[FrozenSet[int], DFAState] = {}
         self._transition_table = None
         self._accept_table = []
         self._all_symbols: Set[int] = set()
-        self._closure_cache: Dict[NFAState, List[Set]] = {}
+        # nfa state sets are frozensets of NFAState.state_index, which makes them
+        # canonical keys whose size only depends on the number of members
+        self._closures: List[FrozenSet[int]] = []
+        # per nfa state: char class -> closure of the states reached on that class
+        self._class_moves: List[Dict[int, FrozenSet[int]]] = []
+        self._accept_states: FrozenSet[int] = frozenset()
+        self._token_indexes: List[int] = []
+        # kept by release
+        self._state_num: int = None
+        self._start_state_indexes: List[int] = None
 
     def init(self):
         self._build_model()
+        if self._minimize:
+            self.minimize()
         self._build_transition_table()
 
+    def release(self):
+        """
+            drop the nfa, the construction indexes and the state graph once the tables
+            are built, only the tables, the charset manager, the start state indexes
+            and the reports stay
+        """
+        self._start_state_indexes = self.start_state_indexes
+        self._state_num = len(self._states)
+        self._nfa_model = None
+        self._states = {}
+        self._init_state = None
+        self._start_states = []
+        self._all_symbols = set()
+        self._closures = []
+        self._class_moves = []
+        self._accept_states = frozenset()
+        self._token_indexes = []
+
     @property
     def accept_table(self): return self._accept_table
 
     @property
     def transition_table(self): return self._transition_table
 
+    @property
+    def charset_manager(self) -> CharSetManager: return self._charset_manager
+
+    @property
+    def state_num(self) -> int: return self._state_num if self._state_num is not None else len(self._states)
+
+    @property
+    def minimize_report(self) -> Tuple[int, int]:
+        """
+            (state number before, state number after) of the last minimization
+        """
+        return self._minimize_report
+
+    @property
+    def start_state_indexes(self) -> List[int]:
+        """
+            index of the init state followed by the dfa states of the extra start states
+        """
+        if self._start_state_indexes is not None:
+            return self._start_state_indexes
+        return [self._init_state.state_index] + [state.state_index for state in self._start_states]
+
     @property
     def init_state(self): return self._init_state
 
@@ -84,88 +145,204 @@ class DFAModel:
     def init_state(self, state: DFAState): 
         self._init_state = state
     
-    def _get_closure(self, *states: NFAState) -> Set[NFAState]:
-        closure = set()
-
-        def helper(state: NFAState, res: Set[NFAState]):
-            if state in res:
-                return
-            res.add(state)
-            for next_state in state.can_epsilon_move_states():
-                helper(next_state, res)
-
-        for state in states:
-            if state not in self._closure_cache:
-                res = set()
-                helper(state, res)
-                self._closure_cache[state] = res
-            closure.update(self._closure_cache[state])
-        return closure
-
-    # closure(move(T, symbol))
-    def _move_and_closure(self, nfa_states: Collection[NFAState], symbol: int) -> Collection[NFAState]:
-        new_states = set()
-        for state in nfa_states:
-            new_states.update(state.linked_state_lookup[symbol])
-        return self._get_closure(*new_states)
-
-    def _get_accept_state(self, nfa_states: Collection[NFAState]):
-        accept_states = list(sorted((state for state in nfa_states if state._token_index != -1), key=lambda s: s.token_index))
-        return accept_states and accept_states[0] or None
-
-    def _create_dfa_state(self, nfa_states: Collection[NFAState], signature):
-        dfa_state = DFAState()
-        accept_state = self._get_accept_state(nfa_states)
-        dfa_state.token_index = accept_state.token_index if accept_state else -1
-        self._states[signature] = dfa_state
+    def _get_closures(self) -> List[FrozenSet[int]]:
+        """
+            epsilon closure of every nfa state, found with an explicit stack. a closure
+            already computed is merged as a whole instead of being walked again
+        """
+        nfa_model = self._nfa_model
+        offsets = nfa_model.epsilon_offsets
+        targets = nfa_model.epsilon_targets
+        closures: List[FrozenSet[int]] = [None] * nfa_model.state_num
+        for state_index in range(0, nfa_model.state_num):
+            if offsets[state_index] == offsets[state_index + 1]:
+                closures[state_index] = frozenset((state_index,))
+                continue
+            closure = {state_index}
+            wait_states = [state_index]
+            while wait_states:
+                current = wait_states.pop()
+                for next_index in targets[offsets[current]:offsets[current + 1]]:
+                    if next_index in closure:
+                        continue
+                    if closures[next_index] is not None:
+                        closure.update(closures[next_index])
+                    else:
+                        closure.add(next_index)
+                        wait_states.append(next_index)
+            closures[state_index] = frozenset(closure)
+        return closures
+
+    def _index_nfa_model(self):
+        nfa_model = self._nfa_model
+        self._closures = closures = self._get_closures()
+        self._token_indexes = list(nfa_model.token_indexes)
+        self._accept_states = frozenset(index for index, token_index in enumerate(nfa_model.token_indexes) if token_index != -1)
+        char_set_classes = [self._charset_manager.char_set_to_indexes(char_set) for char_set in nfa_model.char_sets]
+        offsets, symbols, targets = nfa_model.edge_offsets, nfa_model.edge_symbols, nfa_model.edge_targets
+        for state_index in range(0, nfa_model.state_num):
+            class_moves: Dict[int, FrozenSet[int]] = {}
+            for edge in range(offsets[state_index], offsets[state_index + 1]):
+                target_ids = closures[targets[edge]]
+                for class_id in char_set_classes[symbols[edge]]:
+                    class_moves[class_id] = class_moves[class_id] | target_ids if class_id in class_moves else target_ids
+            self._class_moves.append(class_moves)
+
+    # closure(move(T, symbol)) for every char class T can move on
+    def _move_and_closure(self, nfa_state_ids: FrozenSet[int]) -> Dict[int, FrozenSet[int]]:
+        moves: Dict[int, Set[int]] = defaultdict(set)
+        class_moves = self._class_moves
+        for state_index in nfa_state_ids:
+            for class_id, target_ids in class_moves[state_index].items():
+                moves[class_id].update(target_ids)
+        return {class_id: frozenset(target_ids) for class_id, target_ids in moves.items()}
+
+    def _get_accept_token(self, nfa_state_ids: FrozenSet[int]) -> int:
+        """
+            the smallest token index accepted by the state set wins, like the definition order
+        """
+        accepting = nfa_state_ids & self._accept_states
+        return min(self._token_indexes[state_index] for state_index in accepting) if accepting else -1
+
+    def _create_dfa_state(self, nfa_state_ids: FrozenSet[int]):
+        dfa_state = DFAState(self._get_accept_token(nfa_state_ids))
+        self._states[nfa_state_ids] = dfa_state
         dfa_state.state_index = len(self._states)
-        dfa_state.set_nfa_states(nfa_states, signature)
+        dfa_state.set_nfa_states(nfa_state_ids)
         return dfa_state
 
-    def _cal_signature(self, nfa_states: Collection[NFAState]):
-        return tuple(set((state.state_index for state in nfa_states)))
-
     def _build_model(self):
-        start_nfa_states = self._get_closure(self._nfa_model.init_state)
-        self._init_state = self._create_dfa_state(start_nfa_states, self._cal_signature(start_nfa_states))
+        self._index_nfa_model()
+        self._init_state = self._create_dfa_state(self._closures[self._nfa_model.init_state])
         wait_move_states: List[DFAState] = [self._init_state]
-        while True and wait_move_states:
+        for nfa_start_state in self._nfa_start_states:
+            nfa_state_ids = self._closures[nfa_start_state]
+            start_state = self._states.get(nfa_state_ids)
+            if start_state is None:
+                start_state = self._create_dfa_state(nfa_state_ids)
+                wait_move_states.append(start_state)
+            self._start_states.append(start_state)
+        while wait_move_states:
             source_state = wait_move_states.pop()
-            valid_inputs = set()
-            for state in source_state.nfa_states:
-                v = state.valid_inputs()
-                valid_inputs.update(v)
-                self._all_symbols.update(v)
-            print(source_state.signature, valid_inputs)
-            for symbol in valid_inputs:
-                new_nfa_states = self._move_and_closure(source_state.nfa_states, symbol)
-                if not new_nfa_states:
-                    continue
-                signature = tuple(set((state.state_index for state in new_nfa_states)))
-                # print(source_state.signature, symbol, signature)
-                existed_state = self._states.get(signature)
-                if existed_state:
-                    source_state.convert_to(symbol, existed_state)
-                else:
-                    new_state = self._create_dfa_state(new_nfa_states, signature)
-                    source_state.convert_to(symbol, new_state)
-                    wait_move_states.append(new_state)
+            for symbol, nfa_state_ids in self._move_and_closure(source_state.nfa_state_ids).items():
+                self._all_symbols.add(symbol)
+                existed_state = self._states.get(nfa_state_ids)
+                if existed_state is None:
+                    existed_state = self._create_dfa_state(nfa_state_ids)
+                    wait_move_states.append(existed_state)
+                source_state.convert_to(symbol, existed_state)
     
     def _build_transition_table(self):
-        max_symbol = max(self._all_symbols) + 1
+        max_symbol = self._charset_manager.char_num()
         transition_table = [[0] * max_symbol for _ in range(0, len(self._states) + 1)]
         accept_table = [-1] * len(transition_table)
-        visited = set()
-
-        def helper(state: DFAState):
-            if state.state_index in visited:
-                return
-            visited.add(state.state_index)
+        for state in self._states.values():
             accept_table[state.state_index] = state.token_index
+            row = transition_table[state.state_index]
             for edge in state.out_edges:
-                transition_table[state.state_index][edge.symbol] = edge.linked_state.state_index
-                helper(edge.linked_state)
-
-        helper(self._init_state)
+                row[edge.symbol] = edge.linked_state.state_index
         self._transition_table = transition_table
         self._accept_table = accept_table
+
+    def minimize(self) -> Tuple[int, int]:
+        """
+            merge equivalent states with hopcroft's partition refinement, states
+            accepting different tokens are never merged.
+            the refinement runs on the partial automaton (no explicit dead state),
+            which is exact because every state built from a thompson nfa can still
+            reach an accepting state. with every initial block waiting as a splitter
+            a missing edge is told apart from any existing one, and the work is
+            proportional to the number of edges instead of states * symbols
+        """
+        states: List[DFAState] = [None] + sorted(self._states.values(), key=lambda state: state.state_index)
+        state_num = len(states)
+        inverse: List[Dict[int, List[int]]] = [{} for _ in range(0, state_num)]
+        for state in states[1:]:
+            for edge in state.out_edges:
+                inverse[edge.linked_state.state_index].setdefault(edge.symbol, []).append(state.state_index)
+
+        # refinable partition: every block is the slice [first, end) of elements and the
+        # states marked by the current splitter are moved to the front of their block
+        initial_blocks: Dict[int, List[int]] = defaultdict(list)
+        for state in states[1:]:
+            initial_blocks[state.token_index].append(state.state_index)
+        elements: List[int] = []
+        first: List[int] = []
+        end: List[int] = []
+        for block in initial_blocks.values():
+            first.append(len(elements))
+            elements.extend(block)
+            end.append(len(elements))
+        marked_end = list(first)
+        location = [0] * state_num
+        block_of = [0] * state_num
+        for position, state_index in enumerate(elements):
+            location[state_index] = position
+        for block_index in range(0, len(first)):
+            for position in range(first[block_index], end[block_index]):
+                block_of[elements[position]] = block_index
+        wait_blocks = list(range(0, len(first)))
+
+        while wait_blocks:
+            splitter_index = wait_blocks.pop()
+            sources_by_symbol: Dict[int, List[int]] = defaultdict(list)
+            for target in elements[first[splitter_index]:end[splitter_index]]:
+                for symbol, sources in inverse[target].items():
+                    sources_by_symbol[symbol].extend(sources)
+            for sources in sources_by_symbol.values():
+                touched_blocks = []
+                for source in sources:
+                    block_index = block_of[source]
+                    position = location[source]
+                    if position < marked_end[block_index]:
+                        continue
+                    if marked_end[block_index] == first[block_index]:
+                        touched_blocks.append(block_index)
+                    swap_position = marked_end[block_index]
+                    swap_state = elements[swap_position]
+                    elements[position], location[swap_state] = swap_state, position
+                    elements[swap_position], location[source] = source, swap_position
+                    marked_end[block_index] = swap_position + 1
+                for block_index in touched_blocks:
+                    middle = marked_end[block_index]
+                    marked_end[block_index] = first[block_index]
+                    if middle == end[block_index]:
+                        continue
+                    # the smaller half becomes the new block, so it is enough to wait on it
+                    new_block_index = len(first)
+                    if middle - first[block_index] <= end[block_index] - middle:
+                        first.append(first[block_index])
+                        end.append(middle)
+                        first[block_index] = middle
+                    else:
+                        first.append(middle)
+                        end.append(end[block_index])
+                        end[block_index] = middle
+                    marked_end[block_index] = first[block_index]
+                    marked_end.append(first[new_block_index])
+                    for position in range(first[new_block_index], end[new_block_index]):
+                        block_of[elements[position]] = new_block_index
+                    wait_blocks.append(new_block_index)
+
+        # renumber the blocks: the init block becomes 1, the others follow in state order
+        representatives = [min(elements[first[block_index]:end[block_index]]) for block_index in range(0, len(first))]
+        init_block = block_of[self._init_state.state_index]
+        block_order = [init_block] + sorted((block_index for block_index in range(0, len(first)) if block_index != init_block),
+                                            key=lambda block_index: representatives[block_index])
+        new_states: Dict[int, DFAState] = {}
+        for block_index in block_order:
+            representative = states[representatives[block_index]]
+            new_state = DFAState(representative.token_index)
+            new_state.state_index = len(new_states) + 1
+            new_state.set_nfa_states(representative.nfa_state_ids)
+            new_states[block_index] = new_state
+        for block_index, new_state in new_states.items():
+            for edge in states[representatives[block_index]].out_edges:
+                new_state.convert_to(edge.symbol, new_states[block_of[edge.linked_state.state_index]])
+
+        before = len(self._states)
+        self._states = {state.signature: state for state in new_states.values()}
+        self._init_state = new_states[init_block]
+        self._start_states = [new_states[block_of[state.state_index]] for state in self._start_states]
+        self._minimize_report = (before, len(self._states))
+        return self._minimize_report
@@ -0,0 +1,270 @@
+from typing import *
+from array import array
+from iparser.lexical.charset import CharSet
+from iparser.lexical.nfa_model import NFAModel
+from iparser.lexical.regular_expression import RegularExpression, BaseRegularExpression, \
+    BiRegularExpressionOp, ConcatRegularExpressionOp, OrRegularExpressionOp, \
+    BatchOrRegularExpression, StarRegularExpressionOp
+from iparser.lexical.token import ReTokenDefinitions, DEFAULT_MODE
+
+
+class FlatNFA:
+    """
+        an nfa stored in flat integer arrays. states are the integers 0 .. state num - 1,
+        the symbol edges of state s are the slice edge_offsets[s]:edge_offsets[s + 1] of
+        edge_symbols (ids into char_sets) and edge_targets, the epsilon edges are laid
+        out the same way in epsilon_offsets and epsilon_targets
+    """
+
+    def __init__(self, init_state: int, token_indexes: array, char_sets: List[CharSet],
+                 edge_offsets: array, edge_symbols: array, edge_targets: array,
+                 epsilon_offsets: array, epsilon_targets: array) -> None:
+        self.init_state = init_state
+        self.token_indexes = token_indexes
+        self.char_sets = char_sets
+        self.edge_offsets = edge_offsets
+        self.edge_symbols = edge_symbols
+        self.edge_targets = edge_targets
+        self.epsilon_offsets = epsilon_offsets
+        self.epsilon_targets = epsilon_targets
+
+    @property
+    def state_num(self) -> int:
+        return len(self.token_indexes)
+
+    def _closure(self, states: Iterable[int]) -> Set[int]:
+        offsets, targets = self.epsilon_offsets, self.epsilon_targets
+        closure = set(states)
+        wait_states = list(closure)
+        while wait_states:
+            state = wait_states.pop()
+            for target in targets[offsets[state]:offsets[state + 1]]:
+                if target not in closure:
+                    closure.add(target)
+                    wait_states.append(target)
+        return closure
+
+    def accepts(self, text: str) -> bool:
+        """
+            whether the whole text leads from the init state to an accepting state,
+            simulated on state sets without building a dfa
+        """
+        offsets, symbols, targets, char_sets = self.edge_offsets, self.edge_symbols, self.edge_targets, self.char_sets
+        states = self._closure((self.init_state,))
+        for char in text:
+            code = ord(char)
+            states = self._closure(targets[edge] for state in states for edge in range(offsets[state], offsets[state + 1])
+                                   if code in char_sets[symbols[edge]])
+            if not states:
+                return False
+        return any(self.token_indexes[state] != -1 for state in states)
+
+    @staticmethod
+    def _compress(state_num: int, sources: array, *columns: array) -> Tuple[array, ...]:
+        """
+            sort the edge columns by source state, returns the offsets followed by the
+            sorted columns
+        """
+        offsets = array('i', [0]) * (state_num + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for state in range(0, state_num):
+            offsets[state + 1] += offsets[state]
+        order = sorted(range(0, len(sources)), key=sources.__getitem__)
+        return (offsets, *(array('i', map(column.__getitem__, order)) for column in columns))
+
+    @staticmethod
+    def from_nfa_model(nfa_model: NFAModel) -> 'FlatNFA':
+        builder = FlatNFABuilder()
+        states = nfa_model.states
+        for state in states:
+            builder.new_state(state.token_index)
+        for state in states:
+            for edge in state.out_edges:
+                if edge.symbol is None:
+                    builder.add_epsilon(state.state_index, edge.linked_state.state_index)
+                else:
+                    builder.add_edge(state.state_index, edge.symbol, edge.linked_state.state_index)
+        return builder.build(nfa_model.init_state.state_index)
+
+
+class FlatNFABuilder:
+    """
+        converter for RegularExpression.to_nfa_model that appends states and edges to
+        flat arrays and returns (init state, tail state) fragments. a state gets its
+        index once when it is created, nothing is re-indexed when fragments are joined.
+        a composite subexpression object met again (shared by RegexParser or by
+        at_least_once) is not converted again, its first fragment is copied with the
+        states shifted
+    """
+
+    def __init__(self) -> None:
+        self._token_indexes = array('i')
+        self._char_sets: List[CharSet] = []
+        self._char_set_ids: Dict[CharSet, int] = {}
+        self._char_ids: Dict[str, int] = {}
+        self._edge_sources = array('i')
+        self._edge_symbols = array('i')
+        self._edge_targets = array('i')
+        self._epsilon_sources = array('i')
+        self._epsilon_targets = array('i')
+        # id of a converted composite expression -> (expression, state, edge and
+        # epsilon ranges of its fragment, init state, tail state)
+        self._fragments: Dict[int, tuple] = {}
+
+    @staticmethod
+    def from_definitions(definitions: ReTokenDefinitions, mode_starts: List[int]=None) -> FlatNFA:
+        """
+            the nfa of all tokens built from the expressions of the definitions, their
+            cached nfa models are never touched: the init state starts the default mode
+            and the start states of all modes, in the order of definitions.modes(), are
+            appended to mode_starts when given
+        """
+        builder = FlatNFABuilder()
+        mode_names = definitions.modes()
+        starts = {mode_name: builder.new_state() for mode_name in mode_names}
+        for token_index, definition in enumerate(definitions.definitions):
+            if definition.host is not None:
+                # keywords are reclassified from the lexemes of their host
+                continue
+            init_state, tail_state = builder.convert(definition.re)
+            builder.set_token_index(tail_state, token_index)
+            for mode_name in definition.modes:
+                builder.add_epsilon(starts[mode_name], init_state)
+        if mode_starts is not None:
+            mode_starts.extend(starts[mode_name] for mode_name in mode_names)
+        return builder.build(starts[DEFAULT_MODE])
+
+    @staticmethod
+    def from_expression(expression: RegularExpression) -> FlatNFA:
+        """
+            the nfa of a single expression, its tail accepts token 0
+        """
+        builder = FlatNFABuilder()
+        init_state, tail_state = builder.convert(expression)
+        builder.set_token_index(tail_state, 0)
+        return builder.build(init_state)
+
+    def convert(self, expression: RegularExpression) -> Tuple[int, int]:
+        if not isinstance(expression, (BiRegularExpressionOp, StarRegularExpressionOp)):
+            return expression.to_nfa_model(self)
+        fragment = self._fragments.get(id(expression))
+        if fragment is not None:
+            return self._copy_fragment(*fragment[1:])
+        state_start, edge_start, epsilon_start = len(self._token_indexes), len(self._edge_sources), len(self._epsilon_sources)
+        init_state, tail_state = expression.to_nfa_model(self)
+        # the expression is kept so its id is not reused while the builder lives
+        self._fragments[id(expression)] = (expression, state_start, len(self._token_indexes), edge_start, len(self._edge_sources),
+                                           epsilon_start, len(self._epsilon_sources), init_state, tail_state)
+        return init_state, tail_state
+
+    def _copy_fragment(self, state_start: int, state_end: int, edge_start: int, edge_end: int,
+                       epsilon_start: int, epsilon_end: int, init_state: int, tail_state: int) -> Tuple[int, int]:
+        """
+            a fragment only has edges between its own states, which were created in one
+            run, so a copy is the same edges shifted by the distance to the new states.
+            the copied states accept nothing, token indexes are set after conversion
+        """
+        shift = len(self._token_indexes) - state_start
+        self._token_indexes.extend(array('i', [-1]) * (state_end - state_start))
+        self._edge_sources.extend(array('i', [source + shift for source in self._edge_sources[edge_start:edge_end]]))
+        self._edge_symbols.extend(self._edge_symbols[edge_start:edge_end])
+        self._edge_targets.extend(array('i', [target + shift for target in self._edge_targets[edge_start:edge_end]]))
+        self._epsilon_sources.extend(array('i', [source + shift for source in self._epsilon_sources[epsilon_start:epsilon_end]]))
+        self._epsilon_targets.extend(array('i', [target + shift for target in self._epsilon_targets[epsilon_start:epsilon_end]]))
+        return init_state + shift, tail_state + shift
+
+    def new_state(self, token_index: int=-1) -> int:
+        self._token_indexes.append(token_index)
+        return len(self._token_indexes) - 1
+
+    def set_token_index(self, state: int, token_index: int):
+        self._token_indexes[state] = token_index
+
+    def _char_set_id(self, char_set: CharSet) -> int:
+        char_set_id = self._char_set_ids.get(char_set)
+        if char_set_id is None:
+            char_set_id = self._char_set_ids[char_set] = len(self._char_sets)
+            self._char_sets.append(char_set)
+        return char_set_id
+
+    def _char_id(self, char: str) -> int:
+        # single chars are looked up by the char itself, without building a CharSet
+        char_id = self._char_ids.get(char)
+        if char_id is None:
+            char_id = self._char_ids[char] = self._char_set_id(CharSet.of_char(ord(char)))
+        return char_id
+
+    def add_edge(self, source: int, char_set: CharSet, target: int):
+        self._add_edge_id(source, self._char_set_id(char_set), target)
+
+    def _add_edge_id(self, source: int, char_set_id: int, target: int):
+        self._edge_sources.append(source)
+        self._edge_symbols.append(char_set_id)
+        self._edge_targets.append(target)
+
+    def add_epsilon(self, source: int, target: int):
+        self._epsilon_sources.append(source)
+        self._epsilon_targets.append(target)
+
+    def build(self, init_state: int) -> FlatNFA:
+        state_num = len(self._token_indexes)
+        edge_offsets, edge_symbols, edge_targets = FlatNFA._compress(
+            state_num, self._edge_sources, self._edge_symbols, self._edge_targets)
+        epsilon_offsets, epsilon_targets = FlatNFA._compress(state_num, self._epsilon_sources, self._epsilon_targets)
+        return FlatNFA(init_state, array('i', self._token_indexes), list(self._char_sets),
+                       edge_offsets, edge_symbols, edge_targets, epsilon_offsets, epsilon_targets)
+
+    def _fragment(self, char_set: Optional[CharSet]) -> Tuple[int, int]:
+        init_state = self.new_state()
+        tail_state = self.new_state()
+        if char_set is None:
+            self.add_epsilon(init_state, tail_state)
+        else:
+            self.add_edge(init_state, char_set, tail_state)
+        return init_state, tail_state
+
+    def convert_base_expression(self, expression: BaseRegularExpression) -> Tuple[int, int]:
+        char = expression.get_match_char()
+        if not char:
+            return self._fragment(None)
+        init_state = self.new_state()
+        tail_state = self.new_state()
+        self._add_edge_id(init_state, self._char_id(char), tail_state)
+        return init_state, tail_state
+
+    def convert_or_expression(self, expression: OrRegularExpressionOp) -> Tuple[int, int]:
+        fragments = [self.convert(operand) for operand in expression.get_operands()]
+        init_state = self.new_state()
+        tail_state = self.new_state()
+        for fragment_init, fragment_tail in fragments:
+            self.add_epsilon(init_state, fragment_init)
+            self.add_epsilon(fragment_tail, tail_state)
+        return init_state, tail_state
+
+    def convert_concat_expression(self, expression: ConcatRegularExpressionOp) -> Tuple[int, int]:
+        fragments = [self.convert(operand) for operand in expression.get_operands()]
+        for (_, left_tail), (right_init, _) in zip(fragments, fragments[1:]):
+            self.add_epsilon(left_tail, right_init)
+        return fragments[0][0], fragments[-1][1]
+
+    def convert_star_expression(self, expression: StarRegularExpressionOp) -> Tuple[int, int]:
+        inner_init, inner_tail = self.convert(expression.get_inner_expression())
+        init_state = self.new_state()
+        tail_state = self.new_state()
+        self.add_epsilon(init_state, tail_state)
+        self.add_epsilon(tail_state, init_state)
+        self.add_epsilon(init_state, inner_init)
+        self.add_epsilon(inner_tail, tail_state)
+        return init_state, tail_state
+
+    def convert_batch_or_expression(self, expression: BatchOrRegularExpression) -> Tuple[int, int]:
+        return self._fragment(expression.get_char_set())
+
+    def convert_literal_expression(self, expression: BatchOrRegularExpression) -> Tuple[int, int]:
+        init_state = state = self.new_state()
+        for char in expression.get_match_chars():
+            target_state = self.new_state()
+            self._add_edge_id(state, self._char_id(char), target_state)
+            state = target_state
+        return init_state, state
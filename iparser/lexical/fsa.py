@@ -1,12 +1,22 @@
+from iparser.lexical.transition_table import TransitionTable, DenseTransitionTable
+
+
 class FiniteStateMachine:
-    def __init__(self, transition_table, accept_table):
+    def __init__(self, transition_table, accept_table, charset_manager=None):
+        if not isinstance(transition_table, TransitionTable):
+            transition_table = DenseTransitionTable(transition_table)
         self._transition_table = transition_table
+        self._next_state = transition_table.next_state
         self._accept_table = accept_table
+        # maps an input char to the column (char class) of the transition table
+        self._char_to_index = charset_manager.char_to_index if charset_manager else None
         self._current_state = 1
         self._last_state = None
 
     def input(self, symbol):
-        now_state = self._transition_table[self._current_state][symbol]
+        if self._char_to_index:
+            symbol = self._char_to_index(symbol)
+        now_state = self._next_state(self._current_state, symbol)
         accept_state = self._accept_table[self._current_state]
         self._last_state = self._current_state
         self._current_state = now_state
@@ -21,6 +31,6 @@ class FiniteStateMachine:
     def stop(self):
         return self._current_state == 0
     
-    def reset(self):
-        self._current_state = 1
-        self._last_state = None
\ No newline at end of file
+    def reset(self, start_state=1):
+        self._current_state = start_state
+        self._last_state = None
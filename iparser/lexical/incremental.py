@@ -0,0 +1,199 @@
+from typing import *
+from array import array
+from bisect import bisect_left, bisect_right
+from iparser.lexical.lexer import CompiledLexer, expect_compiled
+from iparser.lexical.line_index import LineIndex
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.token import Token
+
+
+# tokens per block of IncrementalTokens
+BLOCK_SIZE = 256
+
+
+class IncrementalTokens:
+    """
+        the tokens of a text in blocks of about BLOCK_SIZE tokens, the offsets in a
+        block are relative to the base offset of the block. an edit rewrites the
+        blocks holding the rescanned window and moves the bases of the blocks after
+        it, the tokens of all other blocks are never touched
+    """
+
+    def __init__(self, text: str, token_names: Sequence[str]) -> None:
+        self._text = text
+        self._lines = LineIndex(text)
+        self._token_names = tuple(token_names)
+        self._blocks: List[Tuple[array, array, array]] = []
+        self._bases: List[int] = []
+        # index of the first token of every block, the last item is the token number
+        self._firsts: List[int] = [0]
+
+    @property
+    def text(self) -> str: return self._text
+
+    @property
+    def lines(self) -> LineIndex: return self._lines
+
+    @property
+    def token_names(self) -> Tuple[str]: return self._token_names
+
+    def _block_of(self, index: int) -> int:
+        return min(bisect_right(self._firsts, index), len(self._blocks)) - 1
+
+    def span(self, index: int) -> Tuple[int, int, int]:
+        """
+            (token index, start, end) of the token at index
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("token index out of range")
+        block = self._block_of(index)
+        kinds, starts, ends = self._blocks[block]
+        base, index = self._bases[block], index - self._firsts[block]
+        return kinds[index], starts[index] + base, ends[index] + base
+
+    def __len__(self) -> int:
+        return self._firsts[-1]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Token, List[Token]]:
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+        token_index, start, end = self.span(index)
+        return Token(token_index, self._token_names[token_index], None, start, end, self._text, self._lines)
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(0, len(self)):
+            yield self[index]
+
+    def first_ending_at(self, offset: int) -> int:
+        """
+            index of the first token with end >= offset
+        """
+        blocks, bases = self._blocks, self._bases
+        low, high = 0, len(blocks)
+        while low < high:
+            middle = (low + high) // 2
+            if blocks[middle][2][-1] + bases[middle] < offset:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(blocks):
+            return len(self)
+        return self._firsts[low] + bisect_left(blocks[low][2], offset - bases[low])
+
+    def _replace(self, first: int, old_end: int, window: Tuple[array, array, array], delta: int, text: str):
+        """
+            replace tokens[first:old end] by the tokens of window, whose offsets are in
+            the new text, the tokens after them move by delta
+        """
+        blocks, bases, firsts = self._blocks, self._bases, self._firsts
+        if blocks:
+            first_block = self._block_of(first)
+            last_block = self._block_of(old_end - 1) if old_end > first else first_block
+            base = bases[first_block]
+            head = first - firsts[first_block]
+            tail = old_end - firsts[last_block]
+            tail_shift = bases[last_block] + delta - base
+        else:
+            first_block, last_block, base, head, tail, tail_shift = 0, -1, 0, 0, 0, 0
+        merged = []
+        for column in range(0, 3):
+            merged_column = blocks[first_block][column][:head] if blocks else array(window[column].typecode)
+            if column:
+                merged_column.extend(offset - base for offset in window[column])
+            else:
+                merged_column.extend(window[column])
+            if blocks:
+                if column:
+                    merged_column.extend(offset + tail_shift for offset in blocks[last_block][column][tail:])
+                else:
+                    merged_column.extend(blocks[last_block][column][tail:])
+            merged.append(merged_column)
+        chunk_size = BLOCK_SIZE if len(merged[0]) > 2 * BLOCK_SIZE else max(len(merged[0]), 1)
+        chunks = [tuple(column[chunk_start:chunk_start + chunk_size] for column in merged)
+                  for chunk_start in range(0, len(merged[0]), chunk_size)]
+        blocks[first_block:last_block + 1] = chunks
+        bases[first_block:last_block + 1] = [base] * len(chunks)
+        for block in range(first_block + len(chunks), len(bases)):
+            bases[block] += delta
+        del firsts[first_block + 1:]
+        for kinds, _, _ in blocks[first_block:]:
+            firsts.append(firsts[-1] + len(kinds))
+        self._text = text
+        self._lines = LineIndex(text)
+
+
+class IncrementalScanner:
+    """
+        keep the tokens of a text up to date while it is edited. after an edit only the
+        tokens from the first one whose scan read into the edit up to the first new
+        token that starts where an old token starts (shifted by the edit) are scanned
+        again, from there on the text and therefore the tokens are the same as before.
+        an edit costs the rescanned window, the blocks it falls in and one base shift
+        per later block, see IncrementalTokens.
+        for grammars with unbounded backtracking the rescan starts at the beginning
+    """
+
+    def __init__(self, lexer: CompiledLexer) -> None:
+        expect_compiled(lexer, "incremental scanning")
+        if lexer.modes is not None and len(lexer.modes.mode_names) > 1:
+            raise ValueError("incremental scanning does not track lexer modes")
+        self._lexer = lexer
+        self._max_backtrack = lexer.max_backtrack()
+
+    @property
+    def lexer(self) -> CompiledLexer: return self._lexer
+
+    def scan(self, text: str) -> IncrementalTokens:
+        tokens = IncrementalTokens(text, self._lexer.token_names)
+        window = (array('i'), array('q'), array('q'))
+        for token in Scanner(StringReader(text), self._lexer).token_stream():
+            window[0].append(token.token_index)
+            window[1].append(token.start)
+            window[2].append(token.end)
+        tokens._replace(0, 0, window, 0, text)
+        return tokens
+
+    def edit(self, tokens: IncrementalTokens, offset: int, deleted_length: int,
+             inserted_text: str) -> Tuple[int, int, List[Token]]:
+        """
+            apply the edit to the text of tokens (the result of scan) and update tokens
+            in place, returns (first, old end, window): the old tokens[first:old end]
+            were replaced by the tokens of window
+        """
+        text = tokens.text
+        if offset < 0 or deleted_length < 0 or offset + deleted_length > len(text):
+            raise ValueError(f"edit [{offset}, {offset + deleted_length}) out of text of length {len(text)}")
+        new_text = text[:offset] + inserted_text + text[offset + deleted_length:]
+        delta = len(inserted_text) - deleted_length
+        edit_end = offset + deleted_length
+        # the scanner reads up to max backtrack chars past a token plus the char the dfa
+        # dies on, a token reading into the edit may end differently now
+        if self._max_backtrack is None:
+            first = 0
+        else:
+            first = tokens.first_ending_at(offset - self._max_backtrack)
+        # skipped tokens may lie between two tokens, the end of the previous token is
+        # the start of the gap and a token boundary as well
+        restart = tokens.span(first - 1)[2] if first > 0 else 0
+        reader = StringReader(new_text)
+        reader.seek(restart)
+        window = (array('i'), array('q'), array('q'))
+        old_index = first
+        old_end = len(tokens)
+        old_start = tokens.span(old_index)[1] if old_index < old_end else None
+        for token in Scanner(reader, self._lexer).token_stream():
+            # old tokens starting inside the edited text can never line up again
+            while old_start is not None and old_start + delta < token.start:
+                old_index += 1
+                old_start = tokens.span(old_index)[1] if old_index < len(tokens) else None
+            if old_start is not None and old_start >= edit_end and old_start + delta == token.start:
+                old_end = old_index
+                break
+            window[0].append(token.token_index)
+            window[1].append(token.start)
+            window[2].append(token.end)
+        tokens._replace(first, old_end, window, delta, new_text)
+        return first, old_end, tokens[first:first + len(window[0])]
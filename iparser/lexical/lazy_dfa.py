@@ -0,0 +1,174 @@
+from typing import *
+from iparser.lexical.charset import CharSetManager
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.lexer import ScanningLexer, LexerKeywords
+from iparser.lexical.flat_nfa import FlatNFA, FlatNFABuilder
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.transition_table import TransitionTable
+
+UNKNOWN = -1
+
+
+class LazyDFAModel(DFAModel):
+    """
+        determinize on demand: a dfa state is materialized from its nfa state set the
+        first time a transition leads to it. at most max_states states are cached,
+        when the cache is full everything except the init state and the state being
+        left is evicted before the new state is added, state ids are never reused so ids held by callers stay valid
+        as long as they are the current state of the walk
+    """
+
+    def __init__(self, nfa_model: FlatNFA, charset_manager: CharSetManager=None, max_states: int=4096) -> None:
+        super().__init__(nfa_model, charset_manager)
+        if max_states < 3:
+            # the init state, the state being left and the state entered
+            raise ValueError("a lazy dfa needs room for at least 3 states")
+        self._max_states = max_states
+        self._nfa_sets: Dict[int, FrozenSet[int]] = {}
+        self._state_ids: Dict[FrozenSet[int], int] = {}
+        self._rows: Dict[int, List[int]] = {}
+        self._accepts: Dict[int, int] = {0: -1}
+        self._next_state_id = 1
+        self._flush_num = 0
+
+    def init(self):
+        self._index_nfa_model()
+        self._add_state(self._closures[self._nfa_model.init_state])
+
+    @property
+    def state_num(self) -> int:
+        """
+            number of states currently cached
+        """
+        return len(self._rows)
+
+    @property
+    def flush_num(self) -> int: return self._flush_num
+
+    @property
+    def max_states(self) -> int: return self._max_states
+
+    def _add_state(self, nfa_state_ids: FrozenSet[int]) -> int:
+        state_id = self._next_state_id
+        self._next_state_id += 1
+        self._nfa_sets[state_id] = nfa_state_ids
+        self._state_ids[nfa_state_ids] = state_id
+        self._rows[state_id] = [UNKNOWN] * self._charset_manager.char_num()
+        self._accepts[state_id] = self._get_accept_token(nfa_state_ids)
+        return state_id
+
+    def _flush(self, *kept_states: int):
+        self._flush_num += 1
+        kept = set(kept_states) | {1}
+        self._nfa_sets = {state: self._nfa_sets[state] for state in kept}
+        self._state_ids = {nfa_state_ids: state for state, nfa_state_ids in self._nfa_sets.items()}
+        self._rows = {state: [UNKNOWN] * self._charset_manager.char_num() for state in kept}
+        self._accepts = {state: self._accepts[state] for state in kept | {0}}
+
+    def accept(self, state: int) -> int:
+        return self._accepts[state]
+
+    def next_state(self, state: int, symbol: int) -> int:
+        target = self._rows[state][symbol]
+        if target != UNKNOWN:
+            return target
+        target_ids = set()
+        class_moves = self._class_moves
+        for state_index in self._nfa_sets[state]:
+            moved = class_moves[state_index].get(symbol)
+            if moved:
+                target_ids.update(moved)
+        if not target_ids:
+            target = 0
+        else:
+            target_ids = frozenset(target_ids)
+            target = self._state_ids.get(target_ids)
+            if target is None:
+                if len(self._rows) >= self._max_states:
+                    self._flush(state)
+                target = self._add_state(target_ids)
+        self._rows[state][symbol] = target
+        return target
+
+
+class LazyTransitionTable(TransitionTable):
+    """
+        transition table interface over a lazy dfa, the rows are computed while scanning
+    """
+
+    def __init__(self, model: LazyDFAModel) -> None:
+        self._model = model
+        self._symbol_num = model.charset_manager.char_num()
+
+    def next_state(self, state: int, symbol: int) -> int:
+        if 0 <= symbol < self._symbol_num and state:
+            return self._model.next_state(state, symbol)
+        return 0
+
+    @property
+    def state_num(self) -> int: return self._model.state_num + 1
+
+    @property
+    def symbol_num(self) -> int: return self._symbol_num
+
+    def memory_usage(self) -> int:
+        # one list slot per cached transition
+        return self._model.state_num * self._symbol_num * 8
+
+    def rows(self) -> List[List[int]]:
+        raise TypeError("a lazy transition table has no complete rows, compile an eager lexer instead")
+
+
+class LazyAcceptTable:
+    def __init__(self, model: LazyDFAModel) -> None:
+        self._model = model
+
+    def __getitem__(self, state: int) -> int:
+        return self._model.accept(state)
+
+    def __len__(self) -> int:
+        return self._model.state_num + 1
+
+
+class LazyLexer(ScanningLexer):
+    """
+        lexer for grammars whose complete dfa is too big, the scanners accept it like a
+        CompiledLexer. startup only indexes the nfa and the cost of scanning is bounded
+        by the working set of the input. there is no complete dfa to encode, serialize,
+        lower or generate code from, the users of one reject a lazy lexer. the state
+        cache is mutable, so use one lazy lexer per thread
+    """
+
+    def __init__(self, model: LazyDFAModel, token_names: Sequence[str], keywords: LexerKeywords=None) -> None:
+        self._model = model
+        self._transition_table = LazyTransitionTable(model)
+        self._accept_table = LazyAcceptTable(model)
+        self._token_names = tuple(token_names)
+        self._keywords = keywords
+
+    @staticmethod
+    def compile(definitions: ReTokenDefinitions, max_states: int=4096) -> 'LazyLexer':
+        if len(definitions.modes()) > 1 or any(definition.skip for definition in definitions.definitions):
+            raise ValueError("a lazy lexer supports neither lexer modes nor skipped tokens")
+        model = LazyDFAModel(FlatNFABuilder.from_definitions(definitions), max_states=max_states)
+        model.init()
+        return LazyLexer(model, [definition.name for definition in definitions.definitions],
+                         LexerKeywords.from_definitions(definitions))
+
+    @property
+    def model(self) -> LazyDFAModel: return self._model
+
+    @property
+    def transition_table(self) -> TransitionTable: return self._transition_table
+
+    @property
+    def accept_table(self) -> LazyAcceptTable: return self._accept_table
+
+    @property
+    def token_names(self) -> Tuple[str]: return self._token_names
+
+    @property
+    def charset_manager(self) -> CharSetManager: return self._model.charset_manager
+
+    @property
+    def keywords(self) -> Optional[LexerKeywords]: return self._keywords
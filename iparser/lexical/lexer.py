@@ -0,0 +1,329 @@
+from typing import *
+from abc import ABC, abstractmethod
+from array import array
+from iparser.lexical.acceleration import run_skippers, literal_jumps
+from iparser.lexical.charset import CharSetManager
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.fsa import FiniteStateMachine
+from iparser.lexical.transition_table import TransitionTable, DenseTransitionTable, ArrayTransitionTable, memory_report
+from iparser.lexical.token import ReTokenDefinitions, POP_MODE
+
+NO_ACTION = -1
+POP_ACTION = -2
+
+
+class LexerModes:
+    """
+        skip flags and mode actions of the tokens plus the dfa start state of every
+        mode, all modes share the transition table of their lexer.
+        actions[token] is NO_ACTION, POP_ACTION or the index of the mode to push
+    """
+    __slots__ = ('mode_names', 'start_states', 'actions', 'skips')
+
+    def __init__(self, mode_names: Sequence[str], start_states: Sequence[int], actions: Sequence[int], skips: Sequence[bool]) -> None:
+        self.mode_names: Tuple[str] = tuple(mode_names)
+        self.start_states: Tuple[int] = tuple(start_states)
+        self.actions: Tuple[int] = tuple(actions)
+        self.skips: Tuple[bool] = tuple(skips)
+
+    @staticmethod
+    def from_definitions(definitions: ReTokenDefinitions, start_states: Sequence[int]) -> Optional['LexerModes']:
+        """
+            None when every token is a plain token of the default mode
+        """
+        mode_names = definitions.modes()
+        mode_indexes = {name: index for index, name in enumerate(mode_names)}
+        actions, skips = [], []
+        for definition in definitions.definitions:
+            if definition.mode_action is None:
+                actions.append(NO_ACTION)
+            elif definition.mode_action == POP_MODE:
+                actions.append(POP_ACTION)
+            else:
+                actions.append(mode_indexes[definition.mode_action])
+            skips.append(definition.skip)
+        if len(mode_names) == 1 and not any(skips):
+            return None
+        return LexerModes(mode_names, start_states, actions, skips)
+
+    def mode_index(self, mode_name: str) -> int:
+        return self.mode_names.index(mode_name)
+
+
+class LexerKeywords:
+    """
+        keyword tables of the host tokens, tables[host] maps a lexeme of the host to
+        the keyword token it is reported as, None for tokens without keywords. the
+        tables are built once and never changed, a lookup is one dict probe.
+        the lexemes are str for char level lexers and utf-8 bytes for byte level ones
+    """
+    __slots__ = ('tables',)
+
+    def __init__(self, tables: Sequence[Optional[Mapping[AnyStr, int]]]) -> None:
+        self.tables: Tuple[Optional[Dict[AnyStr, int]]] = tuple(None if table is None else dict(table) for table in tables)
+
+    @staticmethod
+    def from_definitions(definitions: ReTokenDefinitions) -> Optional['LexerKeywords']:
+        """
+            None when no token has keywords. a keyword its host can not match would
+            never be reported, it is rejected
+        """
+        all_definitions = definitions.definitions
+        tables: List[Optional[Dict[str, int]]] = [None] * len(all_definitions)
+        for token_index, definition in enumerate(all_definitions):
+            if definition.host is None:
+                continue
+            if tables[definition.host] is None:
+                tables[definition.host] = {}
+            tables[definition.host][definition.keyword] = token_index
+        if not any(table is not None for table in tables):
+            return None
+        for host_index, table in enumerate(tables):
+            if table is None:
+                continue
+            host_nfa = FlatNFABuilder.from_expression(all_definitions[host_index].re)
+            for keyword in table:
+                if not host_nfa.accepts(keyword):
+                    raise ValueError(f"keyword {keyword!r} is not matched by token {all_definitions[host_index].name}, "
+                                     f"define it as a token of its own")
+        return LexerKeywords(tables)
+
+    def encode(self, encoding: str='utf-8') -> 'LexerKeywords':
+        """
+            the same tables keyed by the encoded lexemes, for byte level lexers
+        """
+        return LexerKeywords([None if table is None else {lexeme.encode(encoding): token_index for lexeme, token_index in table.items()}
+                              for table in self.tables])
+
+
+class ScanningLexer(ABC):
+    """
+        what the scanners read of a lexer: the transition and accept tables, the token
+        names, the char classes, the modes and the keyword tables. a CompiledLexer
+        holds a complete dfa, see iparser.lexical.lazy_dfa for one built while scanning
+    """
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def transition_table(self) -> TransitionTable: pass
+
+    @property
+    @abstractmethod
+    def accept_table(self) -> Sequence[int]: pass
+
+    @property
+    @abstractmethod
+    def token_names(self) -> Tuple[str]: pass
+
+    @property
+    @abstractmethod
+    def charset_manager(self) -> CharSetManager: pass
+
+    @property
+    def modes(self) -> Optional[LexerModes]:
+        """
+            None for a lexer with a single mode and no skipped tokens
+        """
+        return None
+
+    @property
+    def keywords(self) -> Optional[LexerKeywords]:
+        """
+            None for a lexer without keyword tables
+        """
+        return None
+
+    @property
+    def byte_level(self) -> bool:
+        """
+            whether the symbols are the bytes of utf-8 text instead of chars, see
+            iparser.lexical.utf8_lexer
+        """
+        return False
+
+    def run_skippers(self) -> Optional[List[Optional[Callable]]]:
+        """
+            per state re match method skipping the chars the state loops on, None when
+            the scanners have to step char by char
+        """
+        return None
+
+    def literal_jumps(self) -> Optional[List[Optional[Tuple[str, int]]]]:
+        """
+            per state (literal, target) of the literal every scan from the state has to
+            go on with, None when the scanners have to step char by char
+        """
+        return None
+
+    def reclassify(self, token_index: int, lexeme: AnyStr) -> int:
+        """
+            the keyword token a lexeme of token_index is reported as, or token_index
+        """
+        keywords = self.keywords
+        if keywords is None:
+            return token_index
+        table = keywords.tables[token_index]
+        return table.get(lexeme, token_index) if table is not None else token_index
+
+    def token_name(self, token_index: int) -> str:
+        return self.token_names[token_index]
+
+    def create_fsa(self) -> FiniteStateMachine:
+        """
+            the returned machine holds the per-input cursor state, tables are shared
+        """
+        return FiniteStateMachine(self.transition_table, self.accept_table, self.charset_manager)
+
+
+def expect_compiled(lexer: ScanningLexer, user: str):
+    """
+        the users of the complete dfa (encodings, serialization, code generation...)
+        reject the lexers that do not have one
+    """
+    if not isinstance(lexer, CompiledLexer):
+        raise TypeError(f"{user} needs a CompiledLexer with a complete dfa, not a {type(lexer).__name__}")
+
+
+class CompiledLexer(ScanningLexer):
+    """
+        immutable transition and accept tables compiled once from token definitions,
+        any number of scanners (also from different threads) can share one instance
+    """
+    __slots__ = ('_transition_table', '_accept_table', '_token_names', '_charset_manager', '_modes', '_keywords',
+                 '_byte_level', '_run_skippers', '_literal_jumps')
+
+    def __init__(self, transition_table, accept_table, token_names, charset_manager: CharSetManager=None,
+                 modes: LexerModes=None, keywords: LexerKeywords=None, byte_level: bool=False) -> None:
+        if not isinstance(transition_table, TransitionTable):
+            transition_table = DenseTransitionTable(transition_table)
+        self._transition_table = transition_table
+        self._accept_table: Sequence[int] = accept_table if isinstance(accept_table, array) else tuple(accept_table)
+        self._token_names: Tuple[str] = tuple(token_names)
+        self._charset_manager = charset_manager
+        self._modes = modes
+        self._keywords = keywords
+        self._byte_level = byte_level
+        self._run_skippers = None
+        self._literal_jumps = None
+
+    @staticmethod
+    def compile(definitions: ReTokenDefinitions, minimize: bool=True,
+                table_class: Type[TransitionTable]=DenseTransitionTable) -> 'CompiledLexer':
+        mode_starts: List[int] = []
+        nfa_model = FlatNFABuilder.from_definitions(definitions, mode_starts)
+        dfa_model = DFAModel(nfa_model, minimize=minimize, start_states=mode_starts[1:])
+        dfa_model.init()
+        dfa_model.release()
+        token_names = [definition.name for definition in definitions.definitions]
+        modes = LexerModes.from_definitions(definitions, dfa_model.start_state_indexes)
+        return CompiledLexer(table_class(dfa_model.transition_table), dfa_model.accept_table, token_names,
+                             dfa_model.charset_manager, modes, LexerKeywords.from_definitions(definitions))
+
+    def with_table_class(self, table_class: Type[TransitionTable]) -> 'CompiledLexer':
+        """
+            the same lexer with its transitions re-encoded by another table format
+        """
+        return CompiledLexer(table_class(self._transition_table.rows()), self._accept_table, self._token_names,
+                             self._charset_manager, self._modes, self._keywords, self._byte_level)
+
+    def freeze(self, table_class: Type[TransitionTable]=ArrayTransitionTable) -> 'CompiledLexer':
+        """
+            the same lexer for a long running process: dense rows of python ints are
+            packed by table_class and the accept table into an array of the smallest
+            signed item size, tables already packed are shared. see
+            iparser.lexical.memory.retained_size for what is left
+        """
+        table = self._transition_table
+        if isinstance(table, DenseTransitionTable):
+            table = table_class(table.rows())
+        token_num = len(self._token_names)
+        typecode = 'b' if token_num <= 0x7F else 'h' if token_num <= 0x7FFF else 'i'
+        return CompiledLexer(table, array(typecode, self._accept_table), self._token_names,
+                             self._charset_manager, self._modes, self._keywords, self._byte_level)
+
+    def max_backtrack(self) -> Optional[int]:
+        """
+            the most chars a scanner may read past the last accepting position before
+            the dfa dies and it rewinds, None when there is no bound because a cycle of
+            non accepting states is reachable from an accepting state
+        """
+        table = self._transition_table
+        accept_table = self._accept_table
+        successors = {}
+
+        def rejecting_successors(state: int) -> Set[int]:
+            if state not in successors:
+                successors[state] = {target for target in (table.next_state(state, symbol) for symbol in range(0, table.symbol_num))
+                                     if target and accept_table[target] == -1}
+            return successors[state]
+
+        # depth of a non accepting state: the number of non accepting states on the
+        # longest path starting at it, found by an iterative post order walk
+        depths: Dict[int, int] = {}
+        on_path: Set[int] = set()
+        result = 0
+        for state in range(1, table.state_num):
+            if accept_table[state] == -1:
+                continue
+            for root in rejecting_successors(state):
+                stack = [root]
+                while stack:
+                    current = stack[-1]
+                    if current in depths:
+                        stack.pop()
+                        continue
+                    on_path.add(current)
+                    pending = [target for target in rejecting_successors(current) if target not in depths]
+                    for target in pending:
+                        if target in on_path:
+                            return None
+                    if pending:
+                        stack.extend(pending)
+                        continue
+                    depths[current] = 1 + max((depths[target] for target in rejecting_successors(current)), default=0)
+                    on_path.discard(current)
+                    stack.pop()
+                result = max(result, depths[root])
+        return result
+
+    def run_skippers(self) -> List[Optional[Callable]]:
+        """
+            built on first use, see iparser.lexical.acceleration
+        """
+        if self._run_skippers is None:
+            self._run_skippers = run_skippers(self._transition_table, self._charset_manager)
+        return self._run_skippers
+
+    def literal_jumps(self) -> List[Optional[Tuple[str, int]]]:
+        """
+            built on first use, see iparser.lexical.acceleration
+        """
+        if self._literal_jumps is None:
+            self._literal_jumps = literal_jumps(self._transition_table, self._accept_table, self._charset_manager)
+        return self._literal_jumps
+
+    def memory_report(self) -> Dict[str, int]:
+        return memory_report(self._transition_table)
+
+    @property
+    def transition_table(self) -> TransitionTable: return self._transition_table
+
+    @property
+    def accept_table(self) -> Sequence[int]: return self._accept_table
+
+    @property
+    def token_names(self) -> Tuple[str]: return self._token_names
+
+    @property
+    def charset_manager(self) -> CharSetManager: return self._charset_manager
+
+    @property
+    def modes(self) -> Optional[LexerModes]: return self._modes
+
+    @property
+    def keywords(self) -> Optional[LexerKeywords]: return self._keywords
+
+    @property
+    def byte_level(self) -> bool: return self._byte_level
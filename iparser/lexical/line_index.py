@@ -0,0 +1,146 @@
+from typing import *
+from array import array
+from bisect import bisect_right
+import re
+
+NEWLINE = re.compile(b'\n')
+
+
+class LineIndex:
+    """
+        offsets of the line starts of a text, searched with bisect to turn a char
+        offset into a (line, column) pair, both counted from 0. over bytes like
+        sources (bytes, mmap) the offsets and columns count bytes.
+        the index is only built the first time a position is asked for
+    """
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+        self._line_starts: array = None
+
+    def _build(self) -> array:
+        line_starts = array('q', [0])
+        source = self._source
+        if hasattr(source, 'find'):
+            newline = '\n' if isinstance(source, str) else b'\n'
+            find = source.find
+            index = find(newline)
+            while index != -1:
+                line_starts.append(index + 1)
+                index = find(newline, index + 1)
+        else:
+            # a memoryview has no find, it is searched in place through the buffer protocol
+            line_starts.extend(match.end() for match in NEWLINE.finditer(source))
+        self._line_starts = line_starts
+        return line_starts
+
+    @property
+    def line_starts(self) -> array:
+        return self._line_starts if self._line_starts is not None else self._build()
+
+    def line_num(self) -> int:
+        return len(self.line_starts)
+
+    def line_column(self, offset: int) -> Tuple[int, int]:
+        line_starts = self.line_starts
+        line = bisect_right(line_starts, offset) - 1
+        return line, offset - line_starts[line]
+
+    def keep_from(self, offset: int):
+        """
+            the positions before offset are no longer asked for, an index of streamed
+            text may drop them
+        """
+        pass
+
+
+class StreamLineIndex(LineIndex):
+    """
+        line index of streamed text, which the reader drops chunk by chunk. only the
+        text of the chunks still in use is kept: the current one, the one before it and
+        the ones the token being scanned started in, see keep_from. each kept chunk
+        knows the number of lines before it and the start of the line it begins in, so
+        reading costs one str.count per chunk and the memory does not grow with the
+        input. the line starts of the kept chunks are indexed the first time a position
+        is asked for after a chunk came in, positions in dropped chunks are no longer
+        known
+    """
+
+    def __init__(self) -> None:
+        super().__init__(None)
+        self._line_count = 0
+        self._last_line_start = 0
+        # (offset, text, lines before it, start of the line it begins in) of the kept chunks
+        self._chunks: List[Tuple[int, str, int, int]] = []
+        self._keep_offset: Optional[int] = None
+        # line number of line_starts[0]
+        self._first_line = 0
+
+    def keep_from(self, offset: int):
+        """
+            the positions from offset on are still asked for, the chunks they lie in
+            are not dropped
+        """
+        self._keep_offset = offset
+
+    def add_chunk(self, chunk: str, offset: int):
+        """
+            record a chunk of streamed text starting at offset
+        """
+        chunks = self._chunks
+        chunks.append((offset, chunk, self._line_count, self._last_line_start))
+        # the first chunk is not needed once the next one starts before the kept offset
+        while len(chunks) > 2 and (self._keep_offset is None or chunks[1][0] <= self._keep_offset):
+            del chunks[0]
+        self._line_count += chunk.count('\n')
+        last_newline = chunk.rfind('\n')
+        if last_newline != -1:
+            self._last_line_start = offset + last_newline + 1
+        self._line_starts = None
+
+    def _build(self) -> array:
+        if not self._chunks:
+            self._first_line = 0
+            self._line_starts = array('q', [0])
+            return self._line_starts
+        _, _, self._first_line, line_start = self._chunks[0]
+        line_starts = array('q', [line_start])
+        for offset, text, _, _ in self._chunks:
+            find = text.find
+            index = find('\n')
+            while index != -1:
+                line_starts.append(offset + index + 1)
+                index = find('\n', index + 1)
+        self._line_starts = line_starts
+        return line_starts
+
+    @property
+    def line_starts(self) -> array:
+        """
+            the line starts of the kept chunks, the first one is line first_line
+        """
+        return self._line_starts if self._line_starts is not None else self._build()
+
+    @property
+    def first_line(self) -> int:
+        if self._line_starts is None:
+            self._build()
+        return self._first_line
+
+    @property
+    def first_offset(self) -> int:
+        """
+            offset of the first char whose position is still known
+        """
+        return self._chunks[0][0] if self._chunks else 0
+
+    def line_num(self) -> int:
+        return self._line_count + 1
+
+    def line_column(self, offset: int) -> Tuple[int, int]:
+        line_starts = self.line_starts
+        if offset < self.first_offset:
+            raise ValueError(f"offset {offset} lies in streamed text that was already dropped, "
+                             f"positions are known from offset {self.first_offset} on")
+        line = bisect_right(line_starts, offset) - 1
+        return self._first_line + line, offset - line_starts[line]
@@ -0,0 +1,37 @@
+from typing import *
+import gc
+import sys
+import types
+from iparser.lexical.lexer import expect_compiled
+
+# shared by every instance, never retained by one lexer
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.CodeType)
+
+
+def retained_size(*objects) -> int:
+    """
+        bytes of every object reachable from objects, each object counted once.
+        classes, modules and functions are shared by the whole process and not counted
+    """
+    seen: Set[int] = set()
+    wait_objects = list(objects)
+    size = 0
+    while wait_objects:
+        obj = wait_objects.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        wait_objects.extend(gc.get_referents(obj))
+    return size
+
+
+def freeze_report(lexer, *construction_objects) -> Tuple[Any, Tuple[int, int]]:
+    """
+        freeze lexer, returns the frozen lexer and (bytes retained by lexer and the
+        construction objects kept with it, bytes retained by the frozen lexer)
+    """
+    expect_compiled(lexer, "freezing")
+    before = retained_size(lexer, *construction_objects)
+    frozen = lexer.freeze()
+    return frozen, (before, retained_size(frozen))
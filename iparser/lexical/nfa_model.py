@@ -1,5 +1,6 @@
 from typing import *
 from collections import defaultdict
+from iparser.lexical.charset import CharSet
 
 
 class NFAState:
@@ -7,9 +8,9 @@ class NFAState:
         self._token_index = token_index
         self._out_edges: List[NFAEdge] = []
         self.state_index = -1
-        self.linked_state_lookup: Dict[int, List[NFAState]] = defaultdict(list)
+        self.linked_state_lookup: Dict[CharSet, List[NFAState]] = defaultdict(list)
 
-    def valid_inputs(self) -> Set[int]: return set(self.linked_state_lookup.keys())
+    def valid_inputs(self) -> Set[CharSet]: return set(self.linked_state_lookup.keys())
         
     @property
     def out_edges(self) -> List['NFAEdge']: return self._out_edges
@@ -22,7 +23,7 @@ class NFAState:
         self.linked_state_lookup[edge.symbol].append(edge.linked_state)
         self._out_edges.append(edge)
 
-    def move_to(self, symbol: int, state: 'NFAState'):
+    def move_to(self, symbol: CharSet, state: 'NFAState'):
         self.add_edge(NFAEdge(symbol, state))
 
     def epsilon_move_to(self, state: 'NFAState'):
@@ -43,12 +44,12 @@ class NFAState:
 
 
 class NFAEdge:
-    def __init__(self, symbol: int=None, state: NFAState=None) -> None:
+    def __init__(self, symbol: CharSet=None, state: NFAState=None) -> None:
         self._symbol = symbol
         self._linked_state = state
 
     @property
-    def symbol(self) -> int: return self._symbol
+    def symbol(self) -> CharSet: return self._symbol
 
     @property
     def linked_state(self) -> NFAState: return self._linked_state
@@ -2,12 +2,13 @@ from iparser.lexical.regular_expression import BaseRegularExpression, \
     ConcatRegularExpressionOp, OrRegularExpressionOp, \
     BatchOrRegularExpression, StarRegularExpressionOp
 from iparser.lexical.nfa_model import NFAState, NFAModel
+from iparser.lexical.charset import CharSet
 
 
 class NFAModelConverter:
 
     def _char_to_index(self, char):
-        return ord(char) if char else None
+        return CharSet.of_char(ord(char)) if char else None
 
     def convert_base_expression(self, expression: BaseRegularExpression):
         init_state = NFAState()
@@ -17,29 +18,26 @@ class NFAModelConverter:
         return model
 
     def convert_or_expression(self, expression: OrRegularExpressionOp) -> NFAModel:
-        left_model = expression.left.to_nfa_model(self)
-        right_model = expression.right.to_nfa_model(self)
+        models = [operand.to_nfa_model(self) for operand in expression.get_operands()]
 
         init_state = NFAState()
-        init_state.epsilon_move_to(left_model.init_state)
-        init_state.epsilon_move_to(right_model.init_state)
-
         tail_state = NFAState()
-        left_model.tail_state.epsilon_move_to(tail_state)
-        right_model.tail_state.epsilon_move_to(tail_state)
+        for model in models:
+            init_state.epsilon_move_to(model.init_state)
+            model.tail_state.epsilon_move_to(tail_state)
 
         new_model = NFAModel(init_state, tail_state)
-        new_model.add_state(*left_model.states)
-        new_model.add_state(*right_model.states)
+        for model in models:
+            new_model.add_state(*model.states)
         return new_model
     
     def convert_concat_expression(self, expression: ConcatRegularExpressionOp) -> NFAModel:
-        left_model = expression.left.to_nfa_model(self)
-        right_model = expression.right.to_nfa_model(self)
-        new_model = NFAModel(left_model.init_state, right_model.tail_state)
-        left_model.tail_state.epsilon_move_to(right_model.init_state)
-        new_model.add_state(*left_model.states)
-        new_model.add_state(*right_model.states)
+        models = [operand.to_nfa_model(self) for operand in expression.get_operands()]
+        for left_model, right_model in zip(models, models[1:]):
+            left_model.tail_state.epsilon_move_to(right_model.init_state)
+        new_model = NFAModel(models[0].init_state, models[-1].tail_state)
+        for model in models:
+            new_model.add_state(*model.states)
         return new_model
     
     def convert_star_expression(self, expression: StarRegularExpressionOp):
@@ -58,11 +56,7 @@ class NFAModelConverter:
         init_state = NFAState()
         tail_state = NFAState()
         model = NFAModel(init_state, tail_state)
-        for char in expression.get_match_chars():
-            target_state = NFAState()
-            target_state.epsilon_move_to(tail_state)
-            init_state.move_to(self._char_to_index(char), target_state)
-            model.add_state(target_state)
+        init_state.move_to(expression.get_char_set(), tail_state)
         return model
 
     def convert_literal_expression(self, expression: BatchOrRegularExpression):
@@ -0,0 +1,186 @@
+from typing import *
+from array import array
+from bisect import bisect_left
+import mmap
+import multiprocessing
+import os
+import shutil
+import tempfile
+import weakref
+from iparser.lexical import serialization
+from iparser.lexical.lexer import CompiledLexer, expect_compiled
+from iparser.lexical.line_index import LineIndex
+from iparser.lexical.token import TokenBuffer
+from iparser.lexical.utf8_lexer import ByteScanner, Utf8DFALowering
+
+# per worker process: the ByteScanner over the mapped input file, the tables of its
+# lexer are in the mapped lexer file
+_worker = None
+
+
+def _open_mmap(path: str):
+    with open(path, 'rb') as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file can not be mapped
+            return b''
+
+
+def _init_worker(lexer_path: str, input_path: str):
+    global _worker
+    lexer = serialization.load(lexer_path, use_mmap=True)
+    buffer = _open_mmap(input_path)
+    _worker = ByteScanner(buffer, lexer)
+
+
+def _lex_chunk(start: int, limit: int) -> Tuple[bytes, bytes, bytes, int]:
+    """
+        lex speculatively from start, assuming a token begins there, until a token
+        starts at or after limit. returns the three token columns and the offset the
+        lexing failed at, or -1
+    """
+    kinds, starts, ends = array('i'), array('q'), array('q')
+    error_at = -1
+    position = start
+    try:
+        for token_index, token_start, token_end in _worker.token_spans(start, keep_skipped=True):
+            if token_start >= limit:
+                break
+            kinds.append(token_index)
+            starts.append(token_start)
+            ends.append(token_end)
+            position = token_end
+    except Exception:
+        error_at = position
+    return kinds.tobytes(), starts.tobytes(), ends.tobytes(), error_at
+
+
+class ParallelScanner:
+    """
+        tokenize a large UTF-8 file in a process pool. the file is split into chunks
+        and every worker lexes its chunk assuming a token starts at the chunk start,
+        the chunk results are stitched where their token starts line up with the end
+        of the tokens already accepted, the gaps in between are re-lexed sequentially.
+        the output is exactly the one of ByteScanner over the whole file.
+        the lexer is written to a temporary file on the first parallel scan and reused
+        by the later ones until close, the workers map it read only, so the tables are
+        shared by all processes instead of being pickled per task
+    """
+
+    DEFAULT_CHUNK_SIZE = 1 << 22
+
+    def __init__(self, lexer: CompiledLexer, processes: int=None, chunk_size: int=DEFAULT_CHUNK_SIZE) -> None:
+        expect_compiled(lexer, "parallel scanning")
+        if lexer.modes is not None and len(lexer.modes.mode_names) > 1:
+            raise ValueError("chunks can not be lexed speculatively with lexer modes, use ByteScanner")
+        if not lexer.byte_level:
+            lexer = Utf8DFALowering.lower(lexer)
+        if chunk_size < 1:
+            raise ValueError("chunk size must be positive")
+        self._lexer = lexer
+        self._processes = processes or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._lexer_path: str = None
+        # removes the directory of the lexer file, also when the scanner is collected
+        self._remove_lexer_file: weakref.finalize = None
+
+    @property
+    def lexer(self) -> CompiledLexer: return self._lexer
+
+    def _lexer_file(self) -> str:
+        if self._lexer_path is None:
+            directory = tempfile.mkdtemp(prefix='iparser-')
+            self._remove_lexer_file = weakref.finalize(self, shutil.rmtree, directory, True)
+            lexer_path = os.path.join(directory, 'lexer.ilxr')
+            serialization.dump(self._lexer, lexer_path)
+            self._lexer_path = lexer_path
+        return self._lexer_path
+
+    def close(self) -> None:
+        """
+            remove the lexer file, a later parallel scan writes it again
+        """
+        if self._remove_lexer_file is not None:
+            self._remove_lexer_file()
+            self._lexer_path, self._remove_lexer_file = None, None
+
+    def __enter__(self) -> 'ParallelScanner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _chunk_starts(buffer, chunk_size: int) -> List[int]:
+        """
+            chunk boundaries moved forward to the next char boundary
+        """
+        starts = [0]
+        length = len(buffer)
+        position = chunk_size
+        while position < length:
+            while position < length and 0x80 <= buffer[position] < 0xC0:
+                position += 1
+            if position < length and position > starts[-1]:
+                starts.append(position)
+            position = max(position, starts[-1]) + chunk_size
+        return starts
+
+    def token_buffer(self, path: str) -> TokenBuffer:
+        """
+            all tokens of the file as byte offsets, the values are sliced from a
+            mapping of the file which stays open as the source of the buffer
+        """
+        buffer = _open_mmap(path)
+        starts = self._chunk_starts(buffer, self._chunk_size)
+        limits = starts[1:] + [len(buffer)]
+        if len(starts) == 1 or self._processes == 1:
+            return ByteScanner(buffer, self._lexer).token_buffer()
+        with multiprocessing.Pool(self._processes, _init_worker, (self._lexer_file(), path)) as pool:
+            chunks = pool.starmap(_lex_chunk, zip(starts, limits))
+        return self._drop_skipped(self._stitch(buffer, chunks, limits))
+
+    def _drop_skipped(self, tokens: TokenBuffer) -> TokenBuffer:
+        """
+            skipped tokens are kept while stitching, their ends are token boundaries
+        """
+        modes = self._lexer.modes
+        if modes is None or not any(modes.skips):
+            return tokens
+        result = TokenBuffer(tokens.token_names, tokens.source, LineIndex(tokens.source))
+        skips = modes.skips
+        for token_index, start, end in zip(tokens.kinds, tokens.starts, tokens.ends):
+            if not skips[token_index]:
+                result.append(token_index, start, end)
+        return result
+
+    def _stitch(self, buffer, chunks: List[Tuple[bytes, bytes, bytes, int]], limits: List[int]) -> TokenBuffer:
+        result = TokenBuffer(self._lexer.token_names, buffer, LineIndex(buffer))
+        scanner = ByteScanner(buffer, self._lexer)
+        position = 0
+        spans = None
+        for (kinds_data, starts_data, ends_data, error_at), limit in zip(chunks, limits):
+            kinds, starts, ends = array('i'), array('q'), array('q')
+            kinds.frombytes(kinds_data)
+            starts.frombytes(starts_data)
+            ends.frombytes(ends_data)
+            while position < limit:
+                index = bisect_left(starts, position)
+                if index < len(starts) and starts[index] == position:
+                    # in sync with the speculative result, take the rest of the chunk
+                    result.kinds.extend(kinds[index:])
+                    result.starts.extend(starts[index:])
+                    result.ends.extend(ends[index:])
+                    position = ends[-1] if error_at == -1 else max(ends[-1], error_at)
+                    spans = None
+                    if error_at == -1:
+                        break
+                    # the speculation failed on the real token boundaries, lex
+                    # sequentially to raise the genuine error
+                if spans is None:
+                    spans = scanner.token_spans(position, keep_skipped=True)
+                token_index, token_start, token_end = next(spans)
+                result.append(token_index, token_start, token_end)
+                position = token_end
+        return result
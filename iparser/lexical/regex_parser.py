@@ -0,0 +1,294 @@
+from typing import *
+from iparser.lexical.charset import CharSet
+from iparser.lexical.regular_expression import RegularExpression, RE, BaseRegularExpression, \
+    EmptyRegularExpression, CharSetRegularExpression, LiteralRegularExpression, \
+    ConcatRegularExpressionOp, OrRegularExpressionOp, StarRegularExpressionOp
+from iparser.lexical.unicode_properties import unicode_property
+
+DIGIT = CharSet.of_range(ord('0'), ord('9'))
+WORD = CharSet([(ord('a'), ord('z')), (ord('A'), ord('Z')), (ord('0'), ord('9')), (ord('_'), ord('_'))])
+SPACE = CharSet.of_chars(ord(char) for char in ' \t\n\r\f\v')
+# the class escapes are ascii only, use \p{..} for the unicode classes
+CLASS_ESCAPES = {'d': DIGIT, 'w': WORD, 's': SPACE}
+CHAR_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', '0': '\0'}
+METACHARS = frozenset('\\^$.|?*+()[]{}')
+
+
+class RegexParser:
+    """
+        parse regex strings into RegularExpression trees with the usual syntax:
+        alternation |, groups ( ) and (?: ), classes [a-z_] and [^...], the quantifiers
+        * + ? {m} {m,} {m,n}, the escapes \\n \\t \\xHH \\uHHHH \\U00HHHHHH \\x{H..},
+        \\d \\w \\s and their complements \\D \\W \\S, unicode properties \\p{L} \\P{Lu}
+        \\p{Greek} \\p{Script=Han}, see unicode_property, and . for any char except a line feed.
+        every tree a parser builds is hash consed: structurally equal subexpressions of
+        all patterns given to the same parser are one object, so shared classes are
+        parsed once and the nfa builder converts them once, see FlatNFABuilder.convert.
+        anchors, backreferences and lazy quantifiers have no meaning for a longest
+        match lexer and are rejected
+    """
+
+    def __init__(self) -> None:
+        # structural key -> the one expression with that structure, the keys of
+        # composite expressions hold the ids of their interned operands
+        self._expressions: Dict[tuple, RegularExpression] = {}
+        self._patterns: Dict[str, RegularExpression] = {}
+        self._pattern = ''
+        self._position = 0
+
+    def parse(self, pattern: str) -> RegularExpression:
+        expression = self._patterns.get(pattern)
+        if expression is None:
+            self._pattern, self._position = pattern, 0
+            expression = self._parse_alternation()
+            if self._position < len(pattern):
+                self._error("unbalanced )")
+            self._patterns[pattern] = expression
+        return expression
+
+    def _intern(self, key: tuple, factory: Callable[[], RegularExpression]) -> RegularExpression:
+        expression = self._expressions.get(key)
+        if expression is None:
+            expression = self._expressions[key] = factory()
+        return expression
+
+    def char(self, char: str) -> RegularExpression:
+        return self._intern(('char', char), lambda: BaseRegularExpression(char))
+
+    def char_set(self, char_set: CharSet) -> RegularExpression:
+        if len(char_set.intervals) == 1 and char_set.intervals[0][0] == char_set.intervals[0][1]:
+            return self.char(chr(char_set.intervals[0][0]))
+        return self._intern(('set', char_set), lambda: CharSetRegularExpression(char_set))
+
+    def literal(self, chars: str) -> RegularExpression:
+        if len(chars) == 1:
+            return self.char(chars)
+        return self._intern(('literal', chars), lambda: LiteralRegularExpression(chars))
+
+    def concat(self, left: RegularExpression, right: RegularExpression) -> RegularExpression:
+        if isinstance(left, EmptyRegularExpression):
+            return right
+        if isinstance(right, EmptyRegularExpression):
+            return left
+        return self._intern(('concat', id(left), id(right)), lambda: ConcatRegularExpressionOp(left, right))
+
+    def union(self, left: RegularExpression, right: RegularExpression) -> RegularExpression:
+        if left is right:
+            return left
+        return self._intern(('or', id(left), id(right)), lambda: OrRegularExpressionOp(left, right))
+
+    def star(self, inner: RegularExpression) -> RegularExpression:
+        if isinstance(inner, (StarRegularExpressionOp, EmptyRegularExpression)):
+            return inner
+        return self._intern(('star', id(inner)), lambda: StarRegularExpressionOp(inner))
+
+    def sequence(self, expressions: Sequence[RegularExpression]) -> RegularExpression:
+        """
+            the concatenation of expressions, runs of single chars become one literal
+        """
+        merged: List[RegularExpression] = []
+        chars: List[str] = []
+        for expression in expressions:
+            if type(expression) is BaseRegularExpression:
+                chars.append(expression.get_match_char())
+                continue
+            if chars:
+                merged.append(self.literal(''.join(chars)))
+                chars = []
+            merged.append(expression)
+        if chars:
+            merged.append(self.literal(''.join(chars)))
+        result = RE.EMPTY
+        for expression in merged:
+            result = self.concat(result, expression)
+        return result
+
+    def repeat(self, inner: RegularExpression, minimum: int, maximum: Optional[int]) -> RegularExpression:
+        """
+            inner repeated minimum to maximum times, maximum None for no upper bound
+        """
+        parts = [inner] * minimum
+        if maximum is None:
+            parts.append(self.star(inner))
+        else:
+            parts.extend([self.union(inner, RE.EMPTY)] * (maximum - minimum))
+        return self.sequence(parts)
+
+    def _error(self, message: str):
+        raise ValueError(f"{message} at position {self._position} of regex {self._pattern!r}")
+
+    def _peek(self) -> Optional[str]:
+        return self._pattern[self._position] if self._position < len(self._pattern) else None
+
+    def _next(self) -> str:
+        char = self._peek()
+        if char is None:
+            self._error("unexpected end")
+        self._position += 1
+        return char
+
+    def _parse_alternation(self) -> RegularExpression:
+        expression = self._parse_sequence()
+        while self._peek() == '|':
+            self._position += 1
+            expression = self.union(expression, self._parse_sequence())
+        return expression
+
+    def _parse_sequence(self) -> RegularExpression:
+        expressions = []
+        while self._peek() not in (None, '|', ')'):
+            expressions.append(self._parse_repeat())
+        return self.sequence(expressions)
+
+    def _parse_repeat(self) -> RegularExpression:
+        expression = self._parse_atom()
+        char = self._peek()
+        if char == '*':
+            self._position += 1
+            expression = self.star(expression)
+        elif char == '+':
+            self._position += 1
+            expression = self.repeat(expression, 1, None)
+        elif char == '?':
+            self._position += 1
+            expression = self.union(expression, RE.EMPTY)
+        elif char == '{':
+            bounds = self._parse_bounds()
+            if bounds is None:
+                return expression
+            expression = self.repeat(expression, *bounds)
+        else:
+            return expression
+        if self._peek() == '?':
+            self._error("lazy quantifiers are not supported, tokens always take the longest match")
+        if self._peek() in ('*', '+', '{') and (self._peek() != '{' or self._bounds_follow()):
+            self._error("multiple repeat")
+        return expression
+
+    def _bounds_follow(self) -> bool:
+        position = self._position
+        try:
+            return self._parse_bounds() is not None
+        finally:
+            self._position = position
+
+    def _parse_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        """
+            {m}, {m,}, {,n} or {m,n} at the current position, None (and nothing
+            consumed) when the brace does not start a quantifier, like python re
+        """
+        end = self._pattern.find('}', self._position)
+        if end == -1:
+            return None
+        body = self._pattern[self._position + 1:end]
+        minimum, comma, maximum = body.partition(',')
+        if not (minimum.isdigit() or (comma and maximum)) or (maximum and not maximum.isdigit()):
+            return None
+        self._position = end + 1
+        minimum = int(minimum) if minimum else 0
+        maximum = int(maximum) if maximum else (None if comma else minimum)
+        if maximum is not None and maximum < minimum:
+            self._error("min repeat greater than max repeat")
+        return minimum, maximum
+
+    def _parse_atom(self) -> RegularExpression:
+        char = self._next()
+        if char == '(':
+            if self._pattern.startswith('?:', self._position):
+                self._position += 2
+            elif self._peek() == '?':
+                self._error("only non capturing groups (?:...) are supported")
+            expression = self._parse_alternation()
+            if self._peek() != ')':
+                self._error("missing )")
+            self._position += 1
+            return expression
+        if char == '[':
+            return self.char_set(self._parse_class())
+        if char == '.':
+            return self.char_set(CharSet.of_char(ord('\n')).complement())
+        if char == '\\':
+            escaped = self._parse_escape()
+            return self.char_set(escaped) if isinstance(escaped, CharSet) else self.char(escaped)
+        if char in ('^', '$'):
+            self._error("anchors are not supported")
+        if char in METACHARS and char not in ('{', '}', ']'):
+            self._error("nothing to repeat" if char in '*+?' else f"unexpected {char}")
+        return self.char(char)
+
+    def _parse_class(self) -> CharSet:
+        negated = self._peek() == '^'
+        if negated:
+            self._position += 1
+        intervals: List[Tuple[int, int]] = []
+        first = True
+        while True:
+            char = self._next()
+            if char == ']' and not first:
+                break
+            first = False
+            if char == '\\':
+                escaped = self._parse_escape()
+                if isinstance(escaped, CharSet):
+                    intervals.extend(escaped.intervals)
+                    continue
+                char = escaped
+            if self._peek() == '-' and self._pattern[self._position + 1:self._position + 2] not in ('', ']'):
+                self._position += 1
+                end = self._next()
+                if end == '\\':
+                    end = self._parse_escape()
+                    if isinstance(end, CharSet):
+                        self._error("a class can not end a range")
+                if ord(end) < ord(char):
+                    self._error(f"bad range {char}-{end}")
+                intervals.append((ord(char), ord(end)))
+            else:
+                intervals.append((ord(char), ord(char)))
+        char_set = CharSet(intervals)
+        return char_set.complement() if negated else char_set
+
+    def _parse_escape(self) -> Union[str, CharSet]:
+        """
+            the char or the class of the escape after a backslash
+        """
+        char = self._next()
+        if char in CHAR_ESCAPES:
+            return CHAR_ESCAPES[char]
+        if char.lower() in CLASS_ESCAPES:
+            char_set = CLASS_ESCAPES[char.lower()]
+            return char_set.complement() if char.isupper() else char_set
+        if char in ('p', 'P'):
+            if self._peek() == '{':
+                end = self._pattern.find('}', self._position)
+                if end == -1:
+                    self._error("missing } of unicode property")
+                name = self._pattern[self._position + 1:end]
+                self._position = end + 1
+            else:
+                name = self._next()
+            try:
+                char_set = unicode_property(name)
+            except ValueError as error:
+                self._error(str(error))
+            return char_set.complement() if char == 'P' else char_set
+        if char in ('x', 'u', 'U'):
+            if char == 'x' and self._peek() == '{':
+                end = self._pattern.find('}', self._position)
+                if end == -1:
+                    self._error("missing } of \\x{...}")
+                digits = self._pattern[self._position + 1:end]
+                self._position = end + 1
+            else:
+                length = {'x': 2, 'u': 4, 'U': 8}[char]
+                digits = self._pattern[self._position:self._position + length]
+                self._position += length
+                if len(digits) != length:
+                    digits = ''
+            try:
+                return chr(int(digits, 16))
+            except ValueError:
+                self._error(f"bad escape \\{char}")
+        if char.isalnum():
+            self._error(f"bad escape \\{char}")
+        return char
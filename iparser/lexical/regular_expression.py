@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import *
+from iparser.lexical.charset import CharSet, MAX_CHAR
+from iparser.lexical import unicode_properties
+import functools
+import hashlib
 import sys
+import types
+import weakref
 
 class RegularExpression(ABC):
 
@@ -9,6 +15,14 @@ class RegularExpression(ABC):
     def get_expression_string(self) -> AnyStr: 
         return self.get_inner_expression().get_expression_string()
 
+    def get_fingerprint(self) -> str:
+        """
+            structural description of the expression, equal fingerprints always produce
+            equal automatons. unlike the expression string it never needs to evaluate
+            predicates
+        """
+        return f"{type(self).__name__}({self.get_expression_string()!r})"
+
     def concat(self, other: 'RegularExpression'):
         return ConcatRegularExpressionOp(self, other)
 
@@ -78,6 +92,25 @@ class BiRegularExpressionOp(RegularExpression):
     @property
     def right(self): return self._right
 
+    def get_operands(self) -> List[RegularExpression]:
+        """
+            operands of a chain of the same operation such as a + b + c, collected with
+            an explicit stack so long chains never hit the recursion limit
+        """
+        operands = []
+        wait_expressions: List[RegularExpression] = [self]
+        while wait_expressions:
+            expression = wait_expressions.pop()
+            if type(expression) is type(self):
+                wait_expressions.append(expression.right)
+                wait_expressions.append(expression.left)
+            else:
+                operands.append(expression)
+        return operands
+
+    def get_fingerprint(self) -> str:
+        return f"{type(self).__name__}({','.join(operand.get_fingerprint() for operand in self.get_operands())})"
+
 
 class OrRegularExpressionOp(BiRegularExpressionOp):
     def __init__(self, left, right) -> None:
@@ -112,6 +145,12 @@ class BatchOrRegularExpression(BatchRegularExpression):
     def __init__(self, chars) -> None:
         super().__init__(chars)
 
+    def get_char_set(self) -> CharSet:
+        return CharSet.of_chars(ord(char) for char in self._chars)
+
+    def get_fingerprint(self) -> str:
+        return f"CharSet{self.get_char_set().intervals}"
+
     def to_nfa_model(self, converter):
         return converter.convert_batch_or_expression(self)
     
@@ -120,13 +159,33 @@ class BatchOrRegularExpression(BatchRegularExpression):
 
 class RangeRegularExpression(BatchOrRegularExpression):
     def __init__(self, left, right) -> None:
-        super().__init__([chr(index) for index in range(ord(left), ord(right) + 1)])
+        super().__init__(())
         self._left = left
         self._right = right
 
+    def get_match_chars(self):
+        yield from (chr(index) for index in range(ord(self._left), ord(self._right) + 1))
+
+    def get_char_set(self) -> CharSet:
+        return CharSet.of_range(ord(self._left), ord(self._right))
+
     def get_expression_string(self) -> AnyStr:
         return f"[{self._left}, {self._right}]"
 
+class CharSetRegularExpression(BatchOrRegularExpression):
+    def __init__(self, char_set: CharSet) -> None:
+        super().__init__(())
+        self._char_set = char_set
+
+    def get_match_chars(self):
+        yield from (chr(index) for index in self._char_set)
+
+    def get_char_set(self) -> CharSet:
+        return self._char_set
+
+    def get_expression_string(self) -> AnyStr:
+        return '[' + ''.join(chr(start) if start == end else f"{chr(start)}-{chr(end)}" for start, end in self._char_set.intervals) + ']'
+
 class LiteralRegularExpression(BatchRegularExpression):
     def __init__(self, chars) -> None:
         super().__init__(chars)
@@ -146,24 +205,122 @@ class StarRegularExpressionOp(RegularExpression):
 
     def get_expression_string(self) -> AnyStr:
         return f"({self._inner.get_expression_string()})*"
+
+    def get_fingerprint(self) -> str:
+        return f"Star({self._inner.get_fingerprint()})"
     
     def to_nfa_model(self, converter):
         return converter.convert_star_expression(self)
 
+
+def _describe(value, seen: Set[int]) -> str:
+    """
+        a description of value that is equal across processes exactly when the values
+        behave the same, functions are described by their code together with the
+        defaults, closure cells and globals it uses. raises ValueError for values
+        with no such description
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if id(value) in seen:
+        # a recursive function or a container holding itself
+        return '<recursive>'
+    seen = seen | {id(value)}
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({','.join(_describe(item, seen) for item in value)})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({','.join(sorted(_describe(item, seen) for item in value))})"
+    if isinstance(value, dict):
+        items = sorted(f"{_describe(key, seen)}:{_describe(item, seen)}" for key, item in value.items())
+        return f"dict({','.join(items)})"
+    if isinstance(value, CharSet):
+        return f"CharSet{value.intervals}"
+    if isinstance(value, types.ModuleType):
+        return f"module {value.__name__}"
+    if isinstance(value, type):
+        return f"class {value.__module__}.{value.__qualname__}"
+    if isinstance(value, types.CodeType):
+        consts = ','.join(_describe(const, seen) for const in value.co_consts)
+        return f"code {value.co_name}:{value.co_code.hex()}:{value.co_names}:{consts}"
+    if isinstance(value, types.FunctionType):
+        code = value.__code__
+        globals_used = {}
+        wait_codes = [code]
+        while wait_codes:
+            inner_code = wait_codes.pop()
+            for name in inner_code.co_names:
+                if name in value.__globals__:
+                    globals_used[name] = value.__globals__[name]
+            wait_codes.extend(const for const in inner_code.co_consts if isinstance(const, types.CodeType))
+        cells = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        return f"function {value.__module__}.{value.__qualname__}({_describe(code, seen)};" \
+               f"{_describe(value.__defaults__, seen)};{_describe(value.__kwdefaults__, seen)};" \
+               f"{_describe(cells, seen)};{_describe(globals_used, seen)})"
+    if isinstance(value, functools.partial):
+        return f"partial({_describe(value.func, seen)};{_describe(value.args, seen)};{_describe(value.keywords, seen)})"
+    if isinstance(value, (types.BuiltinFunctionType, types.MethodType, types.MethodWrapperType,
+                          types.MethodDescriptorType, types.WrapperDescriptorType)):
+        owner = getattr(value, '__self__', None)
+        if owner is None or isinstance(owner, types.ModuleType):
+            owner = getattr(value, '__objclass__', owner)
+        return f"callable {getattr(value, '__module__', None)}.{value.__qualname__}({_describe(owner, seen)})"
+    raise ValueError(f"{value!r} has no stable description")
+
+
+# predicate -> {max char: the chars it accepts}, a predicate is swept once per process
+# however many expressions use it. the keys are weak, an entry goes with its predicate
+_predicate_char_sets = weakref.WeakKeyDictionary()
+
+
+def _predicate_char_set(predictor: Callable[[str], bool], max_char: int) -> CharSet:
+    try:
+        char_sets = _predicate_char_sets.setdefault(predictor, {})
+    except TypeError:
+        # not weakly referable (str.isalpha...), swept for every expression using it
+        return CharSet.from_predicate(predictor, max_char)
+    char_set = char_sets.get(max_char)
+    if char_set is None:
+        char_set = char_sets[max_char] = CharSet.from_predicate(predictor, max_char)
+    return char_set
+
+
 class FunctionRegularExpression(RegularExpression):
-    def __init__(self, predictor) -> None:
+    def __init__(self, predictor, key: str=None, max_char: int=MAX_CHAR) -> None:
         super().__init__()
         self._predictor = predictor
-        all_chars = (chr(i) for i in range(0, 65535 + 1))
-        accepted_chars = (char for char in all_chars if self._predictor(char))
-        self._inner_expression = BatchOrRegularExpression(accepted_chars)
+        self._key = key
+        self._max_char = max_char
+        self._inner_expression: CharSetRegularExpression = None
+
+    def _get_inner_char_set_expression(self) -> 'CharSetRegularExpression':
+        # the predicate sweep is deferred until the automaton is really needed
+        if self._inner_expression is None:
+            self._inner_expression = CharSetRegularExpression(_predicate_char_set(self._predictor, self._max_char))
+        return self._inner_expression
     
     def to_nfa_model(self, converter):
-        return converter.convert_batch_or_expression(self._inner_expression)
+        return converter.convert_batch_or_expression(self._get_inner_char_set_expression())
 
     def get_expression_string(self) -> AnyStr:
         return "by function"
 
+    def get_fingerprint(self) -> str:
+        """
+            the key given to RE.cal_by, or a digest of everything the predicate runs:
+            its code, defaults, closure cells and the globals it reads. raises
+            ValueError when one of them has no stable description
+        """
+        # the range is part of the structure, predicates were swept over the bmp only before
+        if self._key is not None:
+            return f"Function[0-{self._max_char:x}](key={self._key!r})"
+        try:
+            description = _describe(self._predictor, set())
+        except ValueError as error:
+            raise ValueError(f"predicate {self._predictor!r} has no stable fingerprint, "
+                             f"give RE.cal_by a key: {error}") from None
+        digest = hashlib.sha256(description.encode('utf-8')).hexdigest()
+        return f"Function[0-{self._max_char:x}]({digest})"
+
 
 class RE:
     EMPTY = EmptyRegularExpression()
@@ -180,10 +337,45 @@ class RE:
     def range(start, end) -> RegularExpression:
         return RangeRegularExpression(start, end)
 
+    @staticmethod
+    def char_set(char_set: CharSet) -> RegularExpression:
+        return CharSetRegularExpression(char_set)
+
+    @staticmethod
+    def any_except(*chars) -> RegularExpression:
+        return CharSetRegularExpression(CharSet.of_chars(ord(char) for char in chars).complement())
+
     @staticmethod
     def literal(string) -> RegularExpression:
         return LiteralRegularExpression(string)
 
     @staticmethod
-    def cal_by(predictor) -> RegularExpression:
-        return FunctionRegularExpression(predictor)
\ No newline at end of file
+    def cal_by(predictor, key: str=None, max_char: int=MAX_CHAR) -> RegularExpression:
+        """
+            the chars up to max_char the predictor accepts, prefer category and script for
+            the unicode classes, they are precomputed instead of swept. a sweep of the
+            whole code space calls the predictor 1.1M times, max_char=0xFFFF limits it
+            to the bmp. key names the chars for the lexer cache, it is needed when the
+            predicate depends on values that can not be fingerprinted
+        """
+        return FunctionRegularExpression(predictor, key, max_char)
+
+    @staticmethod
+    def category(*names: str) -> RegularExpression:
+        """
+            the chars of the unicode general categories, such as 'L', 'Lu' or 'Letter'
+        """
+        char_set = CharSet()
+        for name in names:
+            char_set = char_set | unicode_properties.general_category(name)
+        return CharSetRegularExpression(char_set)
+
+    @staticmethod
+    def script(*names: str) -> RegularExpression:
+        """
+            the chars of the unicode scripts, such as 'Greek' or 'Han'
+        """
+        char_set = CharSet()
+        for name in names:
+            char_set = char_set | unicode_properties.script(name)
+        return CharSetRegularExpression(char_set)
\ No newline at end of file
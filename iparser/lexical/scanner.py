@@ -1,11 +1,9 @@
-from iparser.lexical.charset import CharSetManager
-from iparser.lexical.nfa_model import NFAModel, NFAState
-from iparser.lexical.regular_expression import RE
-from iparser.lexical.token import ReTokenDefinitions, Token
+from iparser.lexical.token import ReTokenDefinitions, Token, TokenBuffer, DEFAULT_MODE
 from abc import ABC, abstractmethod
-from typing import AnyStr, Iterable, Tuple
-from iparser.lexical.dfa_model import DFAModel
-from iparser.lexical.fsa import FiniteStateMachine
+from typing import AnyStr, Iterable, Tuple, Union
+from iparser.lexical.lexer import CompiledLexer, ScanningLexer, NO_ACTION, POP_ACTION
+from iparser.lexical.line_index import LineIndex
+from iparser.lexical.acceleration import longest_matcher
 
 class Reader(ABC):
     EOF = -1
@@ -16,7 +14,21 @@ class Reader(ABC):
     def peek(self) -> AnyStr: pass
 
     @abstractmethod
-    def position(self) -> Tuple[int, int]: pass
+    def offset(self) -> int:
+        """
+            number of chars read so far
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def lines(self) -> LineIndex: pass
+
+    def position(self) -> Tuple[int, int]:
+        """
+            (line, column) of the next char, both counted from 0
+        """
+        return self.lines.line_column(self.offset())
 
 class StringReader(Reader):
 
@@ -25,6 +37,7 @@ class StringReader(Reader):
         self._string = string
         self._index = 0
         self._max_index = len(self._string)
+        self._lines = LineIndex(string)
 
     def head(self) -> int:
         if self._index < self._max_index:
@@ -38,49 +51,175 @@ class StringReader(Reader):
             return c
         return Reader.EOF
 
-    def position(self) -> Tuple[int, int]:
-        return 0, self._index
+    def offset(self) -> int:
+        return self._index
+
+    @property
+    def lines(self) -> LineIndex: return self._lines
+
+    @property
+    def source(self) -> str: return self._string
+
+    def seek(self, index: int):
+        self._index = index
 
 class Scanner:  
-    def __init__(self, reader: Reader, definitions: ReTokenDefinitions) -> None:
-        self._definitions = definitions
+    def __init__(self, reader: Reader, lexer: Union[ScanningLexer, ReTokenDefinitions]) -> None:
+        if isinstance(lexer, ReTokenDefinitions):
+            lexer = CompiledLexer.compile(lexer)
+        self._lexer = lexer
         self._reader = reader
-        self._dfa_model = None
-        self._fsa = None
-        self.init()
-      
-    def init(self):
-        init_state = NFAState()
-        tail_state = NFAState()
-        nfa_model = NFAModel(init_state, tail_state)
-        for model in self._definitions.models:
-            init_state.epsilon_move_to(model.init_state)
-            model.tail_state.epsilon_move_to(tail_state)
-            nfa_model.add_state(*model.states)
-        self._dfa_model = DFAModel(nfa_model)
-        self._dfa_model.init()
-        self._fsa = FiniteStateMachine(self._dfa_model.transition_table, self._dfa_model.accept_table)
+        self._fsa = lexer.create_fsa()
+        # indexes of the entered lexer modes, the current mode is on top
+        self._mode_stack = [0]
 
-    def token_stream(self) -> Iterable[Token]:
+    @property
+    def lexer(self) -> ScanningLexer: return self._lexer
+
+    @property
+    def mode(self) -> str:
+        modes = self._lexer.modes
+        return modes.mode_names[self._mode_stack[-1]] if modes is not None else DEFAULT_MODE
+
+    def push_mode(self, mode_name: str):
+        if self._lexer.modes is None:
+            raise Exception(f"lexer has no mode {mode_name}")
+        self._mode_stack.append(self._lexer.modes.mode_index(mode_name))
+
+    def pop_mode(self):
+        if len(self._mode_stack) == 1:
+            raise Exception("can not pop the last lexer mode")
+        self._mode_stack.pop()
+
+    def _describe(self, offset: int) -> str:
+        line, column = self._reader.lines.line_column(offset)
+        return f"line {line}, column {column}"
+
+    def _start_state(self) -> int:
+        modes = self._lexer.modes
+        return modes.start_states[self._mode_stack[-1]] if modes is not None else 1
+
+    def _apply_mode_action(self, token_index: int) -> int:
+        """
+            run the mode action of a matched token, returns the start state of the
+            mode the next token is scanned in
+        """
+        action = self._lexer.modes.actions[token_index]
+        if action == POP_ACTION:
+            self.pop_mode()
+        elif action != NO_ACTION:
+            self._mode_stack.append(action)
+        return self._start_state()
+
+    def _string_token_spans(self, reader: StringReader) -> Iterable[Tuple[int, int, int]]:
+        """
+            longest match straight over the source string, the value of a token is
+            never built char by char, only its [start, end) offsets are reported.
+            the last accepting position is remembered while the dfa runs and the
+            scan resumes from it once the dfa dies. runs of chars a state loops on
+            and literals a state has to go on with are skipped with the lexer's run
+            skippers and literal jumps
+        """
+        text = reader.source
+        length = len(text)
+        charset_manager = self._lexer.charset_manager
+        match = longest_matcher(self._lexer.transition_table.next_state,
+                                charset_manager.char_to_index if charset_manager else int,
+                                self._lexer.accept_table, self._lexer.run_skippers(), self._lexer.literal_jumps())
+        modes = self._lexer.modes
+        keywords = self._lexer.keywords.tables if self._lexer.keywords is not None else None
+        start_state = self._start_state()
+        position = reader.offset()
+        while position < length:
+            start = position
+            token_index, end, position = match(text, start, length, start_state)
+            if token_index == -1:
+                reader.seek(start)
+                raise Exception(f"error token: {text[start:position + 1]} at {self._describe(start)}")
+            position = end
+            reader.seek(position)
+            if keywords is not None and keywords[token_index] is not None:
+                token_index = keywords[token_index].get(text[start:position], token_index)
+            if modes is not None:
+                start_state = self._apply_mode_action(token_index)
+                if modes.skips[token_index]:
+                    continue
+            yield token_index, start, position
+
+    def _reader_tokens(self) -> Iterable[Tuple[int, int, int, str]]:
+        """
+            chars read past the last accepting position are pushed back and read
+            again for the next token, so readers do not need to support seeking
+        """
         token_value_builder = []
-        print(self._dfa_model.accept_table)
+        # stack of pushed back chars, the next char to read is on top
+        pending = []
+        accept_table = self._lexer.accept_table
+        fsa = self._fsa
+        reader = self._reader
+        modes = self._lexer.modes
+        keywords = self._lexer.keywords.tables if self._lexer.keywords is not None else None
+        start_state = self._start_state()
+        start = reader.offset()
+        # a streamed index keeps the text of the token being scanned for its position
+        keep_from = reader.lines.keep_from
         while True:
-            char = self._reader.head()
-            # print(self._fsa.current_state, chr(char), '->')
-            self._fsa.input(char)
-            char != Reader.EOF and (not self._fsa.stop()) and token_value_builder.append(chr(char))
-            # print(self._fsa.current_state)
-            if self._fsa.stop():
-                # print(self._fsa.last_state)
-                token_value = ''.join(token_value_builder)
-                last_accept_index = self._dfa_model.accept_table[self._fsa.last_state]
-                if last_accept_index == -1:
-                    raise Exception(f"error token: {token_value}")
-                else:
-                    yield Token(last_accept_index, self._definitions.get_token_definition(last_accept_index).name, token_value)
+            keep_from(start)
+            fsa.reset(start_state)
+            token_value_builder.clear()
+            token_index, length = -1, 0
+            while True:
+                char = pending.pop() if pending else reader.peek()
                 if char == Reader.EOF:
-                    return
-                token_value_builder.clear()
-                self._fsa.reset()
-            else:
-                self._reader.peek()
+                    break
+                fsa.input(char)
+                if fsa.stop():
+                    pending.append(char)
+                    break
+                token_value_builder.append(chr(char))
+                if accept_table[fsa.current_state] != -1:
+                    token_index, length = accept_table[fsa.current_state], len(token_value_builder)
+            if not token_value_builder and char == Reader.EOF:
+                return
+            if token_index == -1:
+                error_chars = token_value_builder + ([chr(char)] if char != Reader.EOF else [])
+                raise Exception(f"error token: {''.join(error_chars)} at {self._describe(start)}")
+            pending.extend(ord(value_char) for value_char in reversed(token_value_builder[length:]))
+            end = start + length
+            value = ''.join(token_value_builder[:length])
+            if keywords is not None and keywords[token_index] is not None:
+                token_index = keywords[token_index].get(value, token_index)
+            if modes is not None:
+                start_state = self._apply_mode_action(token_index)
+                if modes.skips[token_index]:
+                    start = end
+                    continue
+            yield token_index, start, end, value
+            start = end
+
+    def token_stream(self) -> Iterable[Token]:
+        token_names = self._lexer.token_names
+        lines = self._reader.lines
+        if isinstance(self._reader, StringReader):
+            source = self._reader.source
+            for token_index, start, end in self._string_token_spans(self._reader):
+                yield Token(token_index, token_names[token_index], None, start, end, source, lines)
+        else:
+            for token_index, start, end, value in self._reader_tokens():
+                yield Token(token_index, token_names[token_index], value, start, end, None, lines)
+
+    def token_buffer(self) -> TokenBuffer:
+        """
+            scan the whole input into a TokenBuffer without creating token objects
+        """
+        if isinstance(self._reader, StringReader):
+            buffer = TokenBuffer(self._lexer.token_names, self._reader.source, self._reader.lines)
+            append = buffer.append
+            for token_index, start, end in self._string_token_spans(self._reader):
+                append(token_index, start, end)
+        else:
+            buffer = TokenBuffer(self._lexer.token_names, None, self._reader.lines)
+            append = buffer.append
+            for token_index, start, end, value in self._reader_tokens():
+                append(token_index, start, end, value)
+        return buffer
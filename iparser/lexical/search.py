@@ -0,0 +1,155 @@
+from typing import *
+from iparser.lexical.acceleration import run_skippers, literal_jumps, longest_matcher
+from iparser.lexical.charset import CharSet, MAX_CHAR
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFA, FlatNFABuilder
+from iparser.lexical.lexer import CompiledLexer, LexerKeywords, LexerModes
+from iparser.lexical.line_index import LineIndex
+from iparser.lexical.token import ReTokenDefinitions, Token
+from iparser.lexical.transition_table import DenseTransitionTable
+
+
+def reverse_nfa(nfa: FlatNFA, unanchored: bool=True) -> FlatNFA:
+    """
+        nfa accepting the reversed strings of nfa, the accepting state gets token index
+        0. with unanchored any prefix is skipped first, like a leading .*
+    """
+    builder = FlatNFABuilder()
+    for _ in range(0, nfa.state_num):
+        builder.new_state()
+    offsets, symbols, targets, char_sets = nfa.edge_offsets, nfa.edge_symbols, nfa.edge_targets, nfa.char_sets
+    epsilon_offsets, epsilon_targets = nfa.epsilon_offsets, nfa.epsilon_targets
+    for state in range(0, nfa.state_num):
+        for edge in range(offsets[state], offsets[state + 1]):
+            builder.add_edge(targets[edge], char_sets[symbols[edge]], state)
+        for target in epsilon_targets[epsilon_offsets[state]:epsilon_offsets[state + 1]]:
+            builder.add_epsilon(target, state)
+    # every token tail is an accepting state of nfa, all of them start the reversed nfa
+    init_state = builder.new_state()
+    for state, token_index in enumerate(nfa.token_indexes):
+        if token_index != -1:
+            builder.add_epsilon(init_state, state)
+    if unanchored:
+        builder.add_edge(init_state, CharSet.of_range(0, MAX_CHAR), init_state)
+    builder.set_token_index(nfa.init_state, 0)
+    return builder.build(init_state)
+
+
+class Searcher:
+    """
+        find every non overlapping leftmost longest match of the defined tokens in an
+        arbitrary text, the text between matches is skipped.
+        one backward pass of the reversed unanchored dfa marks every offset some token
+        can start at, then the anchored lexer dfa takes the longest match from each
+        marked offset left to right, unmarked text is skipped with bytearray.find.
+        both passes are linear in the text for any number of patterns, for literal
+        patterns the reversed dfa plays the role of an aho-corasick automaton.
+        when every token starts with the same literal prefix the backward pass is
+        not needed, the candidate offsets are found with str.find of the prefix.
+        empty matches are never reported. a match of a skipped token is not reported
+        either, but still covers its text like any other match. the text between
+        matches is unknown, so there are no lexer modes to track and definitions
+        using them are rejected
+    """
+
+    def __init__(self, lexer: CompiledLexer, reverse_dfa_model: DFAModel) -> None:
+        self._lexer = lexer
+        self._reverse_table = reverse_dfa_model.transition_table
+        self._reverse_accept = tuple(reverse_dfa_model.accept_table)
+        self._reverse_charset_manager = reverse_dfa_model.charset_manager
+        # the unanchored init state loops on every char no token ends with, so the
+        # text between possible matches is skipped by the run skipper of that state
+        self._reverse_skippers = run_skippers(DenseTransitionTable(self._reverse_table), self._reverse_charset_manager)
+        # (prefix, state after it) of the anchored dfa, or None
+        self._prefix = literal_jumps(lexer.transition_table, lexer.accept_table, lexer.charset_manager, 1)[1]
+
+    @staticmethod
+    def compile(definitions: ReTokenDefinitions, minimize: bool=True) -> 'Searcher':
+        if len(definitions.modes()) > 1:
+            raise ValueError("search does not track lexer modes, define every token in the default mode")
+        nfa = FlatNFABuilder.from_definitions(definitions)
+        dfa_model = DFAModel(nfa, minimize=minimize)
+        dfa_model.init()
+        dfa_model.release()
+        token_names = [definition.name for definition in definitions.definitions]
+        lexer = CompiledLexer(dfa_model.transition_table, dfa_model.accept_table, token_names, dfa_model.charset_manager,
+                              LexerModes.from_definitions(definitions, dfa_model.start_state_indexes),
+                              LexerKeywords.from_definitions(definitions))
+        reverse_dfa_model = DFAModel(reverse_nfa(nfa), minimize=minimize)
+        reverse_dfa_model.init()
+        reverse_dfa_model.release()
+        return Searcher(lexer, reverse_dfa_model)
+
+    @property
+    def lexer(self) -> CompiledLexer: return self._lexer
+
+    @property
+    def prefix(self) -> str:
+        """
+            the literal every token starts with, may be empty
+        """
+        return self._prefix[0] if self._prefix is not None else ''
+
+    def match_starts(self, text: str) -> bytearray:
+        """
+            starts[i] is 1 when some token matches a prefix of text[i:]
+        """
+        rows = self._reverse_table
+        accept = self._reverse_accept
+        skippers = self._reverse_skippers
+        char_to_index = self._reverse_charset_manager.char_to_index
+        length = len(text)
+        # the reversed text is scanned forwards, reversed position p is offset length - 1 - p
+        reversed_text = text[::-1]
+        starts = bytearray(length)
+        state = 1
+        position = 0
+        while position < length:
+            target = rows[state][char_to_index(ord(reversed_text[position]))]
+            position += 1
+            if accept[target] != -1:
+                starts[length - position] = 1
+            if target == state and skippers[state] is not None:
+                run_start = position
+                position = skippers[state](reversed_text, position).end()
+                if accept[state] != -1:
+                    starts[length - position:length - run_start] = b'\x01' * (position - run_start)
+            state = target
+        return starts
+
+    def spans(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """
+            (token index, start, end) of every match of a token that is not skipped,
+            in text order
+        """
+        match = longest_matcher(self._lexer.transition_table.next_state, self._lexer.charset_manager.char_to_index,
+                                self._lexer.accept_table, self._lexer.run_skippers(), self._lexer.literal_jumps())
+        reclassify = self._lexer.reclassify
+        skips = self._lexer.modes.skips if self._lexer.modes is not None else None
+        length = len(text)
+        if self._prefix is not None:
+            # every match starts with the prefix, the dfa goes on after it
+            prefix, prefix_state = self._prefix
+            find, needle = text.find, prefix
+        else:
+            prefix, prefix_state = '', 1
+            find, needle = self.match_starts(text).find, 1
+        prefix_accept = self._lexer.accept_table[prefix_state] if prefix else -1
+        position = find(needle)
+        while position != -1:
+            token_index, end, _ = match(text, position + len(prefix), length, prefix_state)
+            if token_index == -1:
+                token_index = prefix_accept
+            if token_index != -1 and end > position:
+                token_index = reclassify(token_index, text[position:end])
+                if skips is None or not skips[token_index]:
+                    yield token_index, position, end
+                position = find(needle, end)
+            else:
+                position = find(needle, position + 1)
+
+    def find_all(self, text: str) -> Iterable[Token]:
+        token_names = self._lexer.token_names
+        lines = LineIndex(text)
+        for token_index, start, end in self.spans(text):
+            yield Token(token_index, token_names[token_index], None, start, end, text, lines)
@@ -0,0 +1,217 @@
+"""
+    binary on disk format of a compiled lexer, all integers are little endian:
+
+        header      magic 'ILXR', version, state num, symbol num, token num, segment num, flags
+                    (u32 each, flags from version 4 on: FLAG_BYTE_LEVEL)
+        transitions state num * symbol num i32, row major
+        accepts     state num i32
+        segments    segment num u32 starts followed by segment num u32 char classes
+        names       token num * (u32 byte length, utf-8 bytes)
+        modes       u32 mode num, 0 for a lexer without modes, followed by mode num *
+                    (u32 start state, u32 byte length, utf-8 bytes), then token num
+                    i32 mode actions and token num u8 skip flags (version 2 and later)
+        keywords    u32 keyword num followed by keyword num * (u32 host token, u32 keyword
+                    token, u32 byte length, utf-8 bytes) (version 3 and later), the
+                    lexemes are looked up as bytes by byte level lexers only
+
+    the transition section is 4 byte aligned so a mmap of the file can be used in place
+"""
+from typing import *
+from array import array
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from iparser.lexical.charset import EquivalenceClassCharSetManager
+from iparser.lexical.lexer import CompiledLexer, LexerModes, LexerKeywords, expect_compiled
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.transition_table import ArrayTransitionTable
+
+MAGIC = b'ILXR'
+VERSION = 4
+# the symbols are utf-8 bytes, see CompiledLexer.byte_level
+FLAG_BYTE_LEVEL = 1
+_HEADER = struct.Struct('<4s6I')
+# before version 4 the header had no flags
+_OLD_HEADER = struct.Struct('<4s5I')
+
+
+def _little_endian_bytes(items: array) -> bytes:
+    if sys.byteorder != 'little':
+        items = array(items.typecode, items)
+        items.byteswap()
+    return items.tobytes()
+
+
+def _read_array(buffer: memoryview, offset: int, typecode: str, length: int) -> Tuple[Union[array, memoryview], int]:
+    end = offset + 4 * length
+    view = buffer[offset:end].cast(typecode)
+    if sys.byteorder != 'little':
+        view = array(typecode, view)
+        view.byteswap()
+    return view, end
+
+
+def dumps(lexer: CompiledLexer) -> bytes:
+    expect_compiled(lexer, "serialization")
+    charset_manager = lexer.charset_manager
+    if charset_manager is not None and not isinstance(charset_manager, EquivalenceClassCharSetManager):
+        raise ValueError(f"can not serialize a lexer using {type(charset_manager).__name__}")
+    table = lexer.transition_table
+    rows = table.rows()
+    segment_starts = array('I', charset_manager.segment_starts if charset_manager else ())
+    segment_classes = array('I', charset_manager.segment_classes if charset_manager else ())
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, table.state_num, table.symbol_num, len(lexer.token_names), len(segment_starts),
+                     FLAG_BYTE_LEVEL if lexer.byte_level else 0),
+        _little_endian_bytes(array('i', (target for row in rows for target in row))),
+        _little_endian_bytes(array('i', lexer.accept_table)),
+        _little_endian_bytes(segment_starts),
+        _little_endian_bytes(segment_classes),
+    ]
+    for name in lexer.token_names:
+        encoded = name.encode('utf-8')
+        parts.append(struct.pack('<I', len(encoded)))
+        parts.append(encoded)
+    modes = lexer.modes
+    if modes is None:
+        parts.append(struct.pack('<I', 0))
+    else:
+        parts.append(struct.pack('<I', len(modes.mode_names)))
+        for start_state, mode_name in zip(modes.start_states, modes.mode_names):
+            encoded = mode_name.encode('utf-8')
+            parts.append(struct.pack('<II', start_state, len(encoded)))
+            parts.append(encoded)
+        parts.append(struct.pack(f'<{len(modes.actions)}i', *modes.actions))
+        parts.append(bytes(modes.skips))
+    keywords = [(host, token_index, lexeme if isinstance(lexeme, bytes) else lexeme.encode('utf-8'))
+                for host, table in enumerate(lexer.keywords.tables if lexer.keywords is not None else ()) if table is not None
+                for lexeme, token_index in table.items()]
+    parts.append(struct.pack('<I', len(keywords)))
+    for host, token_index, encoded in keywords:
+        parts.append(struct.pack('<III', host, token_index, len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def loads(buffer) -> CompiledLexer:
+    """
+        build a lexer on top of a bytes like object, the transition table keeps
+        referencing the buffer instead of copying it
+    """
+    buffer = memoryview(buffer)
+    magic, version = struct.unpack_from('<4sI', buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("not a compiled lexer file")
+    if version not in (1, 2, 3, VERSION):
+        raise ValueError(f"unsupported compiled lexer version {version}")
+    if version >= 4:
+        _, _, state_num, symbol_num, token_num, segment_num, flags = _HEADER.unpack_from(buffer, 0)
+        offset = _HEADER.size
+    else:
+        # only lowered lexers were stored without char classes
+        _, _, state_num, symbol_num, token_num, segment_num = _OLD_HEADER.unpack_from(buffer, 0)
+        flags = 0 if segment_num else FLAG_BYTE_LEVEL
+        offset = _OLD_HEADER.size
+    byte_level = bool(flags & FLAG_BYTE_LEVEL)
+    transitions, offset = _read_array(buffer, offset, 'i', state_num * symbol_num)
+    accepts, offset = _read_array(buffer, offset, 'i', state_num)
+    segment_starts, offset = _read_array(buffer, offset, 'I', segment_num)
+    segment_classes, offset = _read_array(buffer, offset, 'I', segment_num)
+    token_names = []
+    for _ in range(0, token_num):
+        length, = struct.unpack_from('<I', buffer, offset)
+        offset += 4
+        token_names.append(bytes(buffer[offset:offset + length]).decode('utf-8'))
+        offset += length
+    modes = None
+    mode_num = struct.unpack_from('<I', buffer, offset)[0] if version >= 2 else 0
+    if mode_num:
+        offset += 4
+        mode_names, start_states = [], []
+        for _ in range(0, mode_num):
+            start_state, length = struct.unpack_from('<II', buffer, offset)
+            offset += 8
+            start_states.append(start_state)
+            mode_names.append(bytes(buffer[offset:offset + length]).decode('utf-8'))
+            offset += length
+        actions = struct.unpack_from(f'<{token_num}i', buffer, offset)
+        offset += 4 * token_num
+        skips = [bool(flag) for flag in buffer[offset:offset + token_num]]
+        offset += token_num
+        modes = LexerModes(mode_names, start_states, actions, skips)
+    elif version >= 2:
+        offset += 4
+    keywords = None
+    keyword_num = struct.unpack_from('<I', buffer, offset)[0] if version >= 3 else 0
+    if keyword_num:
+        offset += 4
+        tables: List[Optional[Dict[AnyStr, int]]] = [None] * token_num
+        for _ in range(0, keyword_num):
+            host, token_index, length = struct.unpack_from('<III', buffer, offset)
+            offset += 12
+            lexeme = bytes(buffer[offset:offset + length])
+            offset += length
+            if tables[host] is None:
+                tables[host] = {}
+            # byte level lexers look the raw bytes up
+            tables[host][lexeme if byte_level else lexeme.decode('utf-8')] = token_index
+        keywords = LexerKeywords(tables)
+    charset_manager = EquivalenceClassCharSetManager(segment_starts, segment_classes, symbol_num) if segment_num else None
+    table = ArrayTransitionTable.from_buffer(transitions, state_num, symbol_num)
+    return CompiledLexer(table, accepts, token_names, charset_manager, modes, keywords, byte_level)
+
+
+def dump(lexer: CompiledLexer, path: str) -> None:
+    # write to a temporary file first so readers never see a half written file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(dumps(lexer))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load(path: str, use_mmap: bool=True) -> CompiledLexer:
+    """
+        with use_mmap the transition table lives in a shared read only mapping of
+        the file, so every process loading the same file shares its pages
+    """
+    with open(path, 'rb') as file:
+        if use_mmap:
+            return loads(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return loads(file.read())
+
+
+class LexerCache:
+    """
+        compiled lexers stored in a directory, keyed by the fingerprint of their definitions
+    """
+
+    def __init__(self, directory: str, use_mmap: bool=True) -> None:
+        self._directory = directory
+        self._use_mmap = use_mmap
+        os.makedirs(directory, exist_ok=True)
+
+    def path_of(self, definitions: ReTokenDefinitions, minimize: bool=True) -> str:
+        key = f"{definitions.fingerprint()}-v{VERSION}-{'min' if minimize else 'raw'}"
+        return os.path.join(self._directory, f"{key}.ilxr")
+
+    def get(self, definitions: ReTokenDefinitions, minimize: bool=True) -> CompiledLexer:
+        """
+            load the lexer of the definitions, compiling and storing it only on a cache miss.
+            definitions without a stable fingerprint are compiled and never cached
+        """
+        try:
+            path = self.path_of(definitions, minimize)
+        except ValueError:
+            return CompiledLexer.compile(definitions, minimize)
+        if os.path.exists(path):
+            return load(path, self._use_mmap)
+        lexer = CompiledLexer.compile(definitions, minimize)
+        dump(lexer, path)
+        return lexer
@@ -0,0 +1,144 @@
+from abc import abstractmethod
+from typing import *
+import codecs
+import io
+import mmap
+from iparser.lexical.line_index import LineIndex, StreamLineIndex
+from iparser.lexical.scanner import Reader
+
+
+class BufferedReader(Reader):
+    """
+        reader over input that arrives in decoded chunks, only the current chunk is
+        kept in memory so the memory use does not depend on the input size. tokens
+        may straddle chunk boundaries, the scanner only ever sees single chars.
+        offsets count chars of the whole input
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = ''
+        self._buffer_index = 0
+        # offset of the first char of the buffer in the whole input
+        self._buffer_offset = 0
+        self._eof = False
+        # the decoded text is dropped chunk by chunk, the index only keeps the last two chunks
+        self._lines = StreamLineIndex()
+
+    @abstractmethod
+    def _read_chunk(self) -> str:
+        """
+            next decoded chunk, an empty string means the input is exhausted
+        """
+        pass
+
+    def _fill(self) -> bool:
+        while self._buffer_index >= len(self._buffer):
+            if self._eof:
+                return False
+            chunk = self._read_chunk()
+            if not chunk:
+                self._eof = True
+                return False
+            self._buffer_offset += len(self._buffer)
+            self._buffer = chunk
+            self._buffer_index = 0
+            self._lines.add_chunk(chunk, self._buffer_offset)
+        return True
+
+    def head(self) -> int:
+        if self._buffer_index < len(self._buffer) or self._fill():
+            return ord(self._buffer[self._buffer_index])
+        return Reader.EOF
+
+    def peek(self) -> int:
+        if self._buffer_index < len(self._buffer) or self._fill():
+            c = ord(self._buffer[self._buffer_index])
+            self._buffer_index += 1
+            return c
+        return Reader.EOF
+
+    def offset(self) -> int:
+        return self._buffer_offset + self._buffer_index
+
+    @property
+    def lines(self) -> LineIndex: return self._lines
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'BufferedReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StreamReader(BufferedReader):
+    """
+        read a text stream, or a binary stream decoded incrementally with the encoding
+    """
+
+    DEFAULT_BUFFER_SIZE = 1 << 16
+
+    def __init__(self, stream: IO, encoding: str='utf-8', errors: str='strict', buffer_size: int=DEFAULT_BUFFER_SIZE) -> None:
+        super().__init__()
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._decoder = None if isinstance(stream, io.TextIOBase) else codecs.getincrementaldecoder(encoding)(errors)
+
+    def _read_chunk(self) -> str:
+        while True:
+            data = self._stream.read(self._buffer_size)
+            if self._decoder is None:
+                return data
+            if not data:
+                return self._decoder.decode(b'', final=True)
+            chunk = self._decoder.decode(data)
+            # a chunk holding only part of a multi byte char decodes to nothing yet
+            if chunk:
+                return chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class FileReader(StreamReader):
+    def __init__(self, path: str, encoding: str='utf-8', errors: str='strict', buffer_size: int=StreamReader.DEFAULT_BUFFER_SIZE) -> None:
+        super().__init__(open(path, 'rb'), encoding, errors, buffer_size)
+
+
+class MmapReader(BufferedReader):
+    """
+        decode a memory mapped file chunk by chunk, the operating system pages the file
+        in and out so even multi GB inputs only cost one decoded chunk of memory
+    """
+
+    DEFAULT_CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path: str, encoding: str='utf-8', errors: str='strict', chunk_size: int=DEFAULT_CHUNK_SIZE) -> None:
+        super().__init__()
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file can not be mapped
+            self._mmap = None
+        self._chunk_size = chunk_size
+        self._byte_offset = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+    def _read_chunk(self) -> str:
+        size = len(self._mmap) if self._mmap is not None else 0
+        while self._byte_offset < size:
+            end = min(self._byte_offset + self._chunk_size, size)
+            chunk = self._decoder.decode(self._mmap[self._byte_offset:end], final=end == size)
+            self._byte_offset = end
+            if chunk:
+                return chunk
+        return self._decoder.decode(b'', final=True)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
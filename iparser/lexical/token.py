@@ -1,14 +1,62 @@
-from iparser.lexical.regular_expression import RegularExpression
+from iparser.lexical.regular_expression import RegularExpression, RE
 from iparser.lexical.nfa_model import NFAModel
 from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regex_parser import RegexParser
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Mapping, Optional, Sequence, Tuple, Iterator, Union
+from array import array
+import hashlib
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Token:
-    def __init__(self, token_index, name, value) -> None:
+    """
+        a token only records where it is in the source, the value is sliced from
+        the source and the (line, column) positions are looked up in the line index
+        of the reader the first time they are asked for
+    """
+    __slots__ = ('token_index', 'name', 'start', 'end', '_value', '_source', '_lines')
+
+    def __init__(self, token_index, name, value=None, start=-1, end=-1, source=None, lines=None) -> None:
         self.token_index = token_index
-        self.value = value
         self.name = name
+        self.start = start
+        self.end = end
+        self._value = value
+        self._source = source
+        self._lines = lines
+
+    @property
+    def value(self):
+        if self._value is None and self._source is not None:
+            self._value = self._source[self.start:self.end]
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def _line_column(self, offset: int) -> Tuple[int, int]:
+        if self._lines is None:
+            raise ValueError(f"token {self.name} was created without a line index, its position is unknown")
+        return self._lines.line_column(offset)
+
+    @property
+    def start_position(self) -> Tuple[int, int]:
+        """
+            (line, column) of the first char, both counted from 0
+        """
+        return self._line_column(self.start)
+
+    @property
+    def end_position(self) -> Tuple[int, int]:
+        """
+            (line, column) right after the last char
+        """
+        return self._line_column(self.end)
     
     def __repr__(self) -> str:
         return f"{self.name} -> '{self.value}'"
@@ -16,54 +64,236 @@ class Token:
     def __str__(self) -> str:
         return self.__repr__()
 
+
+class TokenBuffer:
+    """
+        all tokens of an input stored column wise in three parallel arrays, token
+        objects are only created when an element is accessed
+    """
+
+    def __init__(self, token_names: Sequence[str], source=None, lines=None) -> None:
+        self._token_names = tuple(token_names)
+        self._source = source
+        self._lines = lines
+        self.kinds = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+        # only filled when there is no source to slice the values from
+        self.values: List = []
+
+    def append(self, token_index: int, start: int, end: int, value=None):
+        self.kinds.append(token_index)
+        self.starts.append(start)
+        self.ends.append(end)
+        if value is not None:
+            self.values.append(value)
+
+    @property
+    def source(self): return self._source
+
+    @property
+    def token_names(self) -> Tuple[str]: return self._token_names
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """
+            (line, column) of the start of a token, needs the line index of the reader
+        """
+        if self._lines is None:
+            raise ValueError("the token buffer was created without a line index, positions are unknown")
+        return self._lines.line_column(self.starts[index])
+
+    def value(self, index: int):
+        if self._source is None:
+            return self.values[index]
+        return self._source[self.starts[index]:self.ends[index]]
+
+    def to_numpy(self) -> Tuple:
+        """
+            the three columns as numpy arrays sharing the memory of this buffer
+        """
+        if numpy is None:
+            raise ImportError("TokenBuffer.to_numpy requires numpy")
+        return numpy.frombuffer(self.kinds, dtype=numpy.int32), \
+            numpy.frombuffer(self.starts, dtype=numpy.int64), numpy.frombuffer(self.ends, dtype=numpy.int64)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        token_index = self.kinds[index]
+        value = None if self._source is not None else self.values[index]
+        return Token(token_index, self._token_names[token_index], value, self.starts[index], self.ends[index],
+                     self._source, self._lines)
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(0, len(self.kinds)):
+            yield self[index]
+
+
+DEFAULT_MODE = 'default'
+# mode actions of a token: push the mode with that name, or pop back to the previous mode
+POP_MODE = '<pop>'
+
+
 class TokenDefinition(ABC):
 
-    def __init__(self, name) -> None:
+    def __init__(self, name, skip: bool=False, modes: Tuple[str]=(DEFAULT_MODE,), mode_action: str=None) -> None:
         super().__init__()
         self._name = name
+        self._skip = skip
+        self._modes = modes
+        self._mode_action = mode_action
     
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def skip(self) -> bool:
+        """
+            skipped tokens are matched like any other but never reported
+        """
+        return self._skip
+
+    @property
+    def modes(self) -> Tuple[str]:
+        return self._modes
+
+    @property
+    def mode_action(self) -> str:
+        """
+            None, the name of the mode pushed after the token or POP_MODE
+        """
+        return self._mode_action
+
+    @property
+    def host(self) -> Optional[int]:
+        """
+            token index of the rule a keyword token is reclassified from, None for
+            the tokens matched by the dfa
+        """
+        return None
+
     @abstractmethod
     def get_nfa_model(self) -> NFAModel: pass
 
 
 class RETokenDefinition(TokenDefinition):
-    def __init__(self, name, re: RegularExpression, converter) -> None:
-        super().__init__(name)
+    def __init__(self, name, re: RegularExpression, converter, skip: bool=False,
+                 modes: Tuple[str]=(DEFAULT_MODE,), mode_action: str=None) -> None:
+        super().__init__(name, skip, modes, mode_action)
         self._re = re
         self._converter = converter
+
+    @property
+    def re(self) -> RegularExpression:
+        return self._re
     
     def get_nfa_model(self) -> NFAModel:
         return self._re.to_nfa_model(self._converter)
 
 
+class KeywordTokenDefinition(RETokenDefinition):
+    """
+        a keyword of a host token, never part of the automaton: a lexeme of the host
+        equal to the keyword is reported as this token instead
+    """
+
+    def __init__(self, name, keyword: str, host: int, converter, modes: Tuple[str]=(DEFAULT_MODE,)) -> None:
+        super().__init__(name, RE.literal(keyword), converter, modes=modes)
+        self._keyword = keyword
+        self._host = host
+
+    @property
+    def keyword(self) -> str:
+        return self._keyword
+
+    @property
+    def host(self) -> Optional[int]:
+        return self._host
+
+
 class ReTokenDefinitions:
     def __init__(self, converter: NFAModelConverter) -> None:
         self._definitions: List[TokenDefinition] = []
         self._models: List[NFAModel] = []
         self._converter = converter
+        # shared by all regex strings of the definitions, equal subexpressions of
+        # different tokens are one object
+        self._regex_parser = RegexParser()
     
-    def define(self, name: str, re: RegularExpression):
-        definition = RETokenDefinition(name, re, self._converter)
-        model = definition.get_nfa_model()
-        token_index = len(self._definitions)
+    def define(self, name: str, re: Union[RegularExpression, str], skip: bool=False,
+               mode: Union[str, Sequence[str]]=DEFAULT_MODE, push: str=None, pop: bool=False,
+               keywords: Mapping[str, str]=None):
+        """
+            re is a RegularExpression or a regex string, see RegexParser.
+            the token is only matched in the given mode(s). after it is matched the
+            scanner enters the mode push, or with pop returns to the mode it was in
+            before the current one.
+            keywords maps token names to lexemes of this token, they are defined as
+            tokens right after it but only the token itself is put into the automaton,
+            a matched lexeme found among the keywords is reported as that keyword. a
+            keyword ranks like a literal token defined right before this one
+        """
+        if push is not None and pop:
+            raise Exception(f"token {name} can not both push and pop a mode")
+        if keywords and skip:
+            raise Exception(f"skipped token {name} can not have keywords")
+        if isinstance(re, str):
+            re = self._regex_parser.parse(re)
+        modes = (mode,) if isinstance(mode, str) else tuple(mode)
+        definition = RETokenDefinition(name, re, self._converter, skip, modes, POP_MODE if pop else push)
+        host = len(self._definitions)
         self._definitions.append(definition)
-        model.tail_state.token_index = token_index
-        self._models.append(model)
+        if keywords:
+            if len(set(keywords.values())) != len(keywords):
+                raise Exception(f"token {name} has the same keyword under several names")
+            for keyword_name, keyword in keywords.items():
+                self._definitions.append(KeywordTokenDefinition(keyword_name, keyword, host, self._converter, modes))
+
+    def modes(self) -> List[str]:
+        """
+            every mode a token is defined in or pushes, the default mode comes first
+        """
+        modes = {DEFAULT_MODE: None}
+        for definition in self._definitions:
+            modes.update(dict.fromkeys(definition.modes))
+            if definition.mode_action not in (None, POP_MODE):
+                modes[definition.mode_action] = None
+        return list(modes)
     
     def get_token_definition(self, index):
         return self._definitions[index]
+
+    def fingerprint(self) -> str:
+        """
+            digest of the token names and expressions, stable across processes. raises
+            ValueError when a predicate expression can not be fingerprinted
+        """
+        digest = hashlib.sha256()
+        for definition in self._definitions:
+            digest.update(f"{definition.name}={definition.re.get_fingerprint()};".encode('utf-8'))
+            if definition.skip or definition.modes != (DEFAULT_MODE,) or definition.mode_action is not None:
+                digest.update(f"{definition.skip},{definition.modes},{definition.mode_action};".encode('utf-8'))
+            if definition.host is not None:
+                digest.update(f"keyword of {definition.host};".encode('utf-8'))
+        return digest.hexdigest()
     
     @property
     def models(self) -> List[NFAModel]:
+        # nfa models are converted lazily, a cached lexer never needs them
+        for token_index in range(len(self._models), len(self._definitions)):
+            model = self._definitions[token_index].get_nfa_model()
+            model.tail_state.token_index = token_index
+            self._models.append(model)
         return self._models
     
     @property
     def definitions(self) -> List[TokenDefinition]:
         return self._definitions
 
+    @property
+    def regex_parser(self) -> RegexParser: return self._regex_parser
+
         
     
\ No newline at end of file
@@ -0,0 +1,243 @@
+from abc import ABC, abstractmethod
+from typing import *
+from array import array
+from collections import Counter
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _state_typecode(state_num: int) -> str:
+    if state_num <= 0xFF:
+        return 'B'
+    return 'H' if state_num <= 0xFFFF else 'I'
+
+
+class TransitionTable(ABC):
+    """
+        lookup interface shared by every transition table encoding, symbols
+        outside [0, symbol_num) (EOF included) always lead to the dead state 0
+    """
+
+    @abstractmethod
+    def next_state(self, state: int, symbol: int) -> int: pass
+
+    @property
+    @abstractmethod
+    def state_num(self) -> int: pass
+
+    @property
+    @abstractmethod
+    def symbol_num(self) -> int: pass
+
+    @abstractmethod
+    def memory_usage(self) -> int:
+        """
+            bytes held by the table storage
+        """
+        pass
+
+    def rows(self) -> List[List[int]]:
+        return [[self.next_state(state, symbol) for symbol in range(0, self.symbol_num)] for state in range(0, self.state_num)]
+
+    def __len__(self) -> int:
+        return self.state_num
+
+
+class DenseTransitionTable(TransitionTable):
+    """
+        one tuple per state, the fastest lookup and the largest footprint
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]]) -> None:
+        self._rows: Tuple[Tuple[int]] = tuple(tuple(row) for row in rows)
+        self._symbol_num = len(self._rows[0]) if self._rows else 0
+
+    def next_state(self, state: int, symbol: int) -> int:
+        row = self._rows[state]
+        return row[symbol] if 0 <= symbol < len(row) else 0
+
+    @property
+    def state_num(self) -> int: return len(self._rows)
+
+    @property
+    def symbol_num(self) -> int: return self._symbol_num
+
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self._rows) + sum(sys.getsizeof(row) for row in self._rows)
+
+    def rows(self) -> List[List[int]]:
+        return [list(row) for row in self._rows]
+
+
+class ArrayTransitionTable(TransitionTable):
+    """
+        all rows packed into one flat array with the smallest item size that fits the states
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]]) -> None:
+        self._symbol_num = len(rows[0]) if rows else 0
+        self._state_num = len(rows)
+        self._table = array(_state_typecode(self._state_num), (target for row in rows for target in row))
+
+    @staticmethod
+    def from_buffer(buffer: Union[array, memoryview], state_num: int, symbol_num: int) -> 'ArrayTransitionTable':
+        """
+            wrap an existing flat buffer (for example a memoryview of a mmap) without copying
+        """
+        table = ArrayTransitionTable.__new__(ArrayTransitionTable)
+        table._state_num = state_num
+        table._symbol_num = symbol_num
+        table._table = buffer
+        return table
+
+    def next_state(self, state: int, symbol: int) -> int:
+        if 0 <= symbol < self._symbol_num:
+            return self._table[state * self._symbol_num + symbol]
+        return 0
+
+    @property
+    def buffer(self) -> Union[array, memoryview]:
+        """
+            the flat rows, the target of (state, symbol) is at state * symbol_num + symbol
+        """
+        return self._table
+
+    @property
+    def state_num(self) -> int: return self._state_num
+
+    @property
+    def symbol_num(self) -> int: return self._symbol_num
+
+    def memory_usage(self) -> int:
+        if isinstance(self._table, memoryview):
+            return self._table.nbytes
+        return sys.getsizeof(self._table)
+
+
+class NumpyTransitionTable(TransitionTable):
+    """
+        dense rows in a two dimensional numpy array, needs numpy to be installed
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]]) -> None:
+        if numpy is None:
+            raise ImportError("NumpyTransitionTable requires numpy")
+        dtype = {'B': numpy.uint8, 'H': numpy.uint16, 'I': numpy.uint32}[_state_typecode(len(rows))]
+        self._table = numpy.array(rows, dtype=dtype).reshape(len(rows), len(rows[0]) if rows else 0)
+
+    def next_state(self, state: int, symbol: int) -> int:
+        if 0 <= symbol < self._table.shape[1]:
+            return int(self._table[state, symbol])
+        return 0
+
+    @property
+    def state_num(self) -> int: return self._table.shape[0]
+
+    @property
+    def symbol_num(self) -> int: return self._table.shape[1]
+
+    def memory_usage(self) -> int:
+        return int(self._table.nbytes)
+
+
+class CombTransitionTable(TransitionTable):
+    """
+        row displacement (comb vector) encoding. every state keeps a default target,
+        the remaining entries of all rows are overlapped in the next/check arrays:
+            next_state(s, c) = next[base[s] + c] if check[base[s] + c] == s else default[s]
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]]) -> None:
+        self._state_num = len(rows)
+        self._symbol_num = len(rows[0]) if rows else 0
+        typecode = _state_typecode(self._state_num)
+        defaults = [Counter(row).most_common(1)[0][0] if row else 0 for row in rows]
+        entries = [[(symbol, target) for symbol, target in enumerate(row) if target != defaults[state]]
+                   for state, row in enumerate(rows)]
+
+        base = [0] * self._state_num
+        next_list: List[int] = []
+        check_list: List[int] = []
+        # 1 for the used slots, free slots are found with bytearray.find in c
+        occupied = bytearray()
+        first_free = 0
+        # symbols of a row -> the slot its first entry went to last time. slots only
+        # fill up, so a row with the same symbols never fits below it
+        resume_slots: Dict[Tuple[int], int] = {}
+        # first fit from the lowest free slot, the densest rows are placed first
+        for state in sorted(range(0, self._state_num), key=lambda state: -len(entries[state])):
+            row_entries = entries[state]
+            if not row_entries:
+                continue
+            first_symbol = row_entries[0][0]
+            symbols = tuple(symbol for symbol, _ in row_entries)
+            # the first entry of the row goes to a free slot, the others are checked
+            slot = occupied.find(0, max(first_free, first_symbol, resume_slots.get(symbols, 0)))
+            while True:
+                if slot == -1:
+                    slot = max(len(occupied), first_symbol)
+                offset = slot - first_symbol
+                size = len(occupied)
+                if all(offset + symbol >= size or not occupied[offset + symbol] for symbol in symbols):
+                    break
+                slot = occupied.find(0, slot + 1)
+            needed = offset + row_entries[-1][0] + 1
+            if needed > len(check_list):
+                next_list.extend([0] * (needed - len(check_list)))
+                check_list.extend([-1] * (needed - len(check_list)))
+                occupied.extend(bytes(needed - len(occupied)))
+            for symbol, target in row_entries:
+                next_list[offset + symbol] = target
+                check_list[offset + symbol] = state
+                occupied[offset + symbol] = 1
+            base[state] = offset
+            resume_slots[symbols] = slot + 1
+            first_free = occupied.find(0, first_free)
+            if first_free == -1:
+                first_free = len(occupied)
+
+        self._base = array('I', base)
+        self._default = array(typecode, defaults)
+        self._next = array(typecode, next_list)
+        # -1 marks a free slot, so the check array needs a signed item type
+        self._check = array({'B': 'h', 'H': 'i', 'I': 'q'}[typecode], check_list)
+
+    def next_state(self, state: int, symbol: int) -> int:
+        if 0 <= symbol < self._symbol_num:
+            index = self._base[state] + symbol
+            if index < len(self._check) and self._check[index] == state:
+                return self._next[index]
+            return self._default[state]
+        return 0
+
+    @property
+    def state_num(self) -> int: return self._state_num
+
+    @property
+    def symbol_num(self) -> int: return self._symbol_num
+
+    def memory_usage(self) -> int:
+        return sum(sys.getsizeof(part) for part in (self._base, self._default, self._next, self._check))
+
+
+TABLE_FORMATS: Dict[str, Type[TransitionTable]] = {
+    'dense': DenseTransitionTable,
+    'array': ArrayTransitionTable,
+    'comb': CombTransitionTable,
+}
+if numpy is not None:
+    TABLE_FORMATS['numpy'] = NumpyTransitionTable
+
+
+def memory_report(table: Union[TransitionTable, Sequence[Sequence[int]]]) -> Dict[str, int]:
+    """
+        bytes needed by the same transitions in every available encoding, a given
+        table is measured as it is, only the other encodings are built
+    """
+    rows = table.rows() if isinstance(table, TransitionTable) else table
+    return {name: table.memory_usage() if type(table) is table_class else table_class(rows).memory_usage()
+            for name, table_class in TABLE_FORMATS.items()}
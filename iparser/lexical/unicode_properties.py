@@ -0,0 +1,186 @@
+"""
+    general category and script classes over the whole code space, looked up in the
+    precomputed range tables of iparser.lexical.unicode_tables. regenerate the tables
+    after a unicode update with
+        python -m iparser.lexical.unicode_properties <path of Scripts.txt>
+    the categories come from unicodedata, the scripts from Scripts.txt of the unicode
+    character database (https://www.unicode.org/Public/<version>/ucd/Scripts.txt) of
+    the same version as unicodedata.unidata_version
+"""
+from typing import *
+from bisect import bisect_right
+from iparser.lexical.charset import CharSet, MAX_CHAR
+from iparser.lexical import unicode_tables
+import os
+import sys
+import unicodedata
+
+CATEGORY_ALIASES = {
+    'Letter': 'L', 'Cased_Letter': 'LC', 'Uppercase_Letter': 'Lu', 'Lowercase_Letter': 'Ll',
+    'Titlecase_Letter': 'Lt', 'Modifier_Letter': 'Lm', 'Other_Letter': 'Lo',
+    'Mark': 'M', 'Nonspacing_Mark': 'Mn', 'Spacing_Mark': 'Mc', 'Enclosing_Mark': 'Me',
+    'Number': 'N', 'Decimal_Number': 'Nd', 'Letter_Number': 'Nl', 'Other_Number': 'No',
+    'Punctuation': 'P', 'Connector_Punctuation': 'Pc', 'Dash_Punctuation': 'Pd', 'Open_Punctuation': 'Ps',
+    'Close_Punctuation': 'Pe', 'Initial_Punctuation': 'Pi', 'Final_Punctuation': 'Pf', 'Other_Punctuation': 'Po',
+    'Symbol': 'S', 'Math_Symbol': 'Sm', 'Currency_Symbol': 'Sc', 'Modifier_Symbol': 'Sk', 'Other_Symbol': 'So',
+    'Separator': 'Z', 'Space_Separator': 'Zs', 'Line_Separator': 'Zl', 'Paragraph_Separator': 'Zp',
+    'Other': 'C', 'Control': 'Cc', 'Format': 'Cf', 'Surrogate': 'Cs', 'Private_Use': 'Co', 'Unassigned': 'Cn',
+}
+CATEGORY_PROPERTIES = ('gc', 'generalcategory')
+SCRIPT_PROPERTIES = ('sc', 'script')
+
+# name -> chars, every class is built from the range table once
+_categories: Dict[str, CharSet] = {}
+_scripts: Dict[str, CharSet] = {}
+
+
+def _loose(name: str) -> str:
+    """
+        loose matching of property names: case, spaces, '-' and '_' are ignored
+    """
+    return name.replace('_', '').replace(' ', '').replace('-', '').lower()
+
+
+_CATEGORY_NAMES = {_loose(name): name for name in unicode_tables.CATEGORY_NAMES}
+_CATEGORY_NAMES.update({_loose(name[0]): name[0] for name in unicode_tables.CATEGORY_NAMES})
+_CATEGORY_NAMES.update({_loose(alias): name for alias, name in CATEGORY_ALIASES.items()})
+_CATEGORY_NAMES.update({'lc': 'LC', 'l&': 'LC'})
+_SCRIPT_NAMES = {_loose(name): name for name in unicode_tables.SCRIPT_NAMES}
+
+
+def _table_char_set(starts: Sequence[int], indexes: bytes, wanted: Container[int]) -> CharSet:
+    ends = list(starts[1:]) + [MAX_CHAR + 1]
+    return CharSet((start, end - 1) for start, end, index in zip(starts, ends, indexes) if index in wanted)
+
+
+def general_category(name: str) -> CharSet:
+    """
+        the chars of a general category such as 'Lu' or 'Uppercase_Letter', of a major
+        class such as 'L' or of 'LC' (Lu, Ll and Lt)
+    """
+    category = _CATEGORY_NAMES.get(_loose(name))
+    if category is None:
+        raise ValueError(f"unknown unicode general category {name}")
+    char_set = _categories.get(category)
+    if char_set is None:
+        names = unicode_tables.CATEGORY_NAMES
+        if category == 'LC':
+            members = ('Lu', 'Ll', 'Lt')
+        else:
+            members = [member for member in names if member == category or member[0] == category]
+        wanted = {names.index(member) for member in members}
+        char_set = _categories[category] = _table_char_set(unicode_tables.CATEGORY_STARTS, unicode_tables.CATEGORY_INDEXES, wanted)
+    return char_set
+
+
+def script(name: str) -> CharSet:
+    """
+        the chars of a script such as 'Greek' or 'Old_Italic', 'Common' and 'Inherited'
+        hold the chars shared by several scripts, 'Unknown' the unassigned ones
+    """
+    script_name = _SCRIPT_NAMES.get(_loose(name))
+    if script_name is None:
+        raise ValueError(f"unknown unicode script {name}")
+    char_set = _scripts.get(script_name)
+    if char_set is None:
+        wanted = {unicode_tables.SCRIPT_NAMES.index(script_name)}
+        char_set = _scripts[script_name] = _table_char_set(unicode_tables.SCRIPT_STARTS, unicode_tables.SCRIPT_INDEXES, wanted)
+    return char_set
+
+
+def unicode_property(spec: str) -> CharSet:
+    """
+        the class of a \\p{...} body: 'Lu', 'Letter', 'Greek', 'gc=Lu' or 'Script=Greek'.
+        a bare name is a general category first and a script otherwise
+    """
+    name, equals, value = spec.partition('=')
+    if equals:
+        if _loose(name) in CATEGORY_PROPERTIES:
+            return general_category(value)
+        if _loose(name) in SCRIPT_PROPERTIES:
+            return script(value)
+        raise ValueError(f"unknown unicode property {name}")
+    if _loose(spec) in _CATEGORY_NAMES:
+        return general_category(spec)
+    if _loose(spec) in _SCRIPT_NAMES:
+        return script(spec)
+    raise ValueError(f"unknown unicode property {spec}")
+
+
+def category_of(char: int) -> str:
+    """
+        the general category of a code point, like unicodedata.category
+    """
+    index = bisect_right(unicode_tables.CATEGORY_STARTS, char) - 1
+    return unicode_tables.CATEGORY_NAMES[unicode_tables.CATEGORY_INDEXES[index]]
+
+
+def _runs(values: Iterable[str]) -> Tuple[List[str], List[int], List[int]]:
+    """
+        names, run starts and name index of every run of equal values of the code points
+    """
+    names: List[str] = []
+    name_indexes: Dict[str, int] = {}
+    starts, indexes = [], []
+    for char, value in enumerate(values):
+        if value not in name_indexes:
+            name_indexes[value] = len(names)
+            names.append(value)
+        if not indexes or indexes[-1] != name_indexes[value]:
+            starts.append(char)
+            indexes.append(name_indexes[value])
+    return names, starts, indexes
+
+
+def _read_scripts(path: str) -> List[str]:
+    """
+        the script of every code point from Scripts.txt, lines are "0041..005A ; Latin # ..."
+        or "00AA ; Latin # ...", missing code points are Unknown
+    """
+    scripts = ['Unknown'] * (MAX_CHAR + 1)
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            chars, _, script_name = line.partition(';')
+            start, _, end = chars.strip().partition('..')
+            start = int(start, 16)
+            end = int(end, 16) if end else start
+            scripts[start:end + 1] = [script_name.strip()] * (end - start + 1)
+    return scripts
+
+
+def _format_ints(values: Sequence[int]) -> str:
+    lines = []
+    for line_start in range(0, len(values), 12):
+        lines.append('    ' + ' '.join(f"{value:#x}," for value in values[line_start:line_start + 12]))
+    return '\n'.join(lines)
+
+
+def generate_tables(script_path: str) -> str:
+    """
+        source of the unicode_tables module
+    """
+    categories = _runs(unicodedata.category(chr(char)) for char in range(0, MAX_CHAR + 1))
+    scripts = _runs(_read_scripts(script_path))
+    parts = [
+        '"""\n    generated by python -m iparser.lexical.unicode_properties, do not edit.\n'
+        '    every table is the start of each run of code points sharing a value, ascending\n'
+        '    from 0 to 0x10FFFF, and the index of that value in the names of the table\n"""',
+        f"UNICODE_VERSION = {unicodedata.unidata_version!r}",
+    ]
+    for prefix, (names, starts, indexes) in (('CATEGORY', categories), ('SCRIPT', scripts)):
+        parts.append(f"{prefix}_NAMES = {tuple(names)!r}")
+        parts.append(f"{prefix}_STARTS = (\n{_format_ints(starts)}\n)")
+        hex_lines = [bytes(indexes[start:start + 48]).hex() for start in range(0, len(indexes), 48)]
+        parts.append(f"{prefix}_INDEXES = bytes.fromhex(\n" + '\n'.join(f"    '{line}'" for line in hex_lines) + "\n)")
+    return '\n'.join(parts) + '\n'
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'unicode_tables.py'), 'w', encoding='utf-8') as output:
+        output.write(generate_tables(sys.argv[1]))
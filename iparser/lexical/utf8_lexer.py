@@ -0,0 +1,222 @@
+from typing import *
+from bisect import bisect_right
+from iparser.lexical.acceleration import run_skippers
+from iparser.lexical.charset import EquivalenceClassCharSetManager, MAX_CHAR
+from iparser.lexical.lexer import CompiledLexer, NO_ACTION, POP_ACTION, expect_compiled
+from iparser.lexical.line_index import LineIndex
+from iparser.lexical.token import TokenBuffer
+from iparser.lexical.transition_table import TransitionTable, DenseTransitionTable, ArrayTransitionTable
+
+SURROGATE_START = 0xD800
+SURROGATE_END = 0xDFFF
+
+# (lead byte range, number of continuation bytes, payload bits of the lead byte, smallest code point)
+_UTF8_LEADS = (
+    (range(0xC2, 0xE0), 1, 0x1F, 0x80),
+    (range(0xE0, 0xF0), 2, 0x0F, 0x800),
+    (range(0xF0, 0xF5), 3, 0x07, 0x10000),
+)
+
+
+class Utf8DFALowering:
+    """
+        lower a lexer over code point classes into a lexer over the 256 byte values of
+        its UTF-8 encoding. the states of the original lexer keep their index, the
+        states in the middle of a multi byte char are appended after them and never
+        accept, so a token can only end on a char boundary.
+        intermediate states are hash consed by the code point -> target mapping they
+        still have to resolve, states with the same pending mapping are shared
+    """
+
+    def __init__(self, lexer: CompiledLexer) -> None:
+        expect_compiled(lexer, "utf-8 lowering")
+        if not isinstance(lexer.charset_manager, EquivalenceClassCharSetManager):
+            raise ValueError("utf-8 lowering needs a lexer built on EquivalenceClassCharSetManager")
+        self._lexer = lexer
+        self._rows: List[List[int]] = []
+        self._nodes: Dict[Tuple, int] = {}
+        # piecewise constant code point -> target mapping of the state being lowered
+        self._starts: List[int] = []
+        self._targets: List[int] = []
+
+    @staticmethod
+    def lower(lexer: CompiledLexer, table_class: Type[TransitionTable]=DenseTransitionTable) -> CompiledLexer:
+        """
+            the returned lexer has no charset manager, its symbols are the byte values
+        """
+        lowering = Utf8DFALowering(lexer)
+        rows = lowering._build()
+        accept_table = list(lexer.accept_table) + [-1] * (len(rows) - len(lexer.accept_table))
+        keywords = lexer.keywords.encode('utf-8') if lexer.keywords is not None else None
+        return CompiledLexer(table_class(rows), accept_table, lexer.token_names, None, lexer.modes, keywords, byte_level=True)
+
+    def _set_mapping(self, row: Sequence[int]):
+        charset_manager: EquivalenceClassCharSetManager = self._lexer.charset_manager
+        starts, targets = [], []
+        for start, class_id in zip(charset_manager.segment_starts, charset_manager.segment_classes):
+            target = row[class_id]
+            if targets and targets[-1] == target:
+                continue
+            starts.append(start)
+            targets.append(target)
+        self._starts, self._targets = starts, targets
+
+    def _target_of(self, char: int) -> int:
+        if SURROGATE_START <= char <= SURROGATE_END:
+            return 0
+        return self._targets[bisect_right(self._starts, char) - 1]
+
+    def _pieces(self, low: int, high: int) -> Tuple[Tuple[int, int]]:
+        """
+            the mapping restricted to [low, high] as (start, target) pieces
+        """
+        first = bisect_right(self._starts, low) - 1
+        last = bisect_right(self._starts, high)
+        pieces = [(max(self._starts[index], low), self._targets[index]) for index in range(first, last)]
+        # surrogates can not be encoded, they behave like chars without a transition
+        if low <= SURROGATE_END and high >= SURROGATE_START:
+            pieces = [piece for piece in pieces if not SURROGATE_START <= piece[0] <= SURROGATE_END]
+            pieces.append((max(low, SURROGATE_START), 0))
+            if high > SURROGATE_END:
+                pieces.append((SURROGATE_END + 1, self._targets[bisect_right(self._starts, SURROGATE_END + 1) - 1]))
+            pieces.sort()
+        return tuple(pieces)
+
+    def _node(self, remaining: int, base: int, low: int, high: int) -> int:
+        """
+            state that reads `remaining` continuation bytes of the code points in
+            [low, high], all sharing the leading bits `base`
+        """
+        pieces = self._pieces(low, high)
+        if all(target == 0 for _, target in pieces):
+            return 0
+        key = (remaining, low - base, high - base, tuple((start - base, target) for start, target in pieces))
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+        row = [0] * 256
+        span = 1 << (6 * (remaining - 1))
+        for payload in range(0, 64):
+            sub_low = max(low, base + payload * span)
+            sub_high = min(high, base + (payload + 1) * span - 1)
+            if sub_low > sub_high:
+                continue
+            if remaining == 1:
+                row[0x80 | payload] = self._target_of(sub_low)
+            else:
+                row[0x80 | payload] = self._node(remaining - 1, base + payload * span, sub_low, sub_high)
+        node = len(self._rows)
+        self._rows.append(row)
+        self._nodes[key] = node
+        return node
+
+    def _build(self) -> List[List[int]]:
+        table = self._lexer.transition_table
+        self._rows = [[0] * 256 for _ in range(0, table.state_num)]
+        for state in range(1, table.state_num):
+            self._set_mapping([table.next_state(state, symbol) for symbol in range(0, table.symbol_num)])
+            row = self._rows[state]
+            for byte in range(0, 0x80):
+                row[byte] = self._target_of(byte)
+            for leads, remaining, payload_mask, min_char in _UTF8_LEADS:
+                for lead in leads:
+                    base = (lead & payload_mask) << (6 * remaining)
+                    low = max(base, min_char)
+                    high = min(base + (1 << (6 * remaining)) - 1, MAX_CHAR)
+                    if low <= high:
+                        row[lead] = self._node(remaining, base, low, high)
+        return self._rows
+
+
+class ByteScanner:
+    """
+        tokenize bytes, bytearray, memoryview or mmap buffers holding UTF-8 text with a
+        lexer lowered by Utf8DFALowering, without decoding. tokens are reported as
+        (token index, start byte offset, end byte offset). the flat buffer of an
+        ArrayTransitionTable is indexed in place, so a table mapped from a file by
+        serialization.load keeps sharing its pages, other tables are packed into one
+    """
+
+    def __init__(self, buffer, lexer: CompiledLexer) -> None:
+        expect_compiled(lexer, "ByteScanner")
+        if not lexer.byte_level:
+            raise ValueError("ByteScanner needs a byte level lexer, see Utf8DFALowering.lower")
+        table = lexer.transition_table
+        if not isinstance(table, ArrayTransitionTable):
+            table = ArrayTransitionTable(table.rows())
+        if table.symbol_num != 256:
+            raise ValueError(f"a byte level lexer has 256 symbols, not {table.symbol_num}")
+        self._buffer = buffer
+        self._lexer = lexer
+        self._table = table.buffer
+        self._skippers = run_skippers(table, None, byte_level=True)
+
+    @property
+    def lexer(self) -> CompiledLexer: return self._lexer
+
+    def token_spans(self, start: int=0, end: int=None, keep_skipped: bool=False) -> Iterable[Tuple[int, int, int]]:
+        """
+            the scan starts in the default mode, skipped tokens are only reported
+            with keep_skipped
+        """
+        buffer = self._buffer
+        table = self._table
+        skippers = self._skippers
+        accept_table = self._lexer.accept_table
+        modes = self._lexer.modes
+        keywords = self._lexer.keywords.tables if self._lexer.keywords is not None else None
+        mode_stack = [0]
+        start_state = 1
+        length = len(buffer) if end is None else end
+        position = start
+        while position < length:
+            token_start = position
+            state = start_state
+            row = state << 8
+            token_index, token_end = -1, token_start
+            while position < length:
+                target = table[row + buffer[position]]
+                if not target:
+                    break
+                position += 1
+                if target == state and skippers[state] is not None:
+                    position = skippers[state](buffer, position, length).end()
+                state = target
+                row = state << 8
+                if accept_table[state] != -1:
+                    token_index, token_end = accept_table[state], position
+            if token_index == -1:
+                raise Exception(f"error token: {bytes(buffer[token_start:position + 1])!r} at byte {token_start}")
+            position = token_end
+            if keywords is not None and keywords[token_index] is not None:
+                token_index = keywords[token_index].get(bytes(buffer[token_start:position]), token_index)
+            if modes is not None:
+                action = modes.actions[token_index]
+                if action == POP_ACTION:
+                    if len(mode_stack) == 1:
+                        raise Exception(f"can not pop the last lexer mode at byte {token_start}")
+                    mode_stack.pop()
+                elif action != NO_ACTION:
+                    mode_stack.append(action)
+                start_state = modes.start_states[mode_stack[-1]]
+                if modes.skips[token_index] and not keep_skipped:
+                    continue
+            yield token_index, token_start, position
+
+    def token_stream(self) -> Iterable[Tuple[str, bytes]]:
+        """
+            (token name, raw bytes) pairs, convenient when the values are needed
+        """
+        for token_index, start, end in self.token_spans():
+            yield self._lexer.token_name(token_index), bytes(self._buffer[start:end])
+
+    def token_buffer(self) -> TokenBuffer:
+        """
+            all tokens as parallel arrays, values are sliced from the buffer on access and
+            positions count bytes
+        """
+        token_buffer = TokenBuffer(self._lexer.token_names, self._buffer, LineIndex(self._buffer))
+        append = token_buffer.append
+        for token_index, start, end in self.token_spans():
+            append(token_index, start, end)
+        return token_buffer
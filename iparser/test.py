@@ -68,7 +68,7 @@ if __name__ == "__main__":
     # definitions.define("ASSIGN", RE.char("为"))
     # definitions.define("LEFT", RE.char("("))
     # definitions.define("RIGHT", RE.char(")"))
-    definitions.define("ID", (RE.cal_by(is_letter) | RE.char("_")) + (RE.cal_by(is_letter) | RE.cal_by(is_number) | RE.char("_")).any_times())
+    definitions.define("ID", (RE.category("L") | RE.char("_")) + (RE.category("L", "Nd") | RE.char("_")).any_times())
     # definitions.define("BLANK", RE.char(" ").at_least_once())
     # definitions.define("NUMBER", RE.range('0', '9'))
     # definitions.define("ID", RE.cal_by(is_letter))
@@ -0,0 +1,67 @@
+from typing import *
+import random
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.token import ReTokenDefinitions
+
+PIECES = ['if', 'while', 'abc', 'x_1', '12', '3.14', '1.', '.', '=', '==', '<=', '<', '"s t"', 'αβγ',
+          '# note\n', ' ', '  ', '\n', '\t']
+
+
+def token_grammar(skip: bool=True) -> ReTokenDefinitions:
+    """
+        keywords, longest match with backtracking (3.14 against 1.), non ascii chars
+        and, with skip, skipped blanks and comments
+    """
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z_][a-z0-9_]*', keywords={"IF": "if", "WHILE": "while"})
+    definitions.define("FLOAT", r'\d+\.\d+')
+    definitions.define("NUM", r'\d+')
+    definitions.define("DOT", r'\.')
+    definitions.define("OP", r'==|=|<=|<')
+    definitions.define("STR", r'"[^"\n]*"')
+    definitions.define("GREEK", r'\p{Greek}+')
+    definitions.define("BLANK", r'[ \t\n]+', skip=skip)
+    definitions.define("COMMENT", r'#[^\n]*', skip=skip)
+    return definitions
+
+
+def mode_grammar() -> ReTokenDefinitions:
+    """
+        strings scanned in a mode of their own, entered and left by the quote
+    """
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+')
+    definitions.define("BLANK", r' +', skip=True)
+    definitions.define("OPEN", r'"', push="string")
+    definitions.define("CHARS", r'[^"\\]+', mode="string")
+    definitions.define("ESCAPE", r'\\.', mode="string")
+    definitions.define("CLOSE", r'"', mode="string", pop=True)
+    return definitions
+
+
+def random_text(seed: int, piece_num: int, pieces=PIECES) -> str:
+    rand = random.Random(seed)
+    return ''.join(rand.choice(pieces) for _ in range(piece_num))
+
+
+def random_mode_text(seed: int, piece_num: int) -> str:
+    rand = random.Random(seed)
+    parts = []
+    for _ in range(piece_num):
+        if rand.random() < 0.3:
+            parts.append('"' + ''.join(rand.choice(['ab', ' ', '\\"', '\\\\', 'é']) for _ in range(rand.randint(0, 4))) + '"')
+        else:
+            parts.append(rand.choice(['abc', ' ', 'x']))
+    return ''.join(parts)
+
+
+def scan(lexer, text: str) -> List[Tuple[str, int, int]]:
+    """
+        (name, start, end) of the tokens of the string scanner
+    """
+    return [(token.name, token.start, token.end) for token in Scanner(StringReader(text), lexer).token_stream()]
+
+
+def named_values(lexer, text: str) -> List[Tuple[str, str]]:
+    return [(token.name, token.value) for token in Scanner(StringReader(text), lexer).token_stream()]
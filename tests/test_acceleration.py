@@ -0,0 +1,85 @@
+import io
+import random
+from iparser.lexical.acceleration import literal_jumps, longest_matcher, run_skippers
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.scanner import Scanner
+from iparser.lexical.search import Searcher
+from iparser.lexical.stream_reader import StreamReader
+from iparser.lexical.token import ReTokenDefinitions
+from tests.grammars import token_grammar, random_text, scan
+
+
+def comment_grammar() -> ReTokenDefinitions:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("COMMENT", RE.literal('/*') + RE.any_except('*').any_times() + RE.literal('*/'))
+    definitions.define("BEGIN", RE.literal('begin'))
+    definitions.define("BEGINNING", RE.literal('beginning'))
+    definitions.define("ID", (RE.range('a', 'z') | RE.char('*')).at_least_once())
+    definitions.define("BLANK", RE.chars(' ', '\n').at_least_once())
+    definitions.define("SLASH", RE.char('/'))
+    definitions.define("ANNOTATION", RE.literal('@interface'))
+    definitions.define("ARROW", RE.literal('-->'))
+    return definitions
+
+
+def matchers(lexer):
+    next_state = lexer.transition_table.next_state
+    char_to_index = lexer.charset_manager.char_to_index
+    plain = longest_matcher(next_state, char_to_index, lexer.accept_table)
+    accelerated = longest_matcher(next_state, char_to_index, lexer.accept_table,
+                                  run_skippers(lexer.transition_table, lexer.charset_manager),
+                                  literal_jumps(lexer.transition_table, lexer.accept_table, lexer.charset_manager))
+    return plain, accelerated
+
+
+def test_accelerated_match_equals_stepping_at_every_offset():
+    pieces = ['/* a ** b */', '/*', '*/', 'begin', 'beginning', 'begi', '   ', '\n', 'x', '/', '*', '@interface', '-->', '-']
+    rand = random.Random(3)
+    text = ''.join(rand.choice(pieces) for _ in range(400))
+    for definitions in (comment_grammar(), token_grammar()):
+        lexer = CompiledLexer.compile(definitions)
+        plain, accelerated = matchers(lexer)
+        for position in range(0, len(text)):
+            assert accelerated(text, position, len(text), 1) == plain(text, position, len(text), 1)
+
+
+def test_literal_jumps_spell_the_forced_literals():
+    lexer = CompiledLexer.compile(comment_grammar())
+    jumps = lexer.literal_jumps()
+    next_state = lexer.transition_table.next_state
+    char_to_index = lexer.charset_manager.char_to_index
+    literals = set()
+    for state, jump in enumerate(jumps):
+        if jump is None:
+            continue
+        literal, target = jump
+        assert len(literal) >= 2 and lexer.accept_table[state] == -1
+        for char in literal:
+            state = next_state(state, char_to_index(ord(char)))
+        assert state == target
+        literals.add(literal)
+    assert {'interface', '->'} <= literals
+
+
+def test_scanner_with_and_without_skippers():
+    for definitions, text in ((token_grammar(), random_text(11, 3000)), (comment_grammar(), '/* a ** b */ beginning begin /x @interface -->')):
+        lexer = CompiledLexer.compile(definitions)
+        # the reader path steps the dfa char by char
+        reader = StreamReader(io.StringIO(text), buffer_size=64)
+        assert scan(lexer, text) == [(token.name, token.start, token.end) for token in Scanner(reader, lexer).token_stream()]
+
+
+def test_searcher_prefix_candidates():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("TAG", RE.literal('<!') + RE.range('a', 'z').at_least_once())
+    definitions.define("END", RE.literal('<!--'))
+    searcher = Searcher.compile(definitions)
+    assert searcher.prefix == '<!'
+    text = 'x <!abc <!-- <! <!<!d !<a'
+    starts = searcher.match_starts(text)
+    assert all(text.startswith('<!', offset) for offset in range(0, len(text)) if starts[offset])
+    assert [(token.name, token.value) for token in searcher.find_all(text)] == \
+        [('TAG', '<!abc'), ('END', '<!--'), ('TAG', '<!d')]
+    assert Searcher.compile(token_grammar()).prefix == ''
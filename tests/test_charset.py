@@ -0,0 +1,27 @@
+import random
+from iparser.lexical.charset import CharSet, ASCIICharSetManager, EquivalenceClassCharSetManager, MAX_CHAR
+
+
+def test_ascii_manager_looks_up_the_alphabet_only():
+    manager = ASCIICharSetManager()
+    letters = CharSet([(ord('A'), ord('Z')), (0x100, MAX_CHAR)])
+    assert manager.char_set_to_indexes(letters) == set(range(ord('A'), ord('Z') + 1))
+    assert manager.char_set_to_indexes(CharSet.of_range(0x80, MAX_CHAR)) == set()
+
+
+def test_equivalence_classes_split_by_covering_sets():
+    rand = random.Random(1)
+    char_sets = []
+    for _ in range(20):
+        start = rand.randrange(0, 300)
+        char_sets.append(CharSet.of_range(start, start + rand.randrange(0, 40)))
+    char_sets.append(CharSet.of_range(0x10000, MAX_CHAR))
+    manager = EquivalenceClassCharSetManager.from_char_sets(char_sets)
+    for char in list(range(0, 400)) + [0xFFFF, 0x10000, MAX_CHAR - 7]:
+        key = frozenset(index for index, char_set in enumerate(char_sets) if char in char_set)
+        for other in (char + 1, char + 7):
+            other_key = frozenset(index for index, char_set in enumerate(char_sets) if other in char_set)
+            assert (manager.char_to_index(char) == manager.char_to_index(other)) == (key == other_key)
+    for char_set in char_sets:
+        classes = manager.char_set_to_indexes(char_set)
+        assert classes == {manager.char_to_index(char) for char in char_set}
@@ -0,0 +1,79 @@
+import pytest
+from iparser.lexical.charset import ASCIICharSetManager
+from iparser.lexical.codegen import ScannerCodeGenerator
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.lexer import CompiledLexer, LexerModes, LexerKeywords
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.utf8_lexer import Utf8DFALowering
+from tests.grammars import token_grammar, mode_grammar, random_text, random_mode_text, named_values
+
+
+def generated(lexer: CompiledLexer):
+    return ScannerCodeGenerator.load(ScannerCodeGenerator.generate_from_lexer(lexer))
+
+
+def tokenize(module, text: str):
+    return [(name, value) for _, name, value in module.tokenize(text)]
+
+
+def scanner_error(lexer, text: str) -> str:
+    with pytest.raises(Exception) as error:
+        list(Scanner(StringReader(text), lexer).token_stream())
+    return str(error.value)
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return CompiledLexer.compile(token_grammar())
+
+
+def test_same_tokens_as_scanner(lexer):
+    text = random_text(1, 3000)
+    assert tokenize(generated(lexer), text) == named_values(lexer, text)
+
+
+def test_modes(lexer):
+    lexer = CompiledLexer.compile(mode_grammar())
+    text = random_mode_text(2, 500)
+    assert tokenize(generated(lexer), text) == named_values(lexer, text)
+
+
+@pytest.mark.parametrize("text", ['abc ~', 'if\n  1.5 ~x', '"open\n'])
+def test_same_error_as_scanner(lexer, text):
+    with pytest.raises(Exception) as error:
+        list(generated(lexer).tokenize(text))
+    assert str(error.value) == scanner_error(lexer, text)
+
+
+def test_dfa_model_with_modes_and_keywords():
+    definitions = mode_grammar()
+    definitions.define("KW", r'[A-Z]+', keywords={"BEGIN": "BEGIN"})
+    mode_starts = []
+    dfa_model = DFAModel(FlatNFABuilder.from_definitions(definitions, mode_starts), start_states=mode_starts[1:])
+    dfa_model.init()
+    token_names = [definition.name for definition in definitions.definitions]
+    with pytest.raises(ValueError, match="LexerModes"):
+        ScannerCodeGenerator.generate_from_dfa_model(dfa_model, token_names)
+    module = ScannerCodeGenerator.load(ScannerCodeGenerator.generate_from_dfa_model(
+        dfa_model, token_names, LexerModes.from_definitions(definitions, dfa_model.start_state_indexes),
+        LexerKeywords.from_definitions(definitions)))
+    text = 'BEGIN END "a\\" b" x'
+    assert tokenize(module, text) == named_values(CompiledLexer.compile(definitions), text)
+    assert ('BEGIN', 'BEGIN') in tokenize(module, text)
+
+
+def test_chars_outside_a_small_alphabet_are_errors():
+    dfa_model = DFAModel(FlatNFABuilder.from_definitions(token_grammar()), ASCIICharSetManager())
+    dfa_model.init()
+    token_names = [definition.name for definition in token_grammar().definitions]
+    module = ScannerCodeGenerator.load(ScannerCodeGenerator.generate_from_dfa_model(dfa_model, token_names))
+    assert tokenize(module, 'ab 12') == [('ID', 'ab'), ('BLANK', ' '), ('NUM', '12')]
+    for char in ('é', 'α', '\U0001F600'):
+        with pytest.raises(Exception, match="error token"):
+            list(module.tokenize('ab' + char))
+
+
+def test_byte_level_lexer_is_rejected(lexer):
+    with pytest.raises(ValueError, match="char level"):
+        ScannerCodeGenerator.generate_from_lexer(Utf8DFALowering.lower(lexer))
@@ -0,0 +1,81 @@
+from iparser.lexical.charset import CharSet
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFA, FlatNFABuilder
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regex_parser import RegexParser
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.token import ReTokenDefinitions
+from tests.grammars import mode_grammar
+
+SAMPLES = ['', 'a', 'ab', 'abab', 'aba', 'b', 'x1', 'abx1', 'abab12', 'ba']
+
+
+def test_builder_compresses_edges_by_source():
+    builder = FlatNFABuilder()
+    states = [builder.new_state() for _ in range(0, 3)]
+    builder.add_edge(states[2], CharSet.of_char(ord('c')), states[0])
+    builder.add_edge(states[0], CharSet.of_char(ord('a')), states[1])
+    builder.add_epsilon(states[1], states[2])
+    builder.add_edge(states[0], CharSet.of_char(ord('a')), states[2])
+    builder.set_token_index(states[2], 0)
+    nfa = builder.build(states[0])
+    assert list(nfa.edge_offsets) == [0, 2, 2, 3]
+    assert list(nfa.epsilon_offsets) == [0, 0, 1, 1]
+    assert sorted(nfa.edge_targets[0:2]) == [1, 2] and list(nfa.edge_targets[2:3]) == [0]
+    # equal char sets share one symbol id
+    assert len(nfa.char_sets) == 2
+    assert nfa.accepts('a') and nfa.accepts('aca') and not nfa.accepts('') and not nfa.accepts('c')
+
+
+def test_expressions():
+    expression = (RE.literal('ab').any_times() + RE.range('a', 'z').any_times() + RE.range('0', '9').at_least_once()) | RE.literal('ba')
+    nfa = FlatNFABuilder.from_expression(expression)
+    for text, accepted in (('1', True), ('abab12', True), ('x1', True), ('ba', True), ('ab', False), ('', False), ('1a', False)):
+        assert nfa.accepts(text) == accepted
+
+
+def test_shared_fragments_are_copied():
+    # at_least_once and the parser reuse one expression object, its fragment is copied
+    inner = RE.literal('ab') | RE.char('c')
+    expression = inner + inner.at_least_once()
+    nfa = FlatNFABuilder.from_expression(expression)
+    for text, accepted in (('abc', True), ('cabab', True), ('ab', False), ('abca', False)):
+        assert nfa.accepts(text) == accepted
+    parsed = RegexParser().parse('(ab|c){2,3}')
+    nfa = FlatNFABuilder.from_expression(parsed)
+    assert [nfa.accepts(text) for text in ('ab', 'abc', 'ccab', 'abcab c', 'cccc')] == [False, True, True, False, False]
+
+
+def test_from_nfa_model_agrees():
+    expression = RE.literal('ab').any_times() + RE.range('a', 'z').any_times() + RE.range('0', '9').at_least_once()
+    nfa_model = expression.to_nfa_model(NFAModelConverter())
+    nfa_model.tail_state.token_index = 0
+    converted = FlatNFA.from_nfa_model(nfa_model)
+    built = FlatNFABuilder.from_expression(expression)
+    assert converted.state_num == len(nfa_model.states)
+    for text in SAMPLES:
+        assert converted.accepts(text) == built.accepts(text)
+    dfa_model = DFAModel(converted)
+    dfa_model.init()
+    assert dfa_model.state_num > 1
+
+
+def test_mode_starts():
+    definitions = mode_grammar()
+    mode_starts = []
+    nfa = FlatNFABuilder.from_definitions(definitions, mode_starts)
+    assert len(mode_starts) == len(definitions.modes()) == 2
+    assert mode_starts[0] == nfa.init_state
+    assert set(nfa.token_indexes) - {-1} == set(range(0, len(definitions.definitions)))
+
+
+def test_keyword_definitions_add_no_states():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+')
+    plain = FlatNFABuilder.from_definitions(definitions)
+    definitions.define("ID2", r'[0-9]+', keywords={"ZERO": "0", "ONE": "1"})
+    with_keywords = FlatNFABuilder.from_definitions(definitions)
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+')
+    definitions.define("ID2", r'[0-9]+')
+    assert with_keywords.state_num == FlatNFABuilder.from_definitions(definitions).state_num > plain.state_num
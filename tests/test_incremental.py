@@ -0,0 +1,67 @@
+import random
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.incremental import IncrementalScanner
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.token import ReTokenDefinitions
+
+
+def spans(tokens):
+    return [(token.name, token.value, token.start, token.end) for token in tokens]
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define('IF', RE.literal('if'))
+    definitions.define('ID', RE.range('a', 'z').at_least_once())
+    definitions.define('NUM', RE.range('0', '9').at_least_once())
+    definitions.define('EQ', RE.literal('=='))
+    definitions.define('AS', RE.literal('='))
+    definitions.define('STR', RE.char('"') + RE.any_except('"').any_times() + RE.char('"'))
+    definitions.define('BLANK', RE.chars(' ', '\n').at_least_once(), skip=True)
+    return IncrementalScanner(CompiledLexer.compile(definitions))
+
+
+def test_random_edits_match_full_rescan(scanner):
+    rand = random.Random(3)
+    text = ' '.join(rand.choice(['if', 'abc', '12', '==', '=', '"s t"', 'x']) for _ in range(120))
+    tokens = scanner.scan(text)
+    edits = 0
+    while edits < 3000:
+        offset = rand.randrange(len(text) + 1)
+        deleted_length = rand.randint(0, min(3, len(text) - offset))
+        inserted_text = ''.join(rand.choice('ab1 =f"\n') for _ in range(rand.randint(0, 3)))
+        new_text = text[:offset] + inserted_text + text[offset + deleted_length:]
+        try:
+            expected = spans(scanner.scan(new_text))
+        except Exception:
+            # an unterminated string, the edit is not applied
+            continue
+        old = spans(tokens)
+        first, old_end, window = scanner.edit(tokens, offset, deleted_length, inserted_text)
+        assert tokens.text == new_text
+        assert spans(tokens) == expected
+        assert spans(window) == expected[first:first + len(window)]
+        assert old[:first] + spans(window) == expected[:first + len(window)]
+        assert len(old) - old_end == len(expected) - first - len(window)
+        text = new_text
+        edits += 1
+
+
+def test_edit_rescans_only_a_window(scanner):
+    text = 'abc 12 == x ' * 100000
+    tokens = scanner.scan(text)
+    token_num = len(tokens)
+    for offset in (600000, 10, 1199990, 600000):
+        first, old_end, window = scanner.edit(tokens, offset, 1, 'q')
+        assert old_end - first <= 2 and len(window) <= 2
+    assert len(tokens) == token_num
+    assert spans(tokens[-2:]) == spans(scanner.scan(tokens.text)[-2:])
+
+
+def test_edit_out_of_text(scanner):
+    tokens = scanner.scan('abc')
+    with pytest.raises(ValueError):
+        scanner.edit(tokens, 2, 2, '')
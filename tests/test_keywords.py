@@ -0,0 +1,78 @@
+import io
+import pytest
+from iparser.lexical.codegen import ScannerCodeGenerator
+from iparser.lexical.lazy_dfa import LazyLexer
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.scanner import Scanner
+from iparser.lexical.search import Searcher
+from iparser.lexical.stream_reader import StreamReader
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.utf8_lexer import Utf8DFALowering, ByteScanner
+from tests.grammars import token_grammar, random_text, named_values
+
+
+def keyword_grammar() -> ReTokenDefinitions:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("FOR_LOOP", r'for')
+    definitions.define("ID", r'[a-zé]+', keywords={"IF": "if", "CAFE": "café", "FOR": "for"})
+    definitions.define("ELSE", r'else')
+    definitions.define("BLANK", r' +', skip=True)
+    return definitions
+
+
+def test_keywords_take_priority_over_the_host():
+    lexer = CompiledLexer.compile(keyword_grammar())
+    assert named_values(lexer, 'if iff i café cafés') == \
+        [('IF', 'if'), ('ID', 'iff'), ('ID', 'i'), ('CAFE', 'café'), ('ID', 'cafés')]
+    # a keyword ranks like a literal token right before its host: an earlier token
+    # still wins, a later one loses to the keyword host
+    assert named_values(lexer, 'for else') == [('FOR_LOOP', 'for'), ('ID', 'else')]
+
+
+def test_keywords_are_not_states_of_the_automaton():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+')
+    plain = CompiledLexer.compile(definitions)
+    lexer = CompiledLexer.compile(keyword_grammar())
+    assert lexer.keywords is not None and plain.keywords is None
+    host = lexer.token_names.index('ID')
+    assert lexer.keywords.tables[host] == {'if': lexer.token_names.index('IF'), 'café': lexer.token_names.index('CAFE'),
+                                          'for': lexer.token_names.index('FOR')}
+    assert lexer.reclassify(host, 'if') == lexer.token_names.index('IF')
+    assert lexer.reclassify(host, 'ifs') == host
+
+
+def test_invalid_keywords():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+', keywords={"NUM": "12"})
+    with pytest.raises(ValueError, match="not matched by token ID"):
+        CompiledLexer.compile(definitions)
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    with pytest.raises(Exception, match="same keyword"):
+        definitions.define("ID", r'[a-z]+', keywords={"IF": "if", "IF2": "if"})
+    with pytest.raises(Exception, match="can not have keywords"):
+        definitions.define("BLANK", r' +', skip=True, keywords={"TWO": "  "})
+
+
+def test_backends_agree():
+    definitions = keyword_grammar()
+    lexer = CompiledLexer.compile(definitions)
+    text = 'if café iff for ifelse else ' * 20
+    expected = named_values(lexer, text)
+    reader = StreamReader(io.StringIO(text), buffer_size=3)
+    assert [(token.name, token.value) for token in Scanner(reader, lexer).token_stream()] == expected
+    module = ScannerCodeGenerator.load(ScannerCodeGenerator.generate_from_lexer(lexer))
+    assert [(name, value) for _, name, value in module.tokenize(text)] == expected
+    data = text.encode('utf-8')
+    lowered = Utf8DFALowering.lower(lexer)
+    assert [(lowered.token_name(index), data[start:end].decode('utf-8'))
+            for index, start, end in ByteScanner(data, lowered).token_spans()] == expected
+    assert [(token.name, token.value) for token in Searcher.compile(definitions).find_all(text)] == expected
+
+
+def test_lazy_lexer_keywords():
+    definitions = token_grammar(skip=False)
+    text = random_text(13, 500)
+    assert named_values(LazyLexer.compile(definitions), text) == named_values(CompiledLexer.compile(definitions), text)
+    assert ('IF', 'if') in named_values(CompiledLexer.compile(definitions), text)
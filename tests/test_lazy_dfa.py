@@ -0,0 +1,62 @@
+import io
+import pytest
+from iparser.lexical.codegen import ScannerCodeGenerator
+from iparser.lexical.incremental import IncrementalScanner
+from iparser.lexical.lazy_dfa import LazyLexer
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.memory import freeze_report
+from iparser.lexical.parallel import ParallelScanner
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.serialization import dumps
+from iparser.lexical.stream_reader import StreamReader
+from iparser.lexical.utf8_lexer import Utf8DFALowering, ByteScanner
+from tests.grammars import token_grammar, mode_grammar, random_text, scan
+
+
+@pytest.fixture(scope="module")
+def text():
+    return random_text(1, 3000)
+
+
+@pytest.mark.parametrize("max_states", [3, 8, 4096])
+def test_same_tokens_as_the_complete_dfa(text, max_states):
+    lazy = LazyLexer.compile(token_grammar(skip=False), max_states=max_states)
+    assert scan(lazy, text) == scan(CompiledLexer.compile(token_grammar(skip=False)), text)
+    if max_states < 10:
+        assert lazy.model.flush_num > 0
+    else:
+        assert lazy.model.flush_num == 0
+
+
+def test_cache_stays_within_max_states(text):
+    lazy = LazyLexer.compile(token_grammar(skip=False), max_states=5)
+    for _ in Scanner(StringReader(text), lazy).token_stream():
+        assert lazy.model.state_num <= 5
+
+
+def test_reader_path(text):
+    lazy = LazyLexer.compile(token_grammar(skip=False), max_states=6)
+    reader = StreamReader(io.StringIO(text), buffer_size=11)
+    assert [(token.name, token.start, token.end) for token in Scanner(reader, lazy).token_stream()] == \
+        scan(CompiledLexer.compile(token_grammar(skip=False)), text)
+
+
+def test_rejected_grammars_and_sizes():
+    with pytest.raises(ValueError):
+        LazyLexer.compile(token_grammar())
+    with pytest.raises(ValueError):
+        LazyLexer.compile(mode_grammar())
+    with pytest.raises(ValueError, match="at least 3"):
+        LazyLexer.compile(token_grammar(skip=False), max_states=2)
+
+
+def test_users_of_a_complete_dfa_reject_it():
+    lazy = LazyLexer.compile(token_grammar(skip=False))
+    assert not isinstance(lazy, CompiledLexer)
+    uses = (Utf8DFALowering.lower, ScannerCodeGenerator.generate_from_lexer, ParallelScanner, dumps,
+            IncrementalScanner, freeze_report, lambda lexer: ByteScanner(b'', lexer))
+    for use in uses:
+        with pytest.raises(TypeError, match="CompiledLexer"):
+            use(lazy)
+    with pytest.raises(TypeError):
+        lazy.transition_table.rows()
@@ -0,0 +1,87 @@
+import io
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.line_index import LineIndex, StreamLineIndex
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.stream_reader import StreamReader, MmapReader
+from tests.grammars import token_grammar, random_text
+
+
+def expected_position(text, offset):
+    line = text.count('\n', 0, offset)
+    return line, offset - (text.rfind('\n', 0, offset) + 1)
+
+
+def positions(reader, lexer):
+    """
+        positions asked for while the tokens are streamed, like a parser does
+    """
+    return [(token.name, token.start_position, token.end_position) for token in Scanner(reader, lexer).token_stream()]
+
+
+def expected_positions(lexer, text):
+    return [(token.name, expected_position(text, token.start), expected_position(text, token.end))
+            for token in Scanner(StringReader(text), lexer).token_stream()]
+
+
+def test_line_index_of_strings_and_bytes():
+    text = 'ab\ncd\n\nef'
+    for source in (text, text.encode('utf-8'), memoryview(text.encode('utf-8'))):
+        lines = LineIndex(source)
+        assert list(lines.line_starts) == [0, 3, 6, 7]
+        assert lines.line_num() == 4
+        for offset in range(0, len(text) + 1):
+            assert lines.line_column(offset) == expected_position(text, offset)
+
+
+def test_string_reader_positions():
+    lexer = CompiledLexer.compile(token_grammar())
+    text = random_text(7, 2000)
+    assert positions(StringReader(text), lexer) == expected_positions(lexer, text)
+
+
+@pytest.mark.parametrize("buffer_size", [1, 5, 4096])
+def test_stream_reader_positions(buffer_size):
+    lexer = CompiledLexer.compile(token_grammar())
+    text = random_text(8, 2000)
+    assert positions(StreamReader(io.StringIO(text), buffer_size=buffer_size), lexer) == expected_positions(lexer, text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, MmapReader.DEFAULT_CHUNK_SIZE])
+def test_mmap_reader_positions(tmp_path, chunk_size):
+    lexer = CompiledLexer.compile(token_grammar())
+    text = random_text(9, 2000)
+    path = tmp_path / "input.txt"
+    path.write_text(text, encoding='utf-8')
+    with MmapReader(str(path), chunk_size=chunk_size) as reader:
+        assert positions(reader, lexer) == expected_positions(lexer, text)
+
+
+def test_stream_index_is_bounded():
+    lines = StreamLineIndex()
+    text = ''.join(f"line {number}\n" for number in range(0, 1000))
+    chunks = [text[offset:offset + 10] for offset in range(0, len(text), 10)]
+    offset = 0
+    for chunk in chunks:
+        lines.add_chunk(chunk, offset)
+        offset += len(chunk)
+        assert lines.line_column(offset - 1) == expected_position(text, offset - 1)
+        assert len(lines.line_starts) <= 4
+    assert lines.line_num() == 1001
+    assert lines.first_offset == len(text) - 20
+    with pytest.raises(ValueError, match="dropped"):
+        lines.line_column(0)
+
+
+def test_stream_index_keeps_the_chunks_from_the_kept_offset():
+    lines = StreamLineIndex()
+    text = 'a\nbb\nccc\ndddd\n'
+    lines.keep_from(1)
+    for offset in range(0, len(text), 2):
+        lines.add_chunk(text[offset:offset + 2], offset)
+    assert lines.first_offset == 0
+    assert lines.line_column(1) == (0, 1) and lines.line_column(12) == (3, 3)
+    lines.keep_from(9)
+    lines.add_chunk('e', len(text))
+    assert lines.first_offset == 8
+    assert lines.line_column(9) == expected_position(text, 9)
@@ -0,0 +1,54 @@
+import pytest
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.lazy_dfa import LazyLexer
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.memory import freeze_report, retained_size
+from iparser.lexical.transition_table import ArrayTransitionTable, CombTransitionTable
+from tests.grammars import token_grammar, mode_grammar, random_text, scan
+
+
+def test_retained_size_counts_shared_objects_once():
+    items = list(range(1000, 2000))
+    assert retained_size(items, items) == retained_size(items)
+    assert retained_size([items, items]) < retained_size(items) * 2
+    assert retained_size(len) == 0
+
+
+def test_release_keeps_the_tables():
+    mode_starts = []
+    nfa = FlatNFABuilder.from_definitions(mode_grammar(), mode_starts)
+    dfa_model = DFAModel(nfa, minimize=True, start_states=mode_starts[1:])
+    dfa_model.init()
+    state_num, start_state_indexes = dfa_model.state_num, dfa_model.start_state_indexes
+    table, accept_table, report = dfa_model.transition_table, dfa_model.accept_table, dfa_model.minimize_report
+    before = retained_size(dfa_model)
+    dfa_model.release()
+    assert retained_size(dfa_model) < before
+    assert dfa_model.state_num == state_num and dfa_model.start_state_indexes == start_state_indexes
+    assert dfa_model.transition_table is table and dfa_model.accept_table is accept_table
+    assert dfa_model.minimize_report == report
+
+
+def test_frozen_lexer_is_smaller_and_scans_the_same():
+    definitions = token_grammar()
+    nfa = FlatNFABuilder.from_definitions(definitions)
+    dfa_model = DFAModel(nfa, minimize=True)
+    dfa_model.init()
+    lexer = CompiledLexer.compile(definitions)
+    frozen, (before, after) = freeze_report(lexer, dfa_model, nfa)
+    assert after < before
+    assert after < retained_size(lexer)
+    assert isinstance(frozen.transition_table, ArrayTransitionTable)
+    text = random_text(12, 1000)
+    assert scan(frozen, text) == scan(lexer, text)
+    comb = lexer.freeze(CombTransitionTable)
+    assert isinstance(comb.transition_table, CombTransitionTable)
+    assert scan(comb, text) == scan(lexer, text)
+    # packed tables are shared by a second freeze
+    assert frozen.freeze().transition_table is frozen.transition_table
+
+
+def test_only_compiled_lexers_are_frozen():
+    with pytest.raises(TypeError):
+        freeze_report(LazyLexer.compile(token_grammar(skip=False)))
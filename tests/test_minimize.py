@@ -0,0 +1,66 @@
+import random
+import pytest
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.token import ReTokenDefinitions
+from tests.grammars import token_grammar, random_text, scan
+
+
+def build(patterns, minimize: bool) -> DFAModel:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    for index, pattern in enumerate(patterns):
+        definitions.define(f"T{index}", pattern)
+    dfa_model = DFAModel(FlatNFABuilder.from_definitions(definitions), minimize=minimize)
+    dfa_model.init()
+    return dfa_model
+
+
+def moore_state_num(dfa_model: DFAModel) -> int:
+    """
+        number of classes of the naive moore refinement of the partial dfa
+    """
+    table, accept = dfa_model.transition_table, dfa_model.accept_table
+    states = range(1, len(table))
+    blocks = {state: accept[state] for state in states}
+    while True:
+        # the dead state 0 is a block of its own
+        signatures = {state: (blocks[state],) + tuple(blocks[target] if target else None for target in table[state])
+                      for state in states}
+        numbering = {}
+        refined = {state: numbering.setdefault(signature, len(numbering)) for state, signature in signatures.items()}
+        if len(numbering) == len(set(blocks.values())):
+            return len(numbering)
+        blocks = refined
+
+
+def test_textbook_automaton():
+    dfa_model = build(['(a|b)*abb'], minimize=True)
+    assert dfa_model.minimize_report == (5, 4)
+    assert dfa_model.state_num == 4
+    assert build(['(a|b)*abb'], minimize=False).minimize_report is None
+
+
+def test_states_of_different_tokens_are_kept_apart():
+    # after a and after b nothing follows, only the token tells the states apart
+    assert build(['a', 'b'], minimize=True).state_num == 3
+    assert build(['a|b'], minimize=True).state_num == 2
+
+
+@pytest.mark.parametrize("seed", range(0, 8))
+def test_random_grammars_reach_the_moore_state_number(seed):
+    rand = random.Random(seed)
+    atoms = ['a', 'b', 'c', '[ab]', '(ab|ba)', 'a*', '(bc)+', 'c?']
+    patterns = [''.join(rand.choice(atoms) for _ in range(rand.randint(1, 5))) for _ in range(rand.randint(1, 4))]
+    unminimized = build(patterns, minimize=False)
+    minimized = build(patterns, minimize=True)
+    before, after = minimized.minimize_report
+    assert before == unminimized.state_num
+    assert after == minimized.state_num == moore_state_num(unminimized)
+
+
+def test_minimized_lexer_scans_the_same():
+    text = random_text(1, 3000)
+    assert scan(CompiledLexer.compile(token_grammar(), minimize=False), text) == \
+        scan(CompiledLexer.compile(token_grammar()), text)
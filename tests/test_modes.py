@@ -0,0 +1,51 @@
+import io
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.stream_reader import StreamReader
+from iparser.lexical.token import ReTokenDefinitions
+from tests.grammars import mode_grammar, random_mode_text, named_values
+
+
+def test_push_and_pop():
+    lexer = CompiledLexer.compile(mode_grammar())
+    assert named_values(lexer, 'ab "c\\"d" e') == \
+        [('ID', 'ab'), ('OPEN', '"'), ('CHARS', 'c'), ('ESCAPE', '\\"'), ('CHARS', 'd'), ('CLOSE', '"'), ('ID', 'e')]
+    # blanks are only skipped in the default mode, in a string they are chars
+    assert named_values(lexer, '" a "') == [('OPEN', '"'), ('CHARS', ' a '), ('CLOSE', '"')]
+    with pytest.raises(Exception, match="error token"):
+        named_values(lexer, 'a\\b')
+
+
+def test_string_and_reader_paths_agree():
+    lexer = CompiledLexer.compile(mode_grammar())
+    text = random_mode_text(4, 400)
+    expected = named_values(lexer, text)
+    assert ('CLOSE', '"') in expected and ('ESCAPE', '\\\\') in expected
+    for buffer_size in (1, 7, 4096):
+        reader = StreamReader(io.StringIO(text), buffer_size=buffer_size)
+        assert [(token.name, token.value) for token in Scanner(reader, lexer).token_stream()] == expected
+
+
+def test_mode_stack():
+    lexer = CompiledLexer.compile(mode_grammar())
+    scanner = Scanner(StringReader('abc'), lexer)
+    assert scanner.mode == 'default'
+    scanner.push_mode("string")
+    assert scanner.mode == 'string'
+    assert [(token.name, token.value) for token in scanner.token_stream()] == [('CHARS', 'abc')]
+    scanner.pop_mode()
+    with pytest.raises(Exception, match="last lexer mode"):
+        scanner.pop_mode()
+    tokens = Scanner(StringReader('"a"" '), lexer).token_stream()
+    assert [token.name for token in tokens] == ['OPEN', 'CHARS', 'CLOSE', 'OPEN', 'CHARS']
+
+
+def test_invalid_definitions():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    with pytest.raises(Exception, match="both push and pop"):
+        definitions.define("Q", r'"', push="string", pop=True)
+    definitions.define("ID", r'[a-z]+')
+    assert definitions.modes() == ['default']
+    assert CompiledLexer.compile(definitions).modes is None
@@ -0,0 +1,66 @@
+import os
+import pytest
+from iparser.lexical import parallel
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.parallel import ParallelScanner
+from iparser.lexical.utf8_lexer import Utf8DFALowering
+from tests.grammars import token_grammar, mode_grammar, random_text, named_values
+
+
+def buffer_values(lexer, tokens):
+    return [(lexer.token_name(kind), bytes(tokens.source[start:end]).decode('utf-8'))
+            for kind, start, end in zip(tokens.kinds, tokens.starts, tokens.ends)]
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return CompiledLexer.compile(token_grammar())
+
+
+@pytest.fixture()
+def input_file(tmp_path):
+    def write(text: str) -> str:
+        path = tmp_path / "input.txt"
+        path.write_bytes(text.encode('utf-8'))
+        return str(path)
+    return write
+
+
+@pytest.mark.parametrize("chunk_size", [1, 97, 4096, ParallelScanner.DEFAULT_CHUNK_SIZE])
+def test_same_tokens_as_a_sequential_scan(lexer, input_file, chunk_size):
+    text = random_text(1, 3000)
+    with ParallelScanner(lexer, processes=2, chunk_size=chunk_size) as scanner:
+        assert buffer_values(lexer, scanner.token_buffer(input_file(text))) == named_values(lexer, text)
+
+
+def test_lowered_lexer_and_empty_file(lexer, input_file):
+    with ParallelScanner(Utf8DFALowering.lower(lexer), processes=2, chunk_size=8) as scanner:
+        assert len(scanner.token_buffer(input_file(''))) == 0
+
+
+def test_error_is_raised(lexer, input_file):
+    with ParallelScanner(lexer, processes=2, chunk_size=16) as scanner:
+        with pytest.raises(Exception, match="error token"):
+            scanner.token_buffer(input_file(random_text(2, 200) + ' ~ ' + random_text(3, 200)))
+
+
+def test_lexer_file_is_written_once(lexer, input_file, monkeypatch):
+    dumped = []
+    dump = parallel.serialization.dump
+    monkeypatch.setattr(parallel.serialization, 'dump', lambda lexer, path: dumped.append(path) or dump(lexer, path))
+    path = input_file(random_text(4, 500))
+    scanner = ParallelScanner(lexer, processes=2, chunk_size=64)
+    scanner.token_buffer(path)
+    scanner.token_buffer(path)
+    assert len(dumped) == 1 and os.path.exists(dumped[0])
+    scanner.close()
+    assert not os.path.exists(os.path.dirname(dumped[0]))
+    scanner.token_buffer(path)
+    assert len(dumped) == 2
+    del scanner
+    assert not os.path.exists(os.path.dirname(dumped[1]))
+
+
+def test_modes_are_rejected():
+    with pytest.raises(ValueError, match="modes"):
+        ParallelScanner(CompiledLexer.compile(mode_grammar()))
@@ -0,0 +1,50 @@
+import re
+import pytest
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.regex_parser import RegexParser
+
+PATTERNS = [r'ab|cd', r'a*b+c?', r'(?:ab)+', r'(ab|c){2,3}', r'a{2}', r'a{1,}b', r'a{,2}', r'x{a}', r'[a-c_]+',
+            r'[^a-c\n]', r'[\d.]+', r'\w+\s\W', r'\D\S', r'.+', r'\x41é\U0001F600\x{3b1}', r'\t\n\\\.',
+            r'[]a]', r'[a-]', r'\[\]', r'(a|)b', r'a{0}b']
+TEXTS = ['', 'a', 'ab', 'cd', 'abab', 'abc', 'c', 'cab', 'ababab', 'aa', 'aaab', 'b', 'x{a}', 'a_c', 'd', '\n',
+         '1.5', 'ab \x01', '1_', 'aé😀α', 'Aé😀α', '\t\n\\.', ']', 'a]', '-', '[]', 'ccc', 'abcab', 'xyz']
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_matches_like_python_re(pattern):
+    nfa = FlatNFABuilder.from_expression(RegexParser().parse(pattern))
+    python_pattern = re.compile(pattern.replace(r'\x{3b1}', r'α').replace('{,', '{0,'), re.ASCII)
+    for text in TEXTS:
+        assert nfa.accepts(text) == (python_pattern.fullmatch(text) is not None), text
+
+
+def test_unicode_properties():
+    parser = RegexParser()
+    greek = FlatNFABuilder.from_expression(parser.parse(r'\p{Greek}+'))
+    assert greek.accepts('αβγ') and not greek.accepts('abc')
+    han = FlatNFABuilder.from_expression(parser.parse(r'\p{Script=Han}\p{L}\P{Lu}'))
+    assert han.accepts('中文x') and not han.accepts('中文X')
+    letter = FlatNFABuilder.from_expression(parser.parse(r'\pL'))
+    assert letter.accepts('é') and not letter.accepts('1')
+
+
+def test_hash_consing():
+    parser = RegexParser()
+    assert parser.parse('[a-z]+') is parser.parse('[a-z]+')
+    first = parser.parse('[a-z]x|y')
+    second = parser.parse('[a-z]x|z')
+    assert first.left is second.left
+    assert parser.parse('(?:ab)') is parser.parse('ab')
+    assert parser.parse('a|a') is parser.parse('a')
+
+
+@pytest.mark.parametrize("pattern, message", [
+    ('^a', "anchors"), ('a$', "anchors"), (r'(a)\1', "bad escape"), ('a*?', "lazy"), ('a+?', "lazy"),
+    ('(a', "missing \\)"), ('a)', "unbalanced"), ('(?=a)', "non capturing"), ('*a', "nothing to repeat"),
+    ('a**', "multiple repeat"), ('[z-a]', "bad range"), ('a{3,1}', "min repeat"), (r'\q', "bad escape"),
+    (r'\p{Nope}', "Nope"), ('[ab', "unexpected end"), (r'\xZ1', "bad escape"),
+])
+def test_rejected_patterns(pattern, message):
+    with pytest.raises(ValueError, match=message) as error:
+        RegexParser().parse(pattern)
+    assert "at position" in str(error.value) and repr(pattern) in str(error.value)
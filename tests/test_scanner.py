@@ -0,0 +1,58 @@
+import io
+import pytest
+from iparser.lexical.codegen import ScannerCodeGenerator
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.scanner import Scanner, StringReader
+from iparser.lexical.stream_reader import StreamReader
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.utf8_lexer import Utf8DFALowering, ByteScanner
+from tests.grammars import token_grammar, named_values
+
+
+def arrow_lexer() -> CompiledLexer:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("EQ", RE.literal('='))
+    definitions.define("ARROW", RE.literal('==>'))
+    definitions.define("ID", RE.range('a', 'z').at_least_once())
+    return CompiledLexer.compile(definitions)
+
+
+def reader_values(lexer, text: str):
+    return [(token.name, token.value) for token in Scanner(StreamReader(io.StringIO(text), buffer_size=2), lexer).token_stream()]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('==x', [('EQ', '='), ('EQ', '='), ('ID', 'x')]),
+    ('==', [('EQ', '='), ('EQ', '=')]),
+    ('==>x==', [('ARROW', '==>'), ('ID', 'x'), ('EQ', '='), ('EQ', '=')]),
+])
+def test_rewind_to_the_last_accepting_position(text, expected):
+    lexer = arrow_lexer()
+    assert named_values(lexer, text) == expected
+    assert reader_values(lexer, text) == expected
+    module = ScannerCodeGenerator.load(ScannerCodeGenerator.generate_from_lexer(lexer))
+    assert [(name, value) for _, name, value in module.tokenize(text)] == expected
+    lowered = Utf8DFALowering.lower(lexer)
+    assert [(lowered.token_name(kind), text[start:end]) for kind, start, end in ByteScanner(text.encode(), lowered).token_spans()] == expected
+
+
+def test_nothing_to_rewind_to_is_an_error():
+    lexer = arrow_lexer()
+    for scan in (named_values, reader_values):
+        with pytest.raises(Exception, match="error token: ~ at line 0, column 2"):
+            scan(lexer, 'ab~')
+
+
+def test_max_backtrack():
+    assert arrow_lexer().max_backtrack() == 1
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("A", RE.literal('a'))
+    definitions.define("AB", RE.literal('a').at_least_once() + RE.literal('b'))
+    assert CompiledLexer.compile(definitions).max_backtrack() is None
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", RE.range('a', 'z').at_least_once())
+    assert CompiledLexer.compile(definitions).max_backtrack() == 0
+    # 3.14 against 1. needs one char past NUM
+    assert CompiledLexer.compile(token_grammar()).max_backtrack() == 1
@@ -0,0 +1,75 @@
+import random
+import re
+import pytest
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.search import Searcher, reverse_nfa
+from iparser.lexical.token import ReTokenDefinitions
+from tests.grammars import mode_grammar
+
+
+def brute_force(patterns, text):
+    """
+        leftmost longest matches, the earlier pattern wins a tie
+    """
+    matches, position = [], 0
+    while position < len(text):
+        best = None
+        for index, pattern in enumerate(patterns):
+            match = pattern.match(text, position)
+            if match and match.end() > position and (best is None or match.end() > best[1]):
+                best = (index, match.end())
+        if best is None:
+            position += 1
+        else:
+            matches.append((best[0], position, best[1]))
+            position = best[1]
+    return matches
+
+
+def test_matches_brute_force():
+    rand = random.Random(5)
+    words = sorted({''.join(rand.choice('abcde') for _ in range(rand.randint(2, 6))) for _ in range(150)})
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    for word in words:
+        definitions.define(f"W_{word}", RE.literal(word))
+    definitions.define("NUM", RE.range('0', '9').at_least_once())
+    patterns = [re.compile(re.escape(word)) for word in words] + [re.compile('[0-9]+')]
+    text = ''.join(rand.choice('abcdefxyz 0123') for _ in range(20000))
+    assert list(Searcher.compile(definitions).spans(text)) == brute_force(patterns, text)
+
+
+def test_compiling_twice_leaves_the_definitions_alone():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("A", RE.literal('ab'))
+    definitions.define("NUM", RE.range('0', '9').at_least_once())
+    models = definitions.models
+    edges = [len(state.out_edges) for model in models for state in model.states]
+    for _ in range(0, 2):
+        searcher = Searcher.compile(definitions)
+        assert [(token.name, token.value) for token in searcher.find_all('xab12ab')] == \
+            [('A', 'ab'), ('NUM', '12'), ('A', 'ab')]
+    assert [len(state.out_edges) for model in definitions.models for state in model.states] == edges
+
+
+def test_reverse_nfa_accepts_the_reversed_strings():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("W", 'ab+c|d')
+    reversed_nfa = reverse_nfa(FlatNFABuilder.from_definitions(definitions), unanchored=False)
+    for text, accepted in (('cba', True), ('cbbba', True), ('d', True), ('abc', False), ('ca', False)):
+        assert reversed_nfa.accepts(text) == accepted
+    assert reverse_nfa(FlatNFABuilder.from_definitions(definitions)).accepts('xyzcba')
+
+
+def test_skipped_matches_are_hidden():
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("WORD", r'[a-z]+')
+    definitions.define("COMMENT", r'#[a-z ]*', skip=True)
+    tokens = [(token.name, token.value) for token in Searcher.compile(definitions).find_all('ab, #cd ef\n gh')]
+    assert tokens == [('WORD', 'ab'), ('WORD', 'gh')]
+
+
+def test_modes_are_rejected():
+    with pytest.raises(ValueError, match="modes"):
+        Searcher.compile(mode_grammar())
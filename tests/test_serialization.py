@@ -0,0 +1,141 @@
+import os
+import struct
+import pytest
+from iparser.lexical.charset import ASCIICharSetManager
+from iparser.lexical.dfa_model import DFAModel
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical.lexer import CompiledLexer, LexerKeywords
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.regular_expression import RE
+from iparser.lexical.serialization import dumps, loads, dump, load, LexerCache
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.utf8_lexer import Utf8DFALowering, ByteScanner
+from tests.grammars import token_grammar, mode_grammar, random_text, random_mode_text, scan
+
+
+def only(char):
+    def predictor(c):
+        return c == char
+    return predictor
+
+
+class Opaque:
+    def __call__(self, c):
+        return c == 'a'
+
+
+def predicate_grammar(predictor, key=None) -> ReTokenDefinitions:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("P", RE.cal_by(predictor, key).at_least_once())
+    definitions.define("OTHER", r'[a-z]')
+    return definitions
+
+
+def code_point_lexer() -> CompiledLexer:
+    """
+        a char level lexer whose symbols are the code points, without a charset manager
+    """
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    definitions.define("ID", r'[a-z]+', keywords={"IF": "if"})
+    definitions.define("BLANK", r' +')
+    dfa_model = DFAModel(FlatNFABuilder.from_definitions(definitions), ASCIICharSetManager())
+    dfa_model.init()
+    return CompiledLexer(dfa_model.transition_table, dfa_model.accept_table, ["ID", "IF", "BLANK"], None, None,
+                         LexerKeywords.from_definitions(definitions))
+
+
+def version_3(buffer: bytes) -> bytes:
+    """
+        the same lexer in the header layout before version 4, which had no flags
+    """
+    return buffer[:4] + struct.pack('<I', 3) + buffer[8:24] + buffer[28:]
+
+
+@pytest.mark.parametrize("grammar, text", [(token_grammar, random_text(3, 2000)),
+                                           (mode_grammar, random_mode_text(4, 300))])
+def test_round_trip(grammar, text, tmp_path):
+    lexer = CompiledLexer.compile(grammar())
+    assert scan(loads(dumps(lexer)), text) == scan(lexer, text)
+    path = str(tmp_path / "lexer.ilxr")
+    dump(lexer, path)
+    for use_mmap in (True, False):
+        assert scan(load(path, use_mmap), text) == scan(lexer, text)
+
+
+def test_byte_round_trip(tmp_path):
+    lowered = Utf8DFALowering.lower(CompiledLexer.compile(token_grammar()))
+    path = str(tmp_path / "bytes.ilxr")
+    dump(lowered, path)
+    loaded = load(path)
+    assert loaded.byte_level
+    data = random_text(5, 2000).encode('utf-8')
+    assert list(ByteScanner(data, loaded).token_spans()) == list(ByteScanner(data, lowered).token_spans())
+    assert loads(version_3(dumps(lowered))).byte_level
+
+
+def test_code_point_lexer_keeps_its_keywords():
+    lexer = code_point_lexer()
+    expected = [('IF', 0, 2), ('BLANK', 2, 3), ('ID', 3, 6)]
+    assert scan(lexer, 'if ifx') == expected
+    loaded = loads(dumps(lexer))
+    assert not loaded.byte_level and loaded.charset_manager is None
+    assert scan(loaded, 'if ifx') == expected
+
+
+def test_older_char_level_file():
+    lexer = CompiledLexer.compile(token_grammar())
+    loaded = loads(version_3(dumps(lexer)))
+    assert not loaded.byte_level
+    text = random_text(6, 500)
+    assert scan(loaded, text) == scan(lexer, text)
+
+
+def test_truncated_buffer_is_rejected():
+    buffer = dumps(CompiledLexer.compile(token_grammar()))
+    with pytest.raises(Exception):
+        loads(buffer[:len(buffer) // 2])
+    with pytest.raises(ValueError, match="not a compiled lexer"):
+        loads(b'ELF!' + buffer[4:])
+
+
+def test_cache_hit_and_miss(tmp_path):
+    cache = LexerCache(str(tmp_path))
+    text = random_text(6, 500)
+    lexer = cache.get(token_grammar())
+    assert len(os.listdir(tmp_path)) == 1
+    path = cache.path_of(token_grammar())
+    assert os.path.exists(path)
+    modified = os.path.getmtime(path)
+    assert scan(cache.get(token_grammar()), text) == scan(lexer, text)
+    assert os.path.getmtime(path) == modified and len(os.listdir(tmp_path)) == 1
+    cache.get(token_grammar(), minimize=False)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_cache_invalidation(tmp_path):
+    cache = LexerCache(str(tmp_path))
+    changed = token_grammar()
+    changed.define("EXTRA", r'@')
+    assert cache.path_of(changed) != cache.path_of(token_grammar())
+    assert cache.path_of(token_grammar(skip=False)) != cache.path_of(token_grammar())
+    assert cache.path_of(mode_grammar()) != cache.path_of(token_grammar())
+
+
+def test_predicate_closures_do_not_collide(tmp_path):
+    cache = LexerCache(str(tmp_path))
+    assert cache.path_of(predicate_grammar(only('a'))) != cache.path_of(predicate_grammar(only('b')))
+    assert cache.path_of(predicate_grammar(only('a'))) == cache.path_of(predicate_grammar(only('a')))
+    assert scan(cache.get(predicate_grammar(only('a'))), 'aab') == [('P', 0, 2), ('OTHER', 2, 3)]
+    assert scan(cache.get(predicate_grammar(only('b'))), 'aab') == [('OTHER', 0, 1), ('OTHER', 1, 2), ('P', 2, 3)]
+
+
+def test_uncacheable_predicate(tmp_path):
+    cache = LexerCache(str(tmp_path))
+    with pytest.raises(ValueError, match="key"):
+        cache.path_of(predicate_grammar(Opaque()))
+    assert scan(cache.get(predicate_grammar(Opaque())), 'ab') == [('P', 0, 1), ('OTHER', 1, 2)]
+    assert os.listdir(tmp_path) == []
+    cache.get(predicate_grammar(Opaque(), key="only a"))
+    assert len(os.listdir(tmp_path)) == 1
+    assert cache.path_of(predicate_grammar(Opaque(), key="only a")) != \
+        cache.path_of(predicate_grammar(Opaque(), key="only b"))
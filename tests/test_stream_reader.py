@@ -0,0 +1,55 @@
+import io
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.scanner import Scanner
+from iparser.lexical.stream_reader import StreamReader, FileReader, MmapReader
+from tests.grammars import token_grammar, random_text, named_values
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return CompiledLexer.compile(token_grammar())
+
+
+@pytest.fixture(scope="module")
+def text():
+    return random_text(1, 3000)
+
+
+def read(lexer, reader):
+    with reader:
+        return [(token.name, token.value) for token in Scanner(reader, lexer).token_stream()]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 4096])
+def test_text_stream(lexer, text, buffer_size):
+    assert read(lexer, StreamReader(io.StringIO(text), buffer_size=buffer_size)) == named_values(lexer, text)
+
+
+@pytest.mark.parametrize("buffer_size", [1, 5, 4096])
+def test_binary_stream_splitting_chars(lexer, text, buffer_size):
+    # small buffers cut the two byte greek letters in half
+    stream = io.BytesIO(text.encode('utf-8'))
+    assert read(lexer, StreamReader(stream, buffer_size=buffer_size)) == named_values(lexer, text)
+
+
+@pytest.mark.parametrize("chunk_size", [3, 64, MmapReader.DEFAULT_CHUNK_SIZE])
+def test_files(lexer, text, tmp_path, chunk_size):
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode('utf-8'))
+    expected = named_values(lexer, text)
+    assert read(lexer, FileReader(str(path), buffer_size=chunk_size)) == expected
+    assert read(lexer, MmapReader(str(path), chunk_size=chunk_size)) == expected
+
+
+def test_empty_file(lexer, tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b'')
+    assert read(lexer, MmapReader(str(path))) == []
+    assert read(lexer, FileReader(str(path))) == []
+
+
+def test_offsets_count_chars(lexer, text):
+    reader = StreamReader(io.BytesIO(text.encode('utf-8')), buffer_size=9)
+    for token in Scanner(reader, lexer).token_stream():
+        assert text[token.start:token.end] == token.value
@@ -0,0 +1,69 @@
+import random
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.transition_table import TABLE_FORMATS, DenseTransitionTable, CombTransitionTable, memory_report
+from tests.grammars import token_grammar, random_text, scan
+
+FORMATS = ['dense', 'array', 'comb', 'numpy']
+
+
+def table_class(name: str):
+    if name not in TABLE_FORMATS:
+        pytest.skip("numpy is not installed")
+    return TABLE_FORMATS[name]
+
+
+def random_rows(seed: int, state_num: int, symbol_num: int):
+    """
+        sparse rows with mostly dead entries and a few states sharing symbol patterns
+    """
+    rand = random.Random(seed)
+    rows = [[0] * symbol_num]
+    for _ in range(1, state_num):
+        row = [0] * symbol_num
+        for symbol in rand.sample(range(0, symbol_num), rand.randint(0, min(6, symbol_num))):
+            row[symbol] = rand.randrange(0, state_num)
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return CompiledLexer.compile(token_grammar())
+
+
+@pytest.mark.parametrize("name", FORMATS)
+@pytest.mark.parametrize("seed", range(0, 4))
+def test_random_rows(name, seed):
+    rows = random_rows(seed, 300, 40)
+    table = table_class(name)(rows)
+    assert table.state_num == 300 and table.symbol_num == 40
+    assert table.rows() == rows
+    assert all(table.next_state(state, symbol) == rows[state][symbol] for state in range(0, 300) for symbol in range(0, 40))
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_out_of_alphabet_symbols_are_dead(name):
+    table = table_class(name)(random_rows(1, 20, 8))
+    assert table.next_state(3, 8) == 0 and table.next_state(3, 100) == 0
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_lexer_encodings_scan_the_same(lexer, name):
+    text = random_text(1, 3000)
+    assert scan(lexer.with_table_class(table_class(name)), text) == scan(lexer, text)
+
+
+def test_comb_packs_sparse_rows(lexer):
+    rows = random_rows(2, 5000, 200)
+    report = memory_report(rows)
+    assert report['comb'] < report['array'] / 4
+    report = lexer.memory_report()
+    assert set(report) == set(TABLE_FORMATS)
+
+
+def test_memory_report_measures_the_given_table():
+    comb = CombTransitionTable(random_rows(3, 500, 30))
+    # the given table is measured as it is, only the other encodings are built
+    assert memory_report(comb)['comb'] == comb.memory_usage()
+    assert memory_report(comb)['dense'] == DenseTransitionTable(comb.rows()).memory_usage()
@@ -0,0 +1,95 @@
+import gc
+import unicodedata
+import pytest
+from iparser.lexical import unicode_properties, unicode_tables
+from iparser.lexical.charset import CharSet, MAX_CHAR
+from iparser.lexical.flat_nfa import FlatNFABuilder
+from iparser.lexical import regular_expression
+from iparser.lexical.regular_expression import RE
+
+same_version = pytest.mark.skipif(unicodedata.unidata_version != unicode_tables.UNICODE_VERSION,
+                                  reason="the tables are of another unicode version than unicodedata")
+
+
+def categories_of_unicodedata():
+    return [unicodedata.category(chr(char)) for char in range(0, MAX_CHAR + 1)]
+
+
+@same_version
+def test_category_of_matches_unicodedata():
+    expected = categories_of_unicodedata()
+    starts = unicode_tables.CATEGORY_STARTS
+    ends = list(starts[1:]) + [MAX_CHAR + 1]
+    for start, end, index in zip(starts, ends, unicode_tables.CATEGORY_INDEXES):
+        name = unicode_tables.CATEGORY_NAMES[index]
+        assert expected[start:end] == [name] * (end - start), hex(start)
+    assert [unicode_properties.category_of(char) for char in range(0, 0x3000)] == expected[:0x3000]
+
+
+@same_version
+def test_re_category_matches_unicodedata():
+    chars = {}
+    for char, category in enumerate(categories_of_unicodedata()):
+        chars.setdefault(category, []).append(char)
+    for name, category_chars in chars.items():
+        assert RE.category(name).get_char_set() == CharSet.of_chars(category_chars), name
+    letters = CharSet.of_chars(char for name in ('Lu', 'Ll', 'Lt', 'Lm', 'Lo') for char in chars.get(name, ()))
+    assert RE.category('L').get_char_set() == RE.category('Letter').get_char_set() == letters
+
+
+def test_categories_partition_the_code_space():
+    total = CharSet()
+    for name in unicode_tables.CATEGORY_NAMES:
+        char_set = unicode_properties.general_category(name)
+        assert not (total & char_set)
+        total = total | char_set
+    assert total == CharSet.of_range(0, MAX_CHAR)
+
+
+def test_scripts():
+    greek = unicode_properties.script('Greek')
+    assert ord('α') in greek and ord('a') not in greek
+    assert unicode_properties.unicode_property('Script=Han') == unicode_properties.script('han')
+    assert ord('中') in RE.script('Han').get_char_set()
+    assert unicode_properties.unicode_property('gc=Lu') == unicode_properties.general_category('Uppercase_Letter')
+    with pytest.raises(ValueError, match="Klingon"):
+        unicode_properties.unicode_property('Klingon')
+
+
+def test_read_scripts_of_the_ucd_file(tmp_path):
+    # Scripts.txt written back from the shipped table reads into the same runs
+    starts = unicode_tables.SCRIPT_STARTS
+    ends = list(starts[1:]) + [MAX_CHAR + 1]
+    lines = ["# Scripts-14.0.0.txt", ""]
+    for start, end, index in zip(starts, ends, unicode_tables.SCRIPT_INDEXES):
+        name = unicode_tables.SCRIPT_NAMES[index]
+        if name == 'Unknown':
+            continue
+        chars = f"{start:04X}" if end - start == 1 else f"{start:04X}..{end - 1:04X}"
+        lines.append(f"{chars:<14}; {name} # comment")
+    path = tmp_path / "Scripts.txt"
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    names, read_starts, indexes = unicode_properties._runs(unicode_properties._read_scripts(str(path)))
+    assert read_starts == list(starts)
+    assert [names[index] for index in indexes] == [unicode_tables.SCRIPT_NAMES[index] for index in unicode_tables.SCRIPT_INDEXES]
+
+
+def test_predicates_are_swept_once_and_not_kept():
+    calls = []
+
+    def is_vowel(char):
+        calls.append(char)
+        return char in 'aeiou'
+
+    first, second = RE.cal_by(is_vowel, max_char=0x7F), RE.cal_by(is_vowel, max_char=0x7F)
+    for expression in (first, second):
+        nfa = FlatNFABuilder.from_expression(expression)
+        assert nfa.accepts('a') and not nfa.accepts('b')
+    assert len(calls) == 0x80
+    assert first.get_fingerprint() != RE.cal_by(is_vowel).get_fingerprint()
+    assert is_vowel in regular_expression._predicate_char_sets
+    del is_vowel, first, second, expression
+    gc.collect()
+    assert not [key for key in regular_expression._predicate_char_sets if key.__name__ == 'is_vowel']
+    # a predicate that can not be weakly referenced is swept without the cache
+    assert FlatNFABuilder.from_expression(RE.cal_by(str.isalpha, max_char=0xFF)).accepts('x')
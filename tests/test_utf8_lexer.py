@@ -0,0 +1,103 @@
+import mmap
+import random
+import pytest
+from iparser.lexical.lexer import CompiledLexer
+from iparser.lexical.nfa_model_converter import NFAModelConverter
+from iparser.lexical.token import ReTokenDefinitions
+from iparser.lexical.transition_table import DenseTransitionTable, ArrayTransitionTable, CombTransitionTable
+from iparser.lexical.utf8_lexer import Utf8DFALowering, ByteScanner
+from tests.grammars import token_grammar, mode_grammar, random_text, random_mode_text, named_values
+
+# ranges ending and starting next to the utf-8 length boundaries
+BOUNDARY_RANGES = [(0x41, 0x7F), (0x80, 0x7FF), (0x800, 0xD7FF), (0xE000, 0xFFFF), (0x10000, 0x3FFFF),
+                   (0x40000, 0x10FFFF), (0x3B1, 0x3C9), (0xFF00, 0x10010)]
+
+
+def byte_values(lexer, data):
+    return [(lexer.token_name(token_index), bytes(data[start:end]).decode('utf-8'))
+            for token_index, start, end in ByteScanner(data, lexer).token_spans()]
+
+
+def boundary_grammar() -> ReTokenDefinitions:
+    definitions = ReTokenDefinitions(NFAModelConverter())
+    for index, (start, end) in enumerate(BOUNDARY_RANGES):
+        definitions.define(f"R{index}", f"[\\x{{{start:x}}}-\\x{{{end:x}}}]")
+    return definitions
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    return CompiledLexer.compile(token_grammar())
+
+
+def test_same_tokens_as_the_char_lexer(lexer):
+    text = random_text(1, 3000)
+    lowered = Utf8DFALowering.lower(lexer)
+    assert lowered.byte_level and lowered.charset_manager is None
+    data = text.encode('utf-8')
+    assert byte_values(lowered, data) == named_values(lexer, text)
+    assert byte_values(lowered, memoryview(data)) == named_values(lexer, text)
+    assert byte_values(lowered, bytearray(data)) == named_values(lexer, text)
+
+
+@pytest.mark.parametrize("table_class", [DenseTransitionTable, ArrayTransitionTable, CombTransitionTable])
+def test_table_classes(lexer, table_class):
+    text = random_text(2, 500)
+    assert byte_values(Utf8DFALowering.lower(lexer, table_class), text.encode('utf-8')) == named_values(lexer, text)
+
+
+def test_code_points_next_to_length_boundaries():
+    lexer = CompiledLexer.compile(boundary_grammar())
+    lowered = Utf8DFALowering.lower(lexer)
+    rand = random.Random(4)
+    chars = set()
+    for start, end in BOUNDARY_RANGES:
+        chars.update({start - 1, start, start + 1, end - 1, end, end + 1})
+    chars.update(rand.randrange(0, 0x110000) for _ in range(2000))
+    chars = [chr(char) for char in sorted(chars) if 0 < char <= 0x10FFFF and not 0xD800 <= char <= 0xDFFF]
+    for char in chars:
+        try:
+            expected = named_values(lexer, char)
+        except Exception:
+            with pytest.raises(Exception, match="error token"):
+                byte_values(lowered, char.encode('utf-8'))
+        else:
+            assert byte_values(lowered, char.encode('utf-8')) == expected
+
+
+def test_invalid_utf8_is_an_error(lexer):
+    lowered = Utf8DFALowering.lower(CompiledLexer.compile(boundary_grammar()))
+    for data in (b'\xc0\x80', b'\xed\xa0\x80', b'\xf4\x90\x80\x80', b'\xe0\x80', b'\x80'):
+        with pytest.raises(Exception, match="error token"):
+            list(ByteScanner(data, lowered).token_spans())
+
+
+def test_ranges_and_skipped_tokens(lexer):
+    lowered = Utf8DFALowering.lower(lexer)
+    data = 'if  x == 1'.encode('utf-8')
+    scanner = ByteScanner(data, lowered)
+    assert [lowered.token_name(kind) for kind, _, _ in scanner.token_spans()] == ['IF', 'ID', 'OP', 'NUM']
+    assert [lowered.token_name(kind) for kind, _, _ in scanner.token_spans(keep_skipped=True)] == \
+        ['IF', 'BLANK', 'ID', 'BLANK', 'OP', 'BLANK', 'NUM']
+    assert list(scanner.token_spans(4, 6)) == [(lowered.token_names.index('ID'), 4, 5)]
+
+
+def test_modes_and_keywords():
+    lexer = CompiledLexer.compile(mode_grammar())
+    text = random_mode_text(2, 500)
+    assert byte_values(Utf8DFALowering.lower(lexer), text.encode('utf-8')) == named_values(lexer, text)
+    lexer = CompiledLexer.compile(token_grammar())
+    assert byte_values(Utf8DFALowering.lower(lexer), b'while whilex') == [('WHILE', 'while'), ('ID', 'whilex')]
+
+
+def test_mapped_file(lexer, tmp_path):
+    text = random_text(3, 2000)
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode('utf-8'))
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert byte_values(Utf8DFALowering.lower(lexer), buffer) == named_values(lexer, text)
+
+
+def test_char_level_lexer_is_rejected(lexer):
+    with pytest.raises(ValueError, match="byte level"):
+        ByteScanner(b'', lexer)